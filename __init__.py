@@ -1 +1,4 @@
 """Data Thought Engine (DTE) - deterministic reasoning system for tabular data."""
+
+# Part of every result-cache key: bump whenever rules or thresholds change results
+__version__ = "1.1.0"
@@ -0,0 +1,3 @@
+"""
+Benchmark suite: deterministic synthetic datasets and per-stage regression checks.
+"""
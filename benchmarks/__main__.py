@@ -0,0 +1,70 @@
+"""
+Single command for the benchmark suite: `python -m data_thought_engine.benchmarks`.
+Exits nonzero when a timing regresses past the baseline threshold.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+
+from data_thought_engine.benchmarks.dag import DEFAULT_NODES, bench_dag
+from data_thought_engine.benchmarks.generator import DEFAULT_SEED, SHAPES
+from data_thought_engine.benchmarks.memory import DEFAULT_COLUMNS, bench_memory
+from data_thought_engine.benchmarks.suite import BASELINE_PATH, DEFAULT_SCALE, DEFAULT_THRESHOLD, compare, load_baseline, run_suite, save_baseline
+from data_thought_engine.utils.logger import get_logger
+
+
+def bench_run(argv: list[str] | None = None) -> int:
+    """Parse arguments, run the suite and return the process exit status."""
+    parser = argparse.ArgumentParser(description='Data Thought Engine (DTE) benchmarks')
+    parser.add_argument('--shapes', default=','.join(SHAPES), help='Comma-separated shapes to run')
+    parser.add_argument('--scale', type=float, help='Fraction of each shape\'s full row count (default: the baseline\'s, else 0.01)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per shape; the best time per stage is kept')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Generator seed')
+    parser.add_argument('--data-dir', help='Where generated datasets are kept and reused (default: a temp directory)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, help='Allowed slowdown ratio over the baseline (default: the baseline\'s, else 0.5)')
+    parser.add_argument('--update-baseline', action='store_true', help='Write the results as the new baseline instead of comparing')
+    parser.add_argument('--output', help='Also write the results to this JSON file')
+    parser.add_argument('--memory', nargs='?', type=int, const=DEFAULT_COLUMNS, metavar='COLUMNS', help=f'Only measure reasoning-object memory on this many columns (default: {DEFAULT_COLUMNS})')
+    parser.add_argument('--dag', nargs='?', type=int, const=DEFAULT_NODES, metavar='NODES', help=f'Only time reasoning-graph construction with this many nodes (default: {DEFAULT_NODES})')
+    args = parser.parse_args(argv)
+
+    logger = get_logger('dte.bench')
+    if args.memory is not None or args.dag is not None:
+        if args.memory is not None:
+            report = bench_memory(args.memory, seed=args.seed)
+            logger.info('DTE memory benchmark', report)
+        else:
+            report = bench_dag(args.dag, seed=args.seed)
+            logger.info('DTE graph benchmark', report)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as fh:
+                json.dump(report, fh, indent=2, sort_keys=True)
+        return 0
+    baseline = load_baseline(args.baseline)
+    scale = args.scale if args.scale is not None else (baseline or {}).get('scale', DEFAULT_SCALE)
+    threshold = args.threshold if args.threshold is not None else (baseline or {}).get('threshold', DEFAULT_THRESHOLD)
+    shapes = [name for name in args.shapes.split(',') if name]
+    report = run_suite(shapes, scale, args.data_dir, args.repeat, args.seed)
+    for shape, timings in report['results'].items():
+        logger.info('DTE benchmark', {'shape': shape, **timings})
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+    if args.update_baseline:
+        save_baseline(args.baseline, report, threshold)
+        logger.info('DTE benchmark baseline updated', {'path': args.baseline})
+        return 0
+    if baseline is None:
+        logger.warn('DTE benchmark has no baseline to compare against', {'path': args.baseline})
+        return 0
+    regressions = compare(report, baseline, threshold)
+    for regression in regressions:
+        logger.error('DTE benchmark regression', regression)
+    logger.info('DTE benchmark complete', {'shapes': len(shapes), 'regressions': len(regressions), 'threshold': threshold})
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(bench_run())
@@ -0,0 +1,64 @@
+"""
+Build times for the reasoning DAG: edge by edge, in bulk, and topological ordering.
+Graphs are seeded: a deep in-order chain, and random edges arriving out of order.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+import random
+import time
+
+from data_thought_engine.benchmarks.generator import DEFAULT_SEED
+from data_thought_engine.reasoning.graph import ReasoningDAG
+from data_thought_engine.reasoning.node import Node, make_node
+
+DEFAULT_NODES = 100_000
+DEFAULT_FANOUT = 3
+
+
+def random_dag(nodes: int, fanout: int = DEFAULT_FANOUT, seed: int = DEFAULT_SEED) -> Tuple[List[Node], List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """Return nodes, a chain through all of them, and `fanout` random edges per node.
+
+    The chain arrives in order and is as deep as the graph. The random
+    edges follow a hidden ranking and arrive shuffled, so insertion order
+    rarely agrees with it and nodes must be reordered.
+    """
+    rng = random.Random(f"dag:{seed}")
+    made = [make_node(f"h{i}", "expectation_score_test", "supported", 1.0) for i in range(nodes)]
+    chain = [(a.id, b.id) for a, b in zip(made, made[1:])]
+    ranked = [n.id for n in made]
+    rng.shuffle(ranked)
+    edges = []
+    for _ in range(nodes * fanout):
+        a, b = sorted(rng.sample(range(nodes), 2))
+        edges.append((ranked[a], ranked[b]))
+    return made, chain, edges
+
+
+def _graph(nodes: List[Node]) -> ReasoningDAG:
+    dag = ReasoningDAG()
+    for node in nodes:
+        dag.add_node(node)
+    return dag
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return round(time.perf_counter() - start, 6)
+
+
+def bench_dag(nodes: int = DEFAULT_NODES, fanout: int = DEFAULT_FANOUT, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Return wall seconds to build a deep chain and a shuffled random graph.
+
+    Each graph is built edge by edge and again in bulk, then ordered.
+    """
+    made, chain, edges = random_dag(nodes, fanout, seed)
+    report: Dict[str, Any] = {"nodes": nodes, "random_edges": len(edges)}
+    for name, batch in (("chain", chain), ("random", edges)):
+        incremental = _graph(made)
+        report[f"{name}_add_edge_seconds"] = _timed(lambda: [incremental.add_edge(src, dst) for src, dst in batch])
+        bulk = _graph(made)
+        report[f"{name}_add_edges_seconds"] = _timed(lambda: bulk.add_edges(batch))
+        report[f"{name}_topological_order_seconds"] = _timed(bulk.topological_order)
+    return report
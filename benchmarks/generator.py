@@ -0,0 +1,137 @@
+"""
+Deterministic synthetic datasets and run histories for the benchmarks.
+The same shape, row count and seed always produce byte-identical files.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+import csv
+import os
+import random
+
+from data_thought_engine.memory.store import JsonRunStore
+
+DEFAULT_SEED = 1729
+_CATEGORIES = tuple(f"cat_{i:02d}" for i in range(24))
+_WORDS = ("alpha", "beta", "gamma", "delta", "north", "south", "red", "blue", "fast", "slow", "open", "closed")
+
+
+@dataclass(frozen=True)
+class Shape:
+    """A benchmark dataset layout.
+
+    `columns` lists one value kind per column (see `_VALUE_MAKERS`).
+    `rows` is the full-scale row count; benchmarks multiply it by their
+    scale. `history_runs` prior runs are generated alongside the dataset.
+    """
+    name: str
+    rows: int
+    columns: Tuple[str, ...]
+    history_runs: int = 0
+
+
+SHAPES: Dict[str, Shape] = {shape.name: shape for shape in (
+    Shape("tall", 10_000_000, ("int", "float", "category", "float", "category", "int")),
+    Shape("wide", 2_000, tuple(("float", "category", "int", "text")[i % 4] for i in range(5_000))),
+    Shape("high_cardinality", 1_000_000, ("id", "id", "float", "id")),
+    Shape("numeric_heavy", 1_000_000, ("float",) * 16 + ("int",) * 4),
+    Shape("string_heavy", 1_000_000, ("text",) * 6 + ("category",) * 4),
+    Shape("large_history", 10_000, ("int", "float", "category", "float"), history_runs=10_000),
+)}
+
+
+def _float(rng: random.Random, row: int) -> str:
+    if rng.random() < 0.001:
+        return f"{rng.uniform(1e4, 1e5):.3f}"  # occasional spike
+    return f"{rng.gauss(100.0, 15.0):.3f}"
+
+
+def _int(rng: random.Random, row: int) -> str:
+    return str(rng.randint(0, 1000))
+
+
+def _category(rng: random.Random, row: int) -> str:
+    # Skewed toward the first categories, with some missing values
+    if rng.random() < 0.01:
+        return ""
+    return _CATEGORIES[min(int(rng.expovariate(0.25)), len(_CATEGORIES) - 1)]
+
+
+def _id(rng: random.Random, row: int) -> str:
+    return f"id-{row:09d}-{rng.getrandbits(24):06x}"
+
+
+def _text(rng: random.Random, row: int) -> str:
+    # Commas and quotes make the writer quote some fields
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(1, 4))]
+    if rng.random() < 0.05:
+        return ", ".join(words) + ' "quoted"'
+    return " ".join(words)
+
+
+_VALUE_MAKERS: Dict[str, Callable[[random.Random, int], str]] = {
+    "float": _float,
+    "int": _int,
+    "category": _category,
+    "id": _id,
+    "text": _text,
+}
+
+
+def header_for(shape: Shape) -> List[str]:
+    return [f"{kind}_{i}" for i, kind in enumerate(shape.columns)]
+
+
+def generate_csv(path: str, shape: Shape, rows: int, seed: int = DEFAULT_SEED) -> str:
+    """Write `rows` rows of `shape` to `path` and return the path.
+
+    An existing file is reused: its name should encode shape, rows and
+    seed (see `dataset_path`), so equal names mean equal contents.
+    """
+    if os.path.exists(path):
+        return path
+    makers = [_VALUE_MAKERS[kind] for kind in shape.columns]
+    rng = random.Random(f"{shape.name}:{seed}")
+    tmp = f"{path}.partial"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(tmp, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header_for(shape))
+        for row in range(rows):
+            writer.writerow([make(rng, row) for make in makers])
+    os.replace(tmp, path)
+    return path
+
+
+def dataset_path(data_dir: str, shape: Shape, rows: int, seed: int = DEFAULT_SEED) -> str:
+    return os.path.join(data_dir, f"{shape.name}-{rows}-{seed}.csv")
+
+
+def generate_history(storage_dir: str, runs: int, seed: int = DEFAULT_SEED) -> None:
+    """Persist `runs` prior JSON runs into `storage_dir`, oldest first.
+
+    Runs cycle through a few datasets and hypothesis outcomes so history
+    lookups see realistic variety. Existing runs are kept.
+    """
+    rng = random.Random(f"history:{seed}")
+    store = JsonRunStore(storage_dir)
+    start = datetime(2020, 1, 1)
+    for i in range(runs):
+        when = start + timedelta(minutes=i)
+        run_id = f"run_{when.isoformat().replace(':', '-')}"
+        if os.path.exists(os.path.join(storage_dir, store.catalog_key(run_id))):
+            continue
+        nodes = []
+        for h in range(rng.randint(2, 8)):
+            score = round(rng.uniform(0.0, 2.0), 3)
+            result = "supported" if score >= 1.0 else ("weak_support" if score > 0 else "unsupported")
+            nodes.append({"id": f"n{h}", "hypothesis_id": f"h{rng.randint(0, 40)}", "test": "expectation_score_test", "result": result, "score": score, "details": {}})
+        store.persist(run_id, {
+            "start_time": when.isoformat(),
+            "dataset_path": f"/data/history_{i % 7}.csv",
+            "dataset_hash": f"{rng.getrandbits(64):016x}",
+            "results": {"summary": {}, "nodes": nodes},
+            "narrative": "",
+        })
@@ -0,0 +1,97 @@
+"""
+Memory footprint of signals, hypotheses and nodes on very wide datasets.
+Columns are built in memory from the generator's value makers, so no CSV is written.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from data_thought_engine.benchmarks.generator import DEFAULT_SEED, SHAPES, _VALUE_MAKERS
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.core.context import Context
+from data_thought_engine.explanation.narrative import build_narrative
+from data_thought_engine.hypothesis.generator import generate_hypotheses
+from data_thought_engine.ingestion.columns import build_chunk
+from data_thought_engine.memory.result_cache import ResultCache
+from data_thought_engine.memory.store import persist_run
+from data_thought_engine.observation.accumulators import ColumnAccumulator
+from data_thought_engine.observation.detectors import signals_from_accumulators
+from data_thought_engine.reasoning.evaluator import evaluate_hypotheses
+
+DEFAULT_COLUMNS = 10_000
+DEFAULT_ROWS = 200
+
+
+def bench_memory(columns: int = DEFAULT_COLUMNS, rows: int = DEFAULT_ROWS, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Return the traced bytes retained by each reasoning stage's objects.
+
+    Column kinds cycle like the `wide` shape. Accumulators are built before
+    tracing starts, so the figures cover only signals, hypotheses and
+    evaluation results. Also reports the result-cache entry size, the bytes
+    retained when a fresh process reloads that entry, and the wall time to
+    persist the run as JSON.
+    """
+    kinds = SHAPES["wide"].columns
+    rng = random.Random(f"memory:{seed}")
+    config = EngineConfig()
+    accumulators = {}
+    for i in range(columns):
+        kind = kinds[i % len(kinds)]
+        make = _VALUE_MAKERS[kind]
+        name = f"{kind}_{i}"
+        accumulators[name] = ColumnAccumulator.from_chunk(build_chunk(name, "categorical", [make(rng, row) for row in range(rows)]), config)
+    context = Context(dataset_path="memory-benchmark.csv", num_rows_sampled=0, schema={}, config=config)
+
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        signals = signals_from_accumulators(accumulators)
+        after_signals = tracemalloc.get_traced_memory()[0]
+        hypotheses = generate_hypotheses(signals, context)
+        after_hypotheses = tracemalloc.get_traced_memory()[0]
+        results = evaluate_hypotheses(hypotheses, context)
+        after_nodes = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    workdir = tempfile.mkdtemp(prefix="dte-bench-memory-")
+    try:
+        storage_dir = os.path.join(workdir, "dte_runs")
+        cache = ResultCache(storage_dir)
+        cache.put("memory", results, signals)
+        entry_bytes = os.path.getsize(cache._path("memory"))
+        tracemalloc.start()
+        try:
+            before_reload = tracemalloc.get_traced_memory()[0]
+            reloaded = ResultCache(storage_dir).get("memory")
+            reload_bytes = tracemalloc.get_traced_memory()[0] - before_reload
+        finally:
+            tracemalloc.stop()
+        del reloaded
+        narrative = build_narrative(results, context, None)
+        started = time.perf_counter()
+        persist_run(results, narrative, context, storage_dir=storage_dir, signals=signals)
+        persist_seconds = time.perf_counter() - started
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "columns": columns,
+        "rows": rows,
+        "signals": len(signals),
+        "hypotheses": len(hypotheses),
+        "nodes": len(results["nodes"]),
+        "signal_bytes": after_signals - start,
+        "hypothesis_bytes": after_hypotheses - after_signals,
+        "node_bytes": after_nodes - after_hypotheses,
+        "total_bytes": after_nodes - start,
+        "cache_entry_bytes": entry_bytes,
+        "cache_reload_bytes": reload_bytes,
+        "persist_seconds": round(persist_seconds, 6),
+    }
@@ -0,0 +1,120 @@
+"""
+Time each pipeline stage on the synthetic shapes and compare with a baseline.
+Runs offline: datasets and histories are generated locally and deterministically.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Sequence
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from data_thought_engine.benchmarks.generator import DEFAULT_SEED, SHAPES, Shape, dataset_path, generate_csv, generate_history
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.core.context import Context
+from data_thought_engine.core.engine import run_pipeline
+from data_thought_engine.memory.catalog import RunCatalog
+from data_thought_engine.utils.profiling import StageRecorder
+
+DEFAULT_SCALE = 0.01
+DEFAULT_THRESHOLD = 0.5
+# Differences below this many seconds are noise, whatever the ratio
+DEFAULT_FLOOR = 0.01
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+@contextmanager
+def _working_dir(path: str) -> Iterator[None]:
+    # The engine stores runs under the working directory
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def rows_for(shape: Shape, scale: float) -> int:
+    return max(1, round(shape.rows * scale))
+
+
+def bench_shape(shape: Shape, scale: float, data_dir: str, repeat: int = 3, seed: int = DEFAULT_SEED) -> Dict[str, float]:
+    """Return the best wall time per stage over `repeat` uncached runs.
+
+    Shapes with a run history also report `history_rebuild`, the time to
+    rebuild the run catalog from every stored run.
+    """
+    rows = rows_for(shape, scale)
+    path = os.path.abspath(generate_csv(dataset_path(data_dir, shape, rows, seed), shape, rows, seed))
+    workdir = tempfile.mkdtemp(prefix=f"dte-bench-{shape.name}-")
+    best: Dict[str, float] = {}
+    try:
+        storage_dir = os.path.join(workdir, "dte_runs")
+        if shape.history_runs:
+            generate_history(storage_dir, shape.history_runs, seed)
+            start = time.perf_counter()
+            RunCatalog(storage_dir).rebuild()
+            best["history_rebuild"] = time.perf_counter() - start
+        config = EngineConfig(result_cache=False)
+        for _ in range(repeat):
+            recorder = StageRecorder()
+            start = time.perf_counter()
+            with _working_dir(workdir):
+                run_pipeline(Context(dataset_path=path, num_rows_sampled=0, schema={}, config=config), recorder=recorder)
+            timings = {stage: t["wall_seconds"] for stage, t in recorder.timings().items()}
+            timings["total"] = time.perf_counter() - start
+            for name, seconds in timings.items():
+                best[name] = min(best.get(name, seconds), seconds)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {name: round(seconds, 6) for name, seconds in best.items()}
+
+
+def run_suite(shapes: Sequence[str], scale: float = DEFAULT_SCALE, data_dir: str | None = None, repeat: int = 3, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Benchmark the named shapes and return a report in baseline format."""
+    unknown = [name for name in shapes if name not in SHAPES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark shapes: {', '.join(unknown)}")
+    data_dir = data_dir or os.path.join(tempfile.gettempdir(), "dte_bench")
+    return {
+        "scale": scale,
+        "seed": seed,
+        "results": {name: bench_shape(SHAPES[name], scale, data_dir, repeat, seed) for name in shapes},
+    }
+
+
+def load_baseline(path: str) -> Dict[str, Any] | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save_baseline(path: str, report: Dict[str, Any], threshold: float) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({**report, "threshold": threshold}, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float, floor: float = DEFAULT_FLOOR) -> List[Dict[str, Any]]:
+    """Return every timing that exceeds its baseline by more than `threshold`.
+
+    A timing regresses when it is more than `1 + threshold` times the
+    baseline and also more than `floor` seconds slower. Timings missing
+    from the baseline are not compared.
+    """
+    if (report["scale"], report["seed"]) != (baseline.get("scale"), baseline.get("seed")):
+        raise ValueError("Benchmark scale and seed must match the baseline to compare")
+    regressions = []
+    for shape, timings in report["results"].items():
+        reference = baseline.get("results", {}).get(shape, {})
+        for name, seconds in timings.items():
+            expected = reference.get(name)
+            if expected is None:
+                continue
+            if seconds > expected * (1 + threshold) and seconds - expected > floor:
+                regressions.append({"shape": shape, "timing": name, "seconds": seconds, "baseline": expected, "ratio": round(seconds / expected, 2) if expected else None})
+    return regressions
@@ -0,0 +1,46 @@
+"""
+Command-line entry point for the long-lived DTE analysis service.
+Serves on a localhost HTTP port or a Unix socket until interrupted.
+"""
+from __future__ import annotations
+
+import argparse
+from data_thought_engine.core.config import DEFAULT_ENTROPY_EXACT_LIMIT, READER_NAMES, STORE_NAMES, EngineConfig
+from data_thought_engine.core.service import DEFAULT_MEMORY_ENTRIES, AnalysisService, make_server
+from data_thought_engine.utils.backend import BACKEND_NAMES
+from data_thought_engine.utils.logger import get_logger
+
+
+def serve_run(argv: list[str] | None = None) -> int:
+    """Parse arguments, serve until interrupted and return the exit status."""
+    parser = argparse.ArgumentParser(description='Data Thought Engine (DTE) service')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='HTTP port to listen on')
+    parser.add_argument('--socket', help='Listen on this Unix socket path instead of a TCP port')
+    parser.add_argument('--jobs', type=int, default=1, help='Analysis jobs run concurrently; further requests wait')
+    parser.add_argument('--memory-entries', type=int, default=DEFAULT_MEMORY_ENTRIES, help='Cached results held in memory')
+    parser.add_argument('--exact-median', action='store_true', help='Default for jobs: exact median instead of the quantile sketch')
+    parser.add_argument('--entropy-exact-limit', type=int, default=DEFAULT_ENTROPY_EXACT_LIMIT, help='Default for jobs: distinct values per column before entropy is estimated')
+    parser.add_argument('--backend', choices=BACKEND_NAMES, default='auto', help='Default for jobs: compute kernels')
+    parser.add_argument('--reader', choices=READER_NAMES, default='csv', help='Default for jobs: CSV reader')
+    parser.add_argument('--store', choices=STORE_NAMES, default='json', help='Default for jobs: run store')
+    parser.add_argument('--columnar-cache', action='store_true', help='Default for jobs: reuse parsed columns from <dataset>.dtecol sidecars')
+    args = parser.parse_args(argv)
+
+    logger = get_logger('dte')
+    config = EngineConfig(exact_median=args.exact_median, entropy_exact_limit=args.entropy_exact_limit, backend=args.backend, reader=args.reader, store=args.store, columnar_cache=args.columnar_cache)
+    service = AnalysisService(config, jobs=args.jobs, memory_entries=args.memory_entries)
+    server = make_server(service, args.host, args.port, args.socket)
+    logger.info('DTE service listening', {'address': args.socket or f'{args.host}:{args.port}', 'jobs': args.jobs})
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    logger.info('DTE service stopped', service.status())
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(serve_run())
@@ -1,32 +1,80 @@
 """
 Command-line interface to trigger the Data Thought Engine pipeline.
-Accepts a dataset path and optional storage directory.
+Accepts one dataset path, or many paths, globs and manifests for batch mode.
 """
 from __future__ import annotations
 
 import argparse
+from data_thought_engine.core.batch import expand_datasets, read_manifest, run_batch, run_instrumented, summarize
+from data_thought_engine.core.config import DEFAULT_ENTROPY_EXACT_LIMIT, READER_NAMES, STORE_NAMES, EngineConfig
 from data_thought_engine.core.context import Context
-from data_thought_engine.core.engine import run_pipeline
-from data_thought_engine.ingestion.schema import infer_schema
+from data_thought_engine.utils.backend import BACKEND_NAMES
 from data_thought_engine.utils.logger import get_logger
 from data_thought_engine.utils.checks import assert_path_exists, assert_is_csv
+from data_thought_engine.utils.profiling import emit_timings
 
 
-def cli_run(argv: list[str] | None = None) -> None:
+def cli_run(argv: list[str] | None = None) -> int:
+    """Parse arguments, run the pipeline and return the process exit status."""
     parser = argparse.ArgumentParser(description='Data Thought Engine (DTE)')
-    parser.add_argument('dataset', help='Path to CSV dataset file')
+    parser.add_argument('dataset', nargs='*', help='Paths or glob patterns of CSV dataset files')
+    parser.add_argument('--manifest', action='append', default=[], help='File listing one dataset path or glob per line (repeatable)')
+    parser.add_argument('--jobs', type=int, default=1, help='Processes analyzing datasets in parallel in batch mode')
+    parser.add_argument('--exact-median', action='store_true', help='Hold every numeric value for an exact median instead of the quantile sketch')
+    parser.add_argument('--entropy-exact-limit', type=int, default=DEFAULT_ENTROPY_EXACT_LIMIT, help='Distinct values per column before entropy is estimated')
+    parser.add_argument('--backend', choices=BACKEND_NAMES, default='auto', help='Compute kernels: numpy when installed, else the standard library')
+    parser.add_argument('--workers', type=int, default=1, help='Processes used to observe columns in parallel')
+    parser.add_argument('--ingest-workers', type=int, default=1, help='Processes parsing record-aligned byte ranges of large files')
+    parser.add_argument('--reader', choices=READER_NAMES, default='csv', help='CSV reader for serial runs: the csv module or a memory-mapped byte scanner')
+    parser.add_argument('--store', choices=STORE_NAMES, default='json', help='Persist runs as one JSON file each or into dte_runs/runs.sqlite3')
+    parser.add_argument('--incremental', action='store_true', help='Resume from the checkpoint of the previous run and parse only appended rows')
+    parser.add_argument('--no-cache', action='store_true', help='Recompute results even if this dataset and config were analyzed before')
+    parser.add_argument('--columnar-cache', action='store_true', help='Keep parsed columns in a <dataset>.dtecol sidecar and reuse it while the file is unchanged')
+    parser.add_argument('--timings', action='store_true', help='Record wall and CPU time, rows, bytes and peak traced memory per stage in the log and the run record')
+    parser.add_argument('--profile', action='store_true', help='Like --timings, plus per-stage cProfile stats in dte_runs/profiles/')
     args = parser.parse_args(argv)
 
-    assert_path_exists(args.dataset)
-    assert_is_csv(args.dataset)
+    entries = list(args.dataset)
+    for manifest in args.manifest:
+        entries.extend(read_manifest(manifest))
+    if not entries:
+        parser.error('at least one dataset or --manifest is required')
+    paths = expand_datasets(entries)
+    # A single literal path keeps the original one-run behavior
+    batch = bool(args.manifest) or paths != entries or len(paths) > 1
 
-    schema = infer_schema(args.dataset, max_rows=200)
     logger = get_logger('dte')
-    ctx = Context(dataset_path=args.dataset, num_rows_sampled=0, schema=schema)
-    logger.info('Starting DTE run', {'dataset': args.dataset})
-    run_pipeline(ctx)
-    logger.info('DTE run complete', {'dataset': args.dataset})
+    config = EngineConfig(exact_median=args.exact_median, entropy_exact_limit=args.entropy_exact_limit, backend=args.backend, workers=args.workers, ingest_workers=args.ingest_workers, reader=args.reader, store=args.store, incremental=args.incremental, result_cache=not args.no_cache, columnar_cache=args.columnar_cache)
+    if batch:
+        logger.info('Starting DTE batch', {'datasets': len(paths), 'jobs': args.jobs})
+
+        def report(outcome: dict) -> None:
+            record = {k: v for k, v in outcome.items() if k != 'narrative'}
+            if outcome['exit_status'] == 0:
+                logger.info('DTE dataset finished', record)
+            else:
+                logger.error('DTE dataset failed', record)
+
+        outcomes = run_batch(paths, config, args.jobs, on_result=report, timings=args.timings, profile=args.profile)
+        summary = summarize(outcomes)
+        logger.info('DTE batch complete', summary)
+        return summary['exit_status']
+
+    dataset = entries[0]
+    assert_path_exists(dataset)
+    assert_is_csv(dataset)
+
+    # Schema is inferred by the pipeline during its single pass over the file
+    ctx = Context(dataset_path=dataset, num_rows_sampled=0, schema={}, config=config)
+    logger.info('Starting DTE run', {'dataset': dataset})
+    outcome = run_instrumented(ctx, timings=args.timings, profile=args.profile)
+    if 'timings' in outcome:
+        emit_timings(logger, outcome['timings'], {'dataset': dataset})
+    for path in outcome.get('profiles', []):
+        logger.info('DTE stage profile', {'dataset': dataset, 'path': path})
+    logger.info('DTE run complete', {'dataset': dataset})
+    return 0
 
 
 if __name__ == '__main__':
-    cli_run()
+    raise SystemExit(cli_run())
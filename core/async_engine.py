@@ -0,0 +1,163 @@
+"""
+asyncio variant of the pipeline that overlaps I/O with computation.
+Blocking work runs in worker threads so the event loop is never blocked.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any, Dict, Iterator, List, Tuple
+import asyncio
+import os
+import threading
+
+from data_thought_engine.core.context import Context
+from data_thought_engine.core.engine import EngineCaches, _observe, _outcome, _serial_batches
+from data_thought_engine.core.lifecycle import Stage, validate_sequence
+from data_thought_engine.explanation.narrative import build_narrative
+from data_thought_engine.hypothesis.generator import generate_hypotheses
+from data_thought_engine.ingestion.columns import ColumnChunk
+from data_thought_engine.ingestion.compression import is_compressed
+from data_thought_engine.memory.history import _compute_reasoning_signature, _hash_dataset, compare_with_history, load_history
+from data_thought_engine.memory.result_cache import ResultCache, cache_key
+from data_thought_engine.memory.store import persist_run
+from data_thought_engine.observation.accumulators import ColumnAccumulator, accumulate_batches
+from data_thought_engine.observation.detectors import signals_from_accumulators
+from data_thought_engine.observation.signals import Signal
+from data_thought_engine.reasoning.evaluator import evaluate_hypotheses
+from data_thought_engine.utils.profiling import DISABLED, HISTORY, StageRecorder
+
+DEFAULT_QUEUE_BATCHES = 4
+
+
+def _produce(batches: Iterator[List[ColumnChunk]], queue: "asyncio.Queue[List[ColumnChunk] | None]", loop: asyncio.AbstractEventLoop, stop: threading.Event) -> None:
+    """Parse batches in this worker thread and hand them to the queue, then None.
+
+    The generator is advanced and closed only here; setting `stop` ends the
+    loop after the batch being handed over. None is queued even when parsing
+    fails, so the consumer never waits on a dead producer.
+    """
+    try:
+        for batch in batches:
+            if stop.is_set():
+                return
+            asyncio.run_coroutine_threadsafe(queue.put(batch), loop).result()
+    finally:
+        close = getattr(batches, "close", None)
+        if close is not None:
+            close()
+        if not stop.is_set():
+            asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+
+def _streams(context: Context) -> bool:
+    """Whether `_observe` would take the serial path that `_observe_async` streams."""
+    config = context.config
+    path = context.dataset_path
+    compressed = is_compressed(path)
+    if config.workers > 1 or (config.incremental and not compressed):
+        return False
+    return compressed or not (config.ingest_workers > 1 and os.path.getsize(path) > config.range_bytes)
+
+
+async def _observe_async(context: Context, storage_dir: str, queue_batches: int, recorder: StageRecorder = DISABLED) -> Tuple[Context, List[Signal]]:
+    """Serial observation with parsing and accumulation overlapped.
+
+    A worker thread parses batches into a queue holding at most
+    `queue_batches` of them while another folds them in, in file order,
+    so the state equals the sync engine's. Rows and bytes are credited to
+    the ingest stage of `recorder`; this task overlaps other work, so its
+    time is charged by the caller that waits for it.
+    """
+    config = context.config
+    if recorder.enabled:
+        recorder.add(Stage.INGEST, nbytes=os.path.getsize(context.dataset_path))
+    schema, batches = await asyncio.to_thread(_serial_batches, context, storage_dir)
+    queue: "asyncio.Queue[List[ColumnChunk] | None]" = asyncio.Queue(maxsize=queue_batches)
+    stop = threading.Event()
+    producer = asyncio.ensure_future(asyncio.to_thread(_produce, batches, queue, asyncio.get_running_loop(), stop))
+    accumulators: Dict[str, ColumnAccumulator] = {}
+    try:
+        while (batch := await queue.get()) is not None:
+            recorder.add(Stage.INGEST, rows=batch[0].size if batch else 0)
+            await asyncio.to_thread(accumulate_batches, [batch], config, accumulators)
+    finally:
+        stop.set()
+        # Free a slot so a producer blocked on a full queue can see `stop`
+        while not queue.empty():
+            queue.get_nowait()
+        await asyncio.gather(producer, return_exceptions=True)
+    await producer
+    return replace(context, schema=schema), signals_from_accumulators(accumulators)
+
+
+async def run_pipeline_async(context: Context, stages: Tuple[Stage, ...] = (Stage.INGEST, Stage.OBSERVE, Stage.HYPOTHESIS, Stage.REASON, Stage.EXPLAIN, Stage.PERSIST), history: Dict[str, Any] | None = None, caches: EngineCaches | None = None, queue_batches: int = DEFAULT_QUEUE_BATCHES, recorder: StageRecorder = DISABLED) -> Dict[str, Any]:
+    """Run the pipeline like `run_pipeline`, without blocking the event loop.
+
+    Serial observation starts right away, while the dataset is hashed and
+    the run history loaded concurrently; if the hash hits the result cache,
+    it is cancelled and the cached results are used. Incremental, range and
+    sharded observation have their own pools and run in a worker thread
+    after a cache miss, as in the sync engine. The run is persisted in a
+    worker thread. The outcome record and everything written equal those
+    of `run_pipeline`. An enabled `recorder` times the stages as in
+    `run_pipeline`; work that overlaps an earlier stage is charged only
+    for the time the pipeline then waits for it.
+    """
+    validate_sequence(stages)
+
+    storage_dir = os.path.join(os.getcwd(), "dte_runs")
+    fingerprints = caches.fingerprints if caches else None
+    if fingerprints is not None:
+        context = replace(context, fingerprints=fingerprints)
+    # Streaming observation can be stopped on a cache hit, so it starts before the lookup
+    observing = asyncio.create_task(_observe_async(context, storage_dir, queue_batches, recorder)) if _streams(context) else None
+    history_task = None if history is not None else asyncio.create_task(asyncio.to_thread(load_history, storage_dir, caches.catalog if caches else None))
+    try:
+        with recorder.stage(Stage.INGEST):
+            dataset_hash = await asyncio.to_thread(_hash_dataset, context.dataset_path, storage_dir, fingerprints)
+            cache = None
+            if context.config.result_cache and dataset_hash != "unknown":
+                cache = caches.results if caches else ResultCache(storage_dir)
+            key = cache_key(dataset_hash, context.config) if cache else None
+            cached = await asyncio.to_thread(cache.get, key) if cache else None
+        if cached is not None:
+            results, signals = cached
+        else:
+            with recorder.stage(Stage.OBSERVE):
+                if observing is None:
+                    # The recorder is idle while this coroutine waits, so the thread may nest stages in it
+                    observing = asyncio.create_task(asyncio.to_thread(_observe, context, storage_dir, recorder))
+                context, signals = await observing
+            recorder.add(Stage.OBSERVE, rows=recorder.rows(Stage.INGEST))
+            with recorder.stage(Stage.HYPOTHESIS):
+                hypotheses = generate_hypotheses(signals, context)
+            recorder.add(Stage.HYPOTHESIS, rows=len(signals))
+            with recorder.stage(Stage.REASON):
+                results = await asyncio.to_thread(evaluate_hypotheses, hypotheses, context)
+            recorder.add(Stage.REASON, rows=len(hypotheses))
+            if cache:
+                with recorder.stage(Stage.PERSIST):
+                    await asyncio.to_thread(cache.put, key, results, signals)
+        if history_task is not None:
+            with recorder.stage(HISTORY):
+                history = await history_task
+    finally:
+        for task in (observing, history_task):
+            if task is not None and not task.done():
+                task.cancel()
+        await asyncio.gather(*(t for t in (observing, history_task) if t is not None), return_exceptions=True)
+
+    with recorder.stage(Stage.REASON):
+        sig = await asyncio.to_thread(_compute_reasoning_signature, context.dataset_path, results, storage_dir, fingerprints)
+    with recorder.stage(HISTORY):
+        history_comparison = compare_with_history(sig, storage_dir, history)
+    with recorder.stage(Stage.EXPLAIN):
+        narrative = build_narrative(results, context, history_comparison)
+    recorder.add(Stage.EXPLAIN, rows=len(results.get('nodes', [])))
+    timings = recorder.timings() if recorder.enabled else None
+    with recorder.stage(Stage.PERSIST):
+        location = await asyncio.to_thread(persist_run, results, narrative, context, dataset_hash=sig['dataset_hash'], store=context.config.store, signals=signals, timings=timings)
+    outcome = _outcome(context, sig, cached is not None, history_comparison, results, location, narrative)
+    if recorder.enabled:
+        outcome["timings"] = recorder.timings()
+    return outcome
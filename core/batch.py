@@ -0,0 +1,130 @@
+"""
+Batch mode: analyze many datasets in one process over a worker pool.
+Datasets come from paths, glob patterns or a manifest file.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, List, Sequence
+import glob
+import os
+
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.core.context import Context
+from data_thought_engine.core.engine import EngineCaches, run_pipeline
+from data_thought_engine.memory.history import load_history
+from data_thought_engine.memory.store import run_id_for
+from data_thought_engine.utils.checks import assert_is_csv, assert_path_exists
+from data_thought_engine.utils.profiling import DISABLED, StageRecorder
+
+_GLOB_CHARS = "*?["
+
+
+def read_manifest(path: str) -> List[str]:
+    """Return the dataset entries of a manifest: one path or glob per line.
+
+    Blank lines and lines starting with `#` are ignored. Relative entries are
+    taken relative to the current directory, like paths on the command line.
+    """
+    assert_path_exists(path)
+    with open(path, "r", encoding="utf-8") as fh:
+        return [line.strip() for line in fh if line.strip() and not line.lstrip().startswith("#")]
+
+
+def expand_datasets(entries: Iterable[str]) -> List[str]:
+    """Expand glob patterns and drop repeated paths, keeping first-seen order.
+
+    Each pattern expands in sorted order. A pattern that matches nothing is
+    kept as given so it is reported as a failed dataset instead of vanishing.
+    """
+    paths: List[str] = []
+    seen = set()
+    for entry in entries:
+        matches = sorted(glob.glob(entry)) if any(c in entry for c in _GLOB_CHARS) else []
+        for path in matches or [entry]:
+            key = os.path.realpath(path)
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def run_instrumented(context: Context, history: Dict[str, Any] | None = None, caches: EngineCaches | None = None, timings: bool = False, profile: bool = False) -> Dict[str, Any]:
+    """Run the pipeline, optionally recording per-stage timings.
+
+    Timings include the peak traced memory of every stage. `profile`
+    implies timings and also keeps per-stage cProfile stats, written to
+    `dte_runs/profiles/<run id>.<stage>.prof` and listed in the outcome.
+    """
+    recorder = StageRecorder(trace_memory=True, profile=profile) if timings or profile else DISABLED
+    try:
+        outcome = run_pipeline(context, history=history, caches=caches, recorder=recorder)
+        if recorder.profile:
+            outcome["profiles"] = recorder.dump_profiles(os.path.join(os.getcwd(), "dte_runs", "profiles"), run_id_for(context))
+        return outcome
+    finally:
+        recorder.close()
+
+
+def analyze_dataset(path: str, config: EngineConfig, history: Dict[str, Any] | None = None, caches: EngineCaches | None = None, timings: bool = False, profile: bool = False) -> Dict[str, Any]:
+    """Run the pipeline on one dataset and return its outcome record.
+
+    Failures are captured in the outcome (status "error", exit status 1) so
+    one bad dataset never aborts the rest of a batch.
+    """
+    try:
+        assert_path_exists(path)
+        assert_is_csv(path)
+        ctx = Context(dataset_path=path, num_rows_sampled=0, schema={}, config=config)
+        return run_instrumented(ctx, history, caches, timings, profile)
+    except Exception as exc:
+        return {"dataset": path, "status": "error", "exit_status": 1, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def run_batch(paths: Sequence[str], config: EngineConfig, jobs: int = 1, on_result: Callable[[Dict[str, Any]], None] | None = None, timings: bool = False, profile: bool = False) -> List[Dict[str, Any]]:
+    """Analyze every dataset and return their outcomes in input order.
+
+    Run history is loaded once up front and shared, so each dataset is
+    compared against the runs that existed before the batch started. With
+    `jobs` > 1 datasets are spread over a process pool and at most two per
+    worker are queued at a time; run records use exclusive writes, so
+    parallel runs never overwrite each other. `on_result` is called with
+    each outcome as soon as it and all earlier ones are done. `timings`
+    and `profile` instrument every run as in `run_instrumented`.
+    """
+    history = load_history(os.path.join(os.getcwd(), "dte_runs"))
+    outcomes: List[Dict[str, Any]] = []
+
+    def emit(outcome: Dict[str, Any]) -> None:
+        outcomes.append(outcome)
+        if on_result is not None:
+            on_result(outcome)
+
+    if jobs <= 1:
+        for path in paths:
+            emit(analyze_dataset(path, config, history, timings=timings, profile=profile))
+        return outcomes
+
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for path in paths:
+            pending.append(pool.submit(analyze_dataset, path, config, history, None, timings, profile))
+            if len(pending) >= 2 * jobs:
+                emit(pending.popleft().result())
+        while pending:
+            emit(pending.popleft().result())
+    return outcomes
+
+
+def summarize(outcomes: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the aggregate summary of a batch and its overall exit status."""
+    failed = [o["dataset"] for o in outcomes if o["exit_status"] != 0]
+    return {
+        "datasets": len(outcomes),
+        "ok": len(outcomes) - len(failed),
+        "failed": len(failed),
+        "cached": sum(1 for o in outcomes if o.get("cached")),
+        "failed_datasets": failed,
+        "exit_status": 1 if failed else 0,
+    }
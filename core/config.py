@@ -0,0 +1,56 @@
+"""
+Immutable engine configuration shared through the Context.
+Groups tunables that affect how observation is computed, with safe defaults.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from data_thought_engine.ingestion.ranges import DEFAULT_RANGE_BYTES
+from data_thought_engine.ingestion.stream import DEFAULT_BATCH_SIZE
+from data_thought_engine.utils.sketches import DEFAULT_HEAVY_HITTERS, DEFAULT_QUANTILE_K
+
+DEFAULT_ENTROPY_EXACT_LIMIT = 16384
+READER_NAMES = ("csv", "mmap")
+STORE_NAMES = ("json", "sqlite")
+
+
+@dataclass(frozen=True)
+class EngineConfig:
+    """Tunables for a run; defaults keep memory bounded per column.
+
+    `exact_median` trades the quantile sketch for an exact median that
+    holds every numeric value in memory. Columns with more distinct values
+    than `entropy_exact_limit` switch to an estimated entropy. `backend`
+    selects the compute kernels; every backend yields identical signals.
+    `workers` > 1 shards columns across that many processes, while
+    `ingest_workers` > 1 parses `range_bytes`-sized slices of the file in
+    parallel; both yield the same signals as a serial run.
+    `reader` picks the csv module or the memory-mapped byte scanner for
+    serial runs; both produce identical batches. `store` selects where runs
+    are persisted: one JSON file each, or the SQLite run database.
+    `incremental` resumes observation from the checkpoint of the previous
+    run and parses only appended bytes; results equal a full serial scan.
+    `result_cache` replays stored results for an unchanged dataset and config.
+    `columnar_cache` keeps parsed batches in a binary sidecar next to the
+    dataset, so serial runs on an unchanged file skip parsing.
+    """
+    batch_size: int = DEFAULT_BATCH_SIZE
+    exact_median: bool = False
+    quantile_k: int = DEFAULT_QUANTILE_K
+    entropy_exact_limit: int = DEFAULT_ENTROPY_EXACT_LIMIT
+    heavy_hitters: int = DEFAULT_HEAVY_HITTERS
+    backend: str = "auto"
+    workers: int = 1
+    ingest_workers: int = 1
+    range_bytes: int = DEFAULT_RANGE_BYTES
+    reader: str = "csv"
+    store: str = "json"
+    incremental: bool = False
+    result_cache: bool = True
+    columnar_cache: bool = False
+
+    @property
+    def median_sketch_k(self) -> int | None:
+        """Sketch size to use for medians, or None for the exact mode."""
+        return None if self.exact_median else self.quantile_k
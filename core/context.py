@@ -8,15 +8,22 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any
 
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.memory.fingerprint import FingerprintCache
+
 
 @dataclass(frozen=True)
 class Context:
     """Immutable run context containing dataset metadata.
 
     Use dataclass immutability to prevent global mutable state.
+    `fingerprints` is a warm fingerprint cache shared by a long-lived
+    process; without it stages open the one in the storage directory.
     """
     dataset_path: str
     num_rows_sampled: int
     schema: Dict[str, str]
     start_time: datetime = field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    config: EngineConfig = field(default_factory=EngineConfig)
+    fingerprints: FingerprintCache | None = field(default=None, compare=False, repr=False)
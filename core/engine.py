@@ -5,37 +5,161 @@ Implements v1.1: Cross-run reasoning consistency integration.
 """
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Any, Dict, Iterator, List, Tuple
+from dataclasses import dataclass, replace
 import os
 from data_thought_engine.core.context import Context
 from data_thought_engine.core.lifecycle import Stage, validate_sequence
-from data_thought_engine.ingestion.loader import load_and_stream
-from data_thought_engine.observation.detectors import detect_signals
+from data_thought_engine.ingestion.columns import ColumnChunk
+from data_thought_engine.ingestion.compression import is_compressed
+from data_thought_engine.ingestion.loader import load_batches, load_blocks, load_cached_batches, load_mapped_batches, load_ranges
+from data_thought_engine.observation.detectors import detect_signals_columnar
+from data_thought_engine.observation.incremental import detect_signals_incremental
+from data_thought_engine.observation.parallel import detect_signals_parallel, detect_signals_ranges
+from data_thought_engine.observation.signals import Signal
 from data_thought_engine.hypothesis.generator import generate_hypotheses
 from data_thought_engine.reasoning.evaluator import evaluate_hypotheses
+from data_thought_engine.utils.profiling import DISABLED, HISTORY, StageRecorder
 from data_thought_engine.explanation.narrative import build_narrative
 from data_thought_engine.memory.store import persist_run
-from data_thought_engine.memory.history import _compute_reasoning_signature, compare_with_history
+from data_thought_engine.memory.catalog import RunCatalog
+from data_thought_engine.memory.fingerprint import FingerprintCache, dataset_fingerprint
+from data_thought_engine.memory.history import _compute_reasoning_signature, _hash_dataset, compare_with_history
+from data_thought_engine.memory.result_cache import ResultCache, cache_key
 
 
-def run_pipeline(context: Context, stages: Tuple[Stage, ...] = (Stage.INGEST, Stage.OBSERVE, Stage.HYPOTHESIS, Stage.REASON, Stage.EXPLAIN, Stage.PERSIST)) -> None:
+@dataclass(frozen=True)
+class EngineCaches:
+    """Caches a long-lived process keeps warm and shares across runs.
+
+    Without them every run opens fresh caches from the storage directory.
+    `catalog` is a run catalog kept open to load each run's history from.
+    """
+    fingerprints: FingerprintCache
+    results: ResultCache
+    catalog: RunCatalog | None = None
+
+
+def _serial_batches(context: Context, storage_dir: str) -> Tuple[Dict[str, str], Iterator[List[ColumnChunk]]]:
+    """Open the typed batches of a serial run with the configured reader.
+
+    With `columnar_cache`, batches come from the dataset's sidecar when it
+    matches the current fingerprint, and the sidecar is rewritten otherwise.
+    """
+    path = context.dataset_path
+    config = context.config
+    if config.columnar_cache:
+        return load_cached_batches(path, context, dataset_fingerprint(path, storage_dir, context.fingerprints), config.batch_size, config.reader)
+    if config.reader == "mmap":
+        return load_mapped_batches(path, context, config.batch_size)
+    return load_batches(path, context, config.batch_size)
+
+
+def _observe(context: Context, storage_dir: str, recorder: StageRecorder = DISABLED) -> Tuple[Context, List[Signal]]:
+    """Ingest and observe with the strategy selected by the engine config.
+
+    Returns a context carrying the inferred schema alongside the signals.
+    Parsing on the streaming paths is charged to the ingest stage of
+    `recorder`; incremental and range runs parse inside observation.
+    """
+    # Single pass: schema comes from a buffered prefix that is replayed into the batches
+    path = context.dataset_path
+    config = context.config
+    # Compressed files cannot be resumed or split by byte offset
+    compressed = is_compressed(path)
+    if config.incremental and not compressed:
+        schema, signals = detect_signals_incremental(context, storage_dir)
+        return replace(context, schema=schema), signals
+    recorder.add(Stage.INGEST, nbytes=os.path.getsize(path) if recorder.enabled else 0)
+    if config.ingest_workers > 1 and not compressed and os.path.getsize(path) > config.range_bytes:
+        with recorder.stage(Stage.INGEST):
+            schema, header, start = load_ranges(path, context)
+        context = replace(context, schema=schema)
+        return context, detect_signals_ranges(path, header, start, context)
+    if config.workers > 1:
+        with recorder.stage(Stage.INGEST):
+            schema, header, blocks = load_blocks(path, context, config.batch_size)
+        context = replace(context, schema=schema)
+        blocks = recorder.iterate(Stage.INGEST, blocks, lambda columns: len(columns[0]) if columns else 0)
+        return context, detect_signals_parallel(header, blocks, context)
+    with recorder.stage(Stage.INGEST):
+        schema, batches = _serial_batches(context, storage_dir)
+    context = replace(context, schema=schema)
+    batches = recorder.iterate(Stage.INGEST, batches, lambda batch: batch[0].size if batch else 0)
+    return context, detect_signals_columnar(batches, context)
+
+
+def _outcome(context: Context, sig: Dict[str, Any], cached: bool, history_comparison: Dict[str, Any], results: Dict[str, Any], location: str, narrative: str) -> Dict[str, Any]:
+    return {
+        "dataset": context.dataset_path,
+        "status": "ok",
+        "exit_status": 0,
+        "dataset_hash": sig['dataset_hash'],
+        "cached": cached,
+        "history_status": history_comparison.get('status'),
+        "summary": results.get('summary'),
+        "run": location,
+        "narrative": narrative,
+    }
+
+
+def run_pipeline(context: Context, stages: Tuple[Stage, ...] = (Stage.INGEST, Stage.OBSERVE, Stage.HYPOTHESIS, Stage.REASON, Stage.EXPLAIN, Stage.PERSIST), history: Dict[str, Any] | None = None, caches: EngineCaches | None = None, recorder: StageRecorder = DISABLED) -> Dict[str, Any]:
     """Run the pipeline stages in order, delegating to modules.
 
     This function contains orchestration only and no domain logic.
     v1.1 extension: Computes reasoning signature and performs historical consistency check.
+    Results are replayed from the result cache when the dataset fingerprint,
+    engine version and config are unchanged; history and persistence still run.
+    `history` is a shared `load_history` snapshot (used by batch runs) and
+    `caches` are warm caches kept by the service. An enabled `recorder`
+    times every stage; its totals are persisted in the run's `timings`
+    section (persistence itself is timed but cannot record itself) and
+    returned in the outcome. Returns an outcome record describing the run,
+    including its narrative.
     """
     validate_sequence(stages)
 
-    rows = load_and_stream(context.dataset_path, context)
-    signals = detect_signals(rows, context)
-    hypotheses = generate_hypotheses(signals, context)
-    results = evaluate_hypotheses(hypotheses, context)
-    
-    # v1.1: Compute reasoning signature and check historical consistency
-    sig = _compute_reasoning_signature(context.dataset_path, results)
     storage_dir = os.path.join(os.getcwd(), "dte_runs")
-    history_comparison = compare_with_history(sig, storage_dir)
-    
-    narrative = build_narrative(results, context, history_comparison)
-    persist_run(results, narrative, context)
+    fingerprints = caches.fingerprints if caches else None
+    if fingerprints is not None:
+        context = replace(context, fingerprints=fingerprints)
+    with recorder.stage(Stage.INGEST):
+        # Deterministic stages are skipped when this exact input and config were seen before
+        dataset_hash = _hash_dataset(context.dataset_path, storage_dir, fingerprints)
+        cache = None
+        if context.config.result_cache and dataset_hash != "unknown":
+            cache = caches.results if caches else ResultCache(storage_dir)
+        key = cache_key(dataset_hash, context.config) if cache else None
+        cached = cache.get(key) if cache else None
+    if cached is not None:
+        results, signals = cached
+    else:
+        with recorder.stage(Stage.OBSERVE):
+            context, signals = _observe(context, storage_dir, recorder)
+        recorder.add(Stage.OBSERVE, rows=recorder.rows(Stage.INGEST))
+        with recorder.stage(Stage.HYPOTHESIS):
+            hypotheses = generate_hypotheses(signals, context)
+        recorder.add(Stage.HYPOTHESIS, rows=len(signals))
+        with recorder.stage(Stage.REASON):
+            results = evaluate_hypotheses(hypotheses, context)
+        recorder.add(Stage.REASON, rows=len(hypotheses))
+        if cache:
+            with recorder.stage(Stage.PERSIST):
+                cache.put(key, results, signals)
+
+    with recorder.stage(Stage.REASON):
+        # v1.1: Compute reasoning signature and check historical consistency
+        sig = _compute_reasoning_signature(context.dataset_path, results, storage_dir, fingerprints)
+    with recorder.stage(HISTORY):
+        history_comparison = compare_with_history(sig, storage_dir, history, caches.catalog if caches else None)
 
+    with recorder.stage(Stage.EXPLAIN):
+        narrative = build_narrative(results, context, history_comparison)
+    recorder.add(Stage.EXPLAIN, rows=len(results.get('nodes', [])))
+    timings = recorder.timings() if recorder.enabled else None
+    with recorder.stage(Stage.PERSIST):
+        location = persist_run(results, narrative, context, dataset_hash=sig['dataset_hash'], store=context.config.store, signals=signals, timings=timings)
+    outcome = _outcome(context, sig, cached is not None, history_comparison, results, location, narrative)
+    if recorder.enabled:
+        outcome["timings"] = recorder.timings()
+    return outcome
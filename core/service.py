@@ -0,0 +1,177 @@
+"""
+Long-lived analysis service over localhost HTTP or a Unix socket.
+Keeps imports and caches warm and streams each job's results back as NDJSON.
+"""
+from __future__ import annotations
+
+from dataclasses import fields, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator
+import json
+import os
+import socketserver
+import stat
+import threading
+
+from data_thought_engine import __version__
+from data_thought_engine.core.batch import analyze_dataset
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.core.engine import EngineCaches
+from data_thought_engine.memory.catalog import open_catalog
+from data_thought_engine.memory.fingerprint import FingerprintCache
+from data_thought_engine.memory.result_cache import ResultCache
+from data_thought_engine.utils.logger import get_logger
+
+DEFAULT_MEMORY_ENTRIES = 256
+_MAX_REQUEST_BYTES = 1 << 20
+
+
+def config_with_overrides(base: EngineConfig, overrides: Dict[str, Any]) -> EngineConfig:
+    """Return `base` with per-request settings applied.
+
+    Only `EngineConfig` fields are accepted and each value must have the
+    type of the field's current value.
+    """
+    known = {f.name for f in fields(EngineConfig)}
+    for name, value in overrides.items():
+        if name not in known:
+            raise ValueError(f"Unknown config field: {name}")
+        if type(value) is not type(getattr(base, name)):
+            raise ValueError(f"Config field {name} expects {type(getattr(base, name)).__name__}")
+    return replace(base, **overrides)
+
+
+class AnalysisService:
+    """Runs analysis jobs against warm caches, at most `jobs` at a time.
+
+    The fingerprint cache and an in-memory layer over the result cache live
+    as long as the service, so a repeated dataset is answered from memory.
+    The run catalog is opened (and rebuilt if needed) once at startup and
+    its connection stays open, so loading each job's history is one indexed
+    query per lookup.
+    Jobs beyond the limit wait for a free slot.
+    """
+
+    def __init__(self, config: EngineConfig, jobs: int = 1, memory_entries: int = DEFAULT_MEMORY_ENTRIES) -> None:
+        if jobs < 1:
+            raise ValueError("Service needs at least one job slot")
+        self.config = config
+        self.jobs = jobs
+        # The engine stores runs under the working directory; the caches must match it
+        self.storage_dir = os.path.join(os.getcwd(), "dte_runs")
+        self.caches = EngineCaches(
+            fingerprints=FingerprintCache(self.storage_dir),
+            results=ResultCache(self.storage_dir, memory_entries=memory_entries),
+            catalog=open_catalog(self.storage_dir, keep_open=True),
+        )
+        self._slots = threading.BoundedSemaphore(jobs)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.completed = 0
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"status": "ok", "version": __version__, "jobs": self.jobs, "active": self.active, "completed": self.completed}
+
+    def run(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Run one job and yield its events: accepted, result, narrative, done.
+
+        The request holds a `dataset` path and optional `config` overrides.
+        A failed dataset yields a result with status "error" and no narrative.
+        """
+        dataset = request.get("dataset")
+        if not isinstance(dataset, str) or not dataset:
+            raise ValueError("Request needs a dataset path")
+        config = config_with_overrides(self.config, request.get("config") or {})
+        yield {"event": "accepted", "dataset": dataset}
+        with self._slots:
+            with self._lock:
+                self.active += 1
+            try:
+                outcome = analyze_dataset(dataset, config, caches=self.caches)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+        narrative = outcome.pop("narrative", None)
+        yield {"event": "result", **outcome}
+        if narrative is not None:
+            yield {"event": "narrative", "dataset": dataset, "text": narrative}
+        yield {"event": "done", "dataset": dataset, "exit_status": outcome["exit_status"]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP front end: `GET /health` and `POST /analyze` (chunked NDJSON)."""
+
+    protocol_version = "HTTP/1.1"
+    server: Any
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Unix socket peers have no address; route access logs through the structured logger
+        self.server.logger.info("DTE service request", {"request": format % args})
+
+    def _send_json(self, code: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        self._send_json(200, self.server.service.status())
+
+    def do_POST(self) -> None:
+        if self.path != "/analyze":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length > _MAX_REQUEST_BYTES:
+                raise ValueError("Request body too large")
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+            events = self.server.service.run(request)
+            first = next(events)
+        except (ValueError, TypeError) as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._send_chunk(first)
+        for event in events:
+            self._send_chunk(event)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_chunk(self, event: Dict[str, Any]) -> None:
+        data = json.dumps(event, default=str).encode("utf-8") + b"\n"
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+class _HttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(service: AnalysisService, host: str = "127.0.0.1", port: int = 8765, socket_path: str | None = None) -> socketserver.BaseServer:
+    """Bind the service to a Unix socket if `socket_path` is given, else to host:port."""
+    if socket_path is not None:
+        # A stale socket from an earlier service would block the bind
+        if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.remove(socket_path)
+        server: socketserver.BaseServer = _UnixServer(socket_path, _Handler)
+    else:
+        server = _HttpServer((host, port), _Handler)
+    server.service = service  # type: ignore[attr-defined]
+    server.logger = get_logger("dte.service")  # type: ignore[attr-defined]
+    return server
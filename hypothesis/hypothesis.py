@@ -3,28 +3,30 @@ Hypothesis object representing a testable statement with assumptions and expecta
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import Sequence, Tuple, Dict, Any
 import hashlib
+import sys
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hypothesis:
     """A hypothesis with deterministic id based on its content.
 
     `expectations` is a simple summary of what the hypothesis predicts.
+    Assumptions and origin signals are tuples of interned strings.
     """
     id: str
     statement: str
-    assumptions: List[str]
+    assumptions: Tuple[str, ...]
     expectations: Dict[str, Any]
-    origin_signals: List[str]
+    origin_signals: Tuple[str, ...]
 
 
-def make_hypothesis(statement: str, assumptions: List[str], expectations: Dict[str, Any], origin_signals: List[str]) -> Hypothesis:
+def make_hypothesis(statement: str, assumptions: Sequence[str], expectations: Dict[str, Any], origin_signals: Sequence[str]) -> Hypothesis:
     """Deterministically derive an id from the statement text.
 
     Using a hash ensures reproducible ids across runs with same input.
     """
     h = hashlib.sha1(statement.encode('utf-8')).hexdigest()
-    return Hypothesis(id=h, statement=statement, assumptions=list(assumptions), expectations=dict(expectations), origin_signals=list(origin_signals))
+    return Hypothesis(id=h, statement=statement, assumptions=tuple(sys.intern(a) for a in assumptions), expectations=dict(expectations), origin_signals=tuple(origin_signals))
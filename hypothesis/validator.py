@@ -1,35 +1,123 @@
 """
 Validate hypotheses by rejecting duplicates and detecting circular references.
-Circularity here means a hypothesis explicitly assumes another it contradicts.
+Circularity here means a chain of `hypothesis:<id>` assumptions that leads back to its start.
 """
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Tuple
 from data_thought_engine.hypothesis.hypothesis import Hypothesis
 
+_PREFIX = "hypothesis:"
+
+
+def _assumption_graph(unique: Dict[str, Hypothesis]) -> List[List[int] | None]:
+    # Edges by input position from each hypothesis to the known hypotheses
+    # it assumes; None for those assuming none
+    position = {hid: i for i, hid in enumerate(unique)}
+    cut = len(_PREFIX)
+    graph: List[List[int] | None] = []
+    for h in unique.values():
+        targets = None
+        for a in h.assumptions:
+            if a.startswith(_PREFIX):
+                t = position.get(a[cut:])
+                if t is not None:
+                    if targets is None:
+                        targets = []
+                    targets.append(t)
+        graph.append(targets)
+    return graph
+
+
+def _strongly_connected(graph: List[List[int] | None]) -> List[List[int]]:
+    # Iterative Tarjan; nodes without edges are skipped, as they cannot be
+    # part of a cycle
+    n = len(graph)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+    for root in range(n):
+        if graph[root] is None or index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, edges = work[-1]
+            for nxt in edges:
+                if graph[nxt] is None:
+                    continue
+                if index[nxt] < 0:
+                    index[nxt] = low[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack[nxt] = 1
+                    work.append((nxt, iter(graph[nxt])))
+                    break
+                if on_stack[nxt] and index[nxt] < low[node]:
+                    low[node] = index[nxt]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def _cycles(unique: Dict[str, Hypothesis]) -> List[List[str]]:
+    graph = _assumption_graph(unique)
+    cycles = [sorted(c) for c in _strongly_connected(graph) if len(c) > 1 or c[0] in graph[c[0]]]
+    if not cycles:
+        return []
+    cycles.sort()
+    ids = list(unique)
+    return [[ids[i] for i in c] for c in cycles]
+
+
+def find_circular_hypotheses(hypotheses: List[Hypothesis]) -> List[List[str]]:
+    """Return every circular group of hypothesis ids, in input order.
+
+    A group is a strongly connected component of the `hypothesis:<id>`
+    assumption graph with more than one member, or a hypothesis assuming
+    itself. Runs in O(H + A) for H hypotheses and A assumptions.
+    """
+    return _cycles({h.id: h for h in hypotheses})
+
+
+def screen_hypotheses(hypotheses: List[Hypothesis]) -> Tuple[List[Hypothesis], List[List[str]]]:
+    """Return (valid hypotheses, rejected cycles) for the audit trail.
+
+    Duplicates are collapsed by id; every hypothesis in a circular group
+    from `find_circular_hypotheses` is rejected.
+    """
+    unique = {h.id: h for h in hypotheses}
+    cycles = _cycles(unique)
+    if not cycles:
+        return list(unique.values()), cycles
+    rejected = {hid for cycle in cycles for hid in cycle}
+    return [h for h in unique.values() if h.id not in rejected], cycles
+
 
 def validate_hypotheses(hypotheses: List[Hypothesis]) -> List[Hypothesis]:
     """Return only valid hypotheses, removing duplicates and inconsistent ones.
 
-    Duplicate detection is deterministic by id. Circularity check is basic:
-    if hypothesis A's assumptions cite hypothesis B's id and B cites A's id,
-    both are rejected to avoid circular reasoning.
+    Duplicate detection is deterministic by id. Hypotheses whose
+    `hypothesis:<id>` assumptions form a cycle of any length, including a
+    hypothesis assuming itself, are all rejected to avoid circular reasoning.
     """
-    unique = {h.id: h for h in hypotheses}
-    valid = []
-    for h in unique.values():
-        valid.append(h)
-    # simple circular detection
-    ids = {h.id for h in valid}
-    to_remove = set()
-    for a in valid:
-        for assumed in a.assumptions:
-            if assumed.startswith("hypothesis:"):
-                other = assumed.split(":", 1)[1]
-                if other in ids:
-                    # check reciprocal assumption
-                    other_h = unique.get(other)
-                    if other_h and any(x == f"hypothesis:{a.id}" for x in other_h.assumptions):
-                        to_remove.add(a.id)
-                        to_remove.add(other)
-    return [h for h in valid if h.id not in to_remove]
+    return screen_hypotheses(hypotheses)[0]
@@ -0,0 +1,122 @@
+"""
+Columnar chunk representation produced by the batch stream.
+Each chunk holds one column's values for a fixed-size run of rows, already typed.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+NUMERIC_TYPES = ("int", "float")
+
+
+def column_kind(schema_type: str | None) -> str:
+    """Map an inferred schema type to the chunk kind used downstream."""
+    return "numeric" if schema_type in NUMERIC_TYPES else "categorical"
+
+
+@dataclass(frozen=True)
+class ColumnChunk:
+    """Typed values of a single column for a contiguous run of rows.
+
+    `numbers` holds every value that parses as a float, in row order.
+    `categories` lists the distinct raw strings in first-seen order and
+    `codes` maps each row to its category, which is all entropy needs.
+    `kind` is only a label: every column needs both buffers (see `build_chunk`).
+    """
+    name: str
+    kind: str
+    numbers: array
+    categories: List[str]
+    codes: array
+
+    @property
+    def size(self) -> int:
+        return len(self.codes)
+
+    def head(self, n: int) -> "ColumnChunk":
+        """Return a chunk holding only the first `n` rows of this one."""
+        if n >= self.size:
+            return self
+        return build_chunk(self.name, self.kind, (self.categories[c] for c in self.codes[:n]))
+
+
+def build_chunk(name: str, kind: str, values: Iterable[str]) -> ColumnChunk:
+    """Dictionary-encode raw strings and parse floats once per distinct value.
+
+    Parsing per category keeps repeated values from hitting `float()` again.
+    `kind` does not change what is built. Entropy is measured on the raw
+    strings of every column, numeric ones included, so all columns need
+    codes; and the numeric detectors read every value that parses as a
+    float, as the list detectors do, because the schema comes from a prefix
+    sample and a categorical column may still hold numbers further down.
+    """
+    index: Dict[str, int] = {}
+    categories: List[str] = []
+    parsed: List[float | None] = []
+    codes = array("I")
+    numbers = array("d")
+    for v in values:
+        code = index.get(v)
+        if code is None:
+            code = len(categories)
+            index[v] = code
+            categories.append(v)
+            try:
+                parsed.append(float(v))
+            except Exception:
+                parsed.append(None)
+        codes.append(code)
+        x = parsed[code]
+        if x is not None:
+            numbers.append(x)
+    return ColumnChunk(name=name, kind=kind, numbers=numbers, categories=categories, codes=codes)
+
+
+def build_chunk_from_bytes(name: str, kind: str, values: Iterable[bytes | str]) -> ColumnChunk:
+    """Like `build_chunk` for undecoded UTF-8 fields from the mmap reader.
+
+    Floats are parsed straight from bytes and only the distinct values of
+    the chunk are decoded. Values may also arrive as `str` when part of the
+    chunk had to be parsed by the csv module; equal values are merged.
+    """
+    index: Dict[bytes | str, int] = {}
+    raw: List[bytes | str] = []
+    parsed: List[float | None] = []
+    codes = array("I")
+    numbers = array("d")
+    for v in values:
+        code = index.get(v)
+        if code is None:
+            code = len(raw)
+            index[v] = code
+            raw.append(v)
+            parsed.append(_parse_float(v))
+        codes.append(code)
+        x = parsed[code]
+        if x is not None:
+            numbers.append(x)
+    categories = [v.decode("utf-8") if type(v) is bytes else v for v in raw]
+    if len(set(categories)) != len(categories):
+        categories, codes = _merge_duplicates(categories, codes)
+    return ColumnChunk(name=name, kind=kind, numbers=numbers, categories=categories, codes=codes)
+
+
+def _merge_duplicates(categories: List[str], codes: array) -> tuple:
+    first: Dict[str, int] = {}
+    remap = [first.setdefault(c, len(first)) for c in categories]
+    return list(first), array("I", (remap[c] for c in codes))
+
+
+def _parse_float(value: bytes | str) -> float | None:
+    try:
+        return float(value)
+    except Exception:
+        if type(value) is str or value.isascii():
+            return None
+    # float() only understands non-ASCII digits and spaces in decoded text
+    try:
+        return float(value.decode("utf-8"))
+    except Exception:
+        return None
@@ -0,0 +1,152 @@
+"""
+Transparent streaming decompression of gzip, bz2 and xz compressed CSVs.
+A read-ahead thread decompresses into a bounded queue while the parser consumes it.
+"""
+from __future__ import annotations
+
+from typing import Any, Generator, Iterator, TextIO
+import bz2
+import io
+import lzma
+import queue
+import threading
+import zlib
+
+READ_AHEAD_BYTES = 1 << 20
+READ_AHEAD_BLOCKS = 4
+_INPUT_BYTES = 1 << 18
+_DECOMPRESSORS = {
+    ".gz": lambda: zlib.decompressobj(16 + zlib.MAX_WBITS),
+    ".bz2": bz2.BZ2Decompressor,
+    ".xz": lzma.LZMADecompressor,
+}
+
+
+def compression_suffix(path: str) -> str | None:
+    """Return the compression suffix of `path` (".gz", ".bz2", ".xz"), or None."""
+    lowered = path.lower()
+    for suffix in _DECOMPRESSORS:
+        if lowered.endswith(suffix):
+            return suffix
+    return None
+
+
+def is_compressed(path: str) -> bool:
+    """Whether `path` is read through a decompressor rather than as raw bytes.
+
+    Compressed files cannot be mapped, seeked into or split by byte offset.
+    """
+    return compression_suffix(path) is not None
+
+
+def decompressed_blocks(path: str, block_size: int = READ_AHEAD_BYTES) -> Generator[bytes, None, None]:
+    """Yield the decompressed content of `path` in blocks of at most `block_size` bytes.
+
+    Concatenated streams are decompressed one after another, like the
+    stdlib file objects do. Working on large blocks keeps most of the time
+    inside the decompressor, which releases the GIL.
+    """
+    suffix = compression_suffix(path)
+    if suffix is None:
+        raise ValueError(f"Not a compressed file: {path}")
+    make = _DECOMPRESSORS[suffix]
+    with open(path, "rb") as fh:
+        decompressor: Any = make()
+        data = b""
+        while True:
+            if decompressor.eof:
+                data = decompressor.unused_data or fh.read(_INPUT_BYTES)
+                if not data:
+                    return
+                decompressor = make()
+            elif not data and getattr(decompressor, "needs_input", True):
+                data = fh.read(_INPUT_BYTES)
+                if not data:
+                    # Flush output still held back by `block_size`, if any
+                    block = decompressor.decompress(b"", block_size)
+                    if not block:
+                        raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+                    yield block
+                    continue
+            block = decompressor.decompress(data, block_size)
+            data = getattr(decompressor, "unconsumed_tail", b"")
+            if block:
+                yield block
+
+
+class ReadAheadReader(io.RawIOBase):
+    """Raw reader over byte blocks that a background thread pulls from `blocks`.
+
+    At most `depth` blocks wait in the queue, which bounds memory while
+    producing them (for example decompressing) overlaps with the consumer.
+    Errors raised by `blocks` are re-raised by the next read. Closing the
+    reader stops the thread and closes `blocks`.
+    """
+
+    def __init__(self, blocks: Iterator[bytes], depth: int = READ_AHEAD_BLOCKS) -> None:
+        super().__init__()
+        self._queue: "queue.Queue[bytes | BaseException]" = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._pending = memoryview(b"")
+        self._done = False
+        self._thread = threading.Thread(target=self._fill, args=(blocks,), name="dte-read-ahead", daemon=True)
+        self._thread.start()
+
+    def _fill(self, blocks: Iterator[bytes]) -> None:
+        try:
+            for block in blocks:
+                self._queue.put(block)
+                if self._stop.is_set():
+                    return
+            self._queue.put(b"")
+        except BaseException as exc:
+            self._queue.put(exc)
+        finally:
+            close = getattr(blocks, "close", None)
+            if close is not None:
+                close()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            if self._done:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._done = True
+                raise item
+            if not item:
+                self._done = True
+                return 0
+            self._pending = memoryview(item)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            # The thread checks the flag after every put, so once the queue
+            # is drained it puts at most one more item before it exits
+            self._stop.set()
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._thread.join()
+        super().close()
+
+
+def open_text(path: str) -> TextIO:
+    """Open a CSV for reading as UTF-8 text, decompressing it if needed.
+
+    Plain files are opened directly. Compressed ones are decompressed by a
+    `ReadAheadReader` thread, so parsing overlaps with decompression.
+    """
+    if not is_compressed(path):
+        return open(path, "r", newline="", encoding="utf-8")
+    reader = ReadAheadReader(decompressed_blocks(path))
+    return io.TextIOWrapper(io.BufferedReader(reader, READ_AHEAD_BYTES), encoding="utf-8", newline="")
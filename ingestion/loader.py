@@ -4,23 +4,23 @@ Performs lightweight checks and delegates actual streaming to `stream`.
 """
 from __future__ import annotations
 
-from typing import Generator, Dict
-import os
+from typing import Dict, Iterable, Iterator, List, Tuple
+import itertools
 
 from data_thought_engine.core.context import Context
-from data_thought_engine.ingestion.stream import row_generator
-from data_thought_engine.ingestion.schema import infer_schema
+from data_thought_engine.ingestion.columns import ColumnChunk
+from data_thought_engine.ingestion.compression import is_compressed
+from data_thought_engine.ingestion.mmap_reader import decode_record, mapped_batch_generator, open_mapped_records
+from data_thought_engine.ingestion.ranges import header_end
+from data_thought_engine.ingestion.stream import DEFAULT_BATCH_SIZE, batch_generator, column_blocks, open_records, row_generator
+from data_thought_engine.ingestion.schema import infer_schema_from_rows
+from data_thought_engine.ingestion.sidecar import read_sidecar, write_through
 from data_thought_engine.utils.checks import assert_path_exists
 
+SCHEMA_SAMPLE_ROWS = 200
 
-def load_and_stream(path: str, context: Context) -> Generator[Dict[str, str], None, None]:
-    """Validate CSV and return a generator of rows.
 
-    Validation: file exists, header present, and schema inferred deterministically.
-    Does not modify the provided Context (immutable).
-    """
-    assert_path_exists(path)
-    inferred = infer_schema(path)
+def validate_schema(inferred: Dict[str, str], context: Context) -> None:
     if not inferred:
         raise ValueError("Could not infer schema from CSV")
     # Basic validation: if context provided a schema, ensure no incompatible columns
@@ -29,4 +29,113 @@ def load_and_stream(path: str, context: Context) -> Generator[Dict[str, str], No
         missing = set(context.schema).difference(set(inferred))
         if missing:
             raise ValueError(f"Context schema references columns missing in CSV: {sorted(missing)}")
-    return row_generator(path)
+
+
+def load_with_schema(path: str, context: Context, max_rows: int = SCHEMA_SAMPLE_ROWS) -> Tuple[Dict[str, str], Iterator[Dict[str, str]]]:
+    """Open the CSV once and return its inferred schema plus a row iterator.
+
+    The first `max_rows` rows are buffered to infer the schema and then
+    replayed ahead of the remaining rows, so the file is parsed a single time.
+    """
+    assert_path_exists(path)
+    rows = row_generator(path)
+    prefix = list(itertools.islice(rows, max_rows))
+    inferred = infer_schema_from_rows(prefix)
+    validate_schema(inferred, context)
+    return inferred, itertools.chain(prefix, rows)
+
+
+def schema_for_records(header: List[str], records: Iterable[List[str]], context: Context, max_rows: int = SCHEMA_SAMPLE_ROWS) -> Tuple[Dict[str, str], Iterator[List[str]]]:
+    """Infer and validate the schema from the leading records, then replay them.
+
+    Returns the schema and an iterator that still yields every record.
+    """
+    records = iter(records)
+    prefix = list(itertools.islice(records, max_rows))
+    inferred = infer_schema_from_rows(dict(zip(header, rec)) for rec in prefix)
+    validate_schema(inferred, context)
+    return inferred, itertools.chain(prefix, records)
+
+
+def _open_with_schema(path: str, context: Context, max_rows: int) -> Tuple[Dict[str, str], List[str], Iterator[List[str]]]:
+    assert_path_exists(path)
+    header, records = open_records(path)
+    inferred, records = schema_for_records(header, records, context, max_rows)
+    return inferred, header, records
+
+
+def load_blocks(path: str, context: Context, batch_size: int = DEFAULT_BATCH_SIZE, max_rows: int = SCHEMA_SAMPLE_ROWS) -> Tuple[Dict[str, str], List[str], Iterator[List[Tuple[str, ...]]]]:
+    """Open the CSV once and return schema, header and raw per-column blocks.
+
+    Blocks hold untyped strings so that typing can happen wherever the
+    block is consumed, for example in a worker process.
+    """
+    inferred, header, records = _open_with_schema(path, context, max_rows)
+    return inferred, header, column_blocks(records, batch_size)
+
+
+def load_ranges(path: str, context: Context, max_rows: int = SCHEMA_SAMPLE_ROWS) -> Tuple[Dict[str, str], List[str], int]:
+    """Return schema, header and the byte offset where the data records start.
+
+    Only the schema sample is parsed here; workers cut the data into
+    record-aligned ranges with `split_ranges` and parse them.
+    """
+    inferred, header, _ = _open_with_schema(path, context, max_rows)
+    return inferred, header, header_end(path)
+
+
+def load_batches(path: str, context: Context, batch_size: int = DEFAULT_BATCH_SIZE, max_rows: int = SCHEMA_SAMPLE_ROWS) -> Tuple[Dict[str, str], Iterator[List[ColumnChunk]]]:
+    """Open the CSV once and return its inferred schema plus typed column batches.
+
+    Like `load_with_schema`, the schema sample is replayed into the stream;
+    batches carry parsed column buffers instead of one dict per row.
+    """
+    inferred, header, records = _open_with_schema(path, context, max_rows)
+    return inferred, batch_generator(header, records, inferred, batch_size)
+
+
+def load_mapped_batches(path: str, context: Context, batch_size: int = DEFAULT_BATCH_SIZE, max_rows: int = SCHEMA_SAMPLE_ROWS) -> Tuple[Dict[str, str], Iterator[List[ColumnChunk]]]:
+    """Like `load_batches`, but read through a memory map of the file.
+
+    Only the schema sample is decoded up front; plain fields stay bytes
+    until their chunk is built. Compressed files cannot be mapped, so they
+    are streamed through `load_batches` instead.
+    """
+    assert_path_exists(path)
+    if is_compressed(path):
+        return load_batches(path, context, batch_size, max_rows)
+    header, records = open_mapped_records(path)
+    prefix = list(itertools.islice(records, max_rows))
+    inferred = infer_schema_from_rows(dict(zip(header, decode_record(rec))) for rec in prefix)
+    validate_schema(inferred, context)
+    return inferred, mapped_batch_generator(header, itertools.chain(prefix, records), inferred, batch_size)
+
+
+def load_cached_batches(path: str, context: Context, fingerprint: str, batch_size: int = DEFAULT_BATCH_SIZE, reader: str = "csv") -> Tuple[Dict[str, str], Iterator[List[ColumnChunk]]]:
+    """Return schema and batches from the columnar sidecar of `path`.
+
+    `fingerprint` is the source's dataset hash. When the sidecar was written
+    for it and for `batch_size`, nothing is parsed. Otherwise the CSV is parsed with `reader` and a fresh sidecar is
+    written as the batches are consumed. Batches equal the parsed ones.
+    """
+    assert_path_exists(path)
+    found = read_sidecar(path, fingerprint, batch_size)
+    if found is not None:
+        inferred, batches = found
+        validate_schema(inferred, context)
+        return inferred, batches
+    if reader == "mmap":
+        inferred, batches = load_mapped_batches(path, context, batch_size)
+    else:
+        inferred, batches = load_batches(path, context, batch_size)
+    return inferred, write_through(path, fingerprint, batch_size, inferred, batches)
+
+
+def load_and_stream(path: str, context: Context) -> Iterator[Dict[str, str]]:
+    """Validate CSV and return a generator of rows.
+
+    Validation: file exists, header present, and schema inferred deterministically.
+    Does not modify the provided Context (immutable).
+    """
+    _, rows = load_with_schema(path, context)
+    return rows
@@ -0,0 +1,196 @@
+"""
+Split CSV files into byte ranges aligned to record boundaries.
+Lets independent processes parse disjoint parts of one file.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import itertools
+import os
+from dataclasses import dataclass
+from typing import Callable, Generator, Iterable, List, Tuple
+
+from data_thought_engine.ingestion.stream import normalize_records
+
+_SCAN_BLOCK = 1 << 20
+DEFAULT_RANGE_BYTES = 64 << 20
+
+
+def _record_end(fh, pos: int, size: int, quotes: int = 0) -> int:
+    """Return the offset just past the first record-ending newline at or after `pos`.
+
+    `quotes` is the number of quote characters seen since the last known
+    record boundary. A newline ends a record only when an even number of
+    quotes precede it, which is how RFC 4180 quoting (with doubled quotes)
+    keeps embedded newlines inside fields.
+    """
+    fh.seek(pos)
+    while pos < size:
+        buf = fh.read(_SCAN_BLOCK)
+        if not buf:
+            break
+        i = 0
+        while True:
+            nl = buf.find(b"\n", i)
+            if nl < 0:
+                quotes += buf.count(b'"', i)
+                break
+            quotes += buf.count(b'"', i, nl)
+            if quotes % 2 == 0:
+                return pos + nl + 1
+            i = nl + 1
+        pos += len(buf)
+    return size
+
+
+@dataclass(frozen=True)
+class SliceScan:
+    """Record ends found in one slice of a file, for either quote parity.
+
+    Each pair holds the answer assuming an even (index 0) or odd (index 1)
+    number of quotes before the slice, since a worker scanning the slice
+    cannot know which. `first` and `last` are offsets just past the first and
+    last record-ending newline, `first_blank` tells whether the record ending
+    at `first` is blank, and `records` counts the non-blank records ending
+    after `first`.
+    """
+    quotes: int
+    first: Tuple[int | None, int | None]
+    first_blank: Tuple[bool, bool]
+    records: Tuple[int, int]
+    last: Tuple[int | None, int | None]
+
+
+@dataclass(frozen=True)
+class RecordRange:
+    """Byte range [start, end) of whole records and the rows it holds.
+
+    `first_row` is the number of data records before the range.
+    """
+    start: int
+    end: int
+    first_row: int
+    rows: int
+
+
+def _blank(span: bytes) -> bool:
+    # The csv module yields an empty, skipped record for these
+    return span == b"" or span == b"\r"
+
+
+def scan_slice(path: str, lo: int, hi: int) -> SliceScan:
+    """Scan the newlines at offsets [lo - 1, hi - 1) for record ends.
+
+    A newline ends a record when an even number of quotes precede it since
+    the last record boundary, as in `_record_end`. Both parities are tracked
+    in one pass; `split_ranges` resolves which applies once every earlier
+    slice has reported its quote count.
+    """
+    base = max(lo - 3, 0)
+    with open(path, "rb") as fh:
+        fh.seek(base)
+        buf = fh.read(hi - 1 - base)
+    i = lo - 1 - base
+    first: List[int | None] = [None, None]
+    first_blank = [False, False]
+    records = [0, 0]
+    prev: List[int | None] = [None, None]
+    if b'"' not in buf and b"\n\n" not in buf and b"\n\r\n" not in buf:
+        # Plain slice: every newline ends a record at even parity, and none is blank
+        nl = buf.find(b"\n", i)
+        if nl >= 0:
+            first[0] = base + nl + 1
+            records[0] = buf.count(b"\n", nl + 1)
+            prev[0] = base + buf.rfind(b"\n") + 1
+        return SliceScan(0, tuple(first), tuple(first_blank), tuple(records), tuple(prev))
+    quotes = 0
+    while True:
+        nl = buf.find(b"\n", i)
+        if nl < 0:
+            quotes += buf.count(b'"', i)
+            break
+        quotes += buf.count(b'"', i, nl)
+        parity = quotes % 2
+        if prev[parity] is None:
+            first[parity] = base + nl + 1
+            # Only newlines precede the span of a blank record, so its start is a record end too
+            first_blank[parity] = buf[nl - 1:nl] == b"\n" or buf[max(nl - 2, 0):nl] == b"\n\r"
+        elif not _blank(buf[prev[parity] - base:nl]):
+            records[parity] += 1
+        prev[parity] = base + nl + 1
+        i = nl + 1
+    return SliceScan(quotes, tuple(first), tuple(first_blank), tuple(records), tuple(prev))
+
+
+def header_end(path: str) -> int:
+    """Return the byte offset where the first data record starts."""
+    with open(path, "rb") as fh:
+        return _record_end(fh, 0, os.fstat(fh.fileno()).st_size)
+
+
+def split_ranges(path: str, start: int, range_bytes: int = DEFAULT_RANGE_BYTES, mapper: Callable[..., Iterable[SliceScan]] = map) -> List[RecordRange]:
+    """Split [start, EOF) into record-aligned ranges of about `range_bytes`.
+
+    The file is cut into fixed slices that `mapper` scans with `scan_slice`,
+    in parallel when it is a process pool's map. The quote counts of the
+    slices then tell which parity each one starts at, so no single pass
+    over the file is needed. Each range starts at the first record end of
+    a slice and carries the number of records before it. Ranges depend only
+    on the file and `range_bytes`, never on the number of workers.
+    """
+    if range_bytes <= 0:
+        raise ValueError("range_bytes must be positive")
+    size = os.path.getsize(path)
+    los = list(range(start, size, range_bytes)) or [start]
+    his = los[1:] + [size + 1]
+    ranges: List[RecordRange] = []
+    parity = 0
+    begin = last = None
+    row = rows = 0
+    for scan in mapper(scan_slice, itertools.repeat(path, len(los)), los, his):
+        cut = scan.first[parity]
+        if cut is not None:
+            if begin is not None:
+                rows += 0 if scan.first_blank[parity] else 1
+                ranges.append(RecordRange(begin, cut, row, rows))
+                row += rows
+            begin, rows = cut, scan.records[parity]
+            last = scan.last[parity]
+        parity = (parity + scan.quotes) % 2
+    if begin is not None and begin < size:
+        with open(path, "rb") as fh:
+            fh.seek(last)
+            rows += 0 if _blank(fh.read(2)) else 1
+        ranges.append(RecordRange(begin, size, row, rows))
+    return ranges
+
+
+class _RangeReader(io.RawIOBase):
+    """Raw binary reader exposing only the bytes of [start, end)."""
+
+    def __init__(self, path: str, start: int, end: int) -> None:
+        self._fh = open(path, "rb")
+        self._fh.seek(start)
+        self._left = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if self._left <= 0:
+            return 0
+        view = memoryview(b)[:self._left]
+        n = self._fh.readinto(view)
+        self._left -= n
+        return n
+
+    def close(self) -> None:
+        self._fh.close()
+        super().close()
+
+
+def range_records(path: str, start: int, end: int, width: int) -> Generator[List[str], None, None]:
+    """Yield normalized records that start within the byte range [start, end)."""
+    with io.TextIOWrapper(io.BufferedReader(_RangeReader(path, start, end)), encoding="utf-8", newline="") as fh:
+        yield from normalize_records(csv.reader(fh), width)
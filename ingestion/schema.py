@@ -4,8 +4,9 @@ Does not depend on in-memory data structures beyond a small sample.
 """
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Tuple
 import datetime
+import itertools
 
 
 def _detect_type(value: str) -> str:
@@ -38,27 +39,32 @@ def _detect_type(value: str) -> str:
     return "str"
 
 
-def infer_schema(path: str, max_rows: int = 200) -> Dict[str, str]:
-    """Infer a minimal schema mapping column -> detected type.
+def infer_schema_from_rows(rows: Iterable[Dict[str, str]]) -> Dict[str, str]:
+    """Infer a minimal schema from already-parsed rows.
 
-    Reads up to `max_rows` rows deterministically to determine the most
-    specific common type observed per column.
+    Chooses the most frequent type observed per column; ties break on the
+    type name so the result does not depend on row order.
     """
-    from data_thought_engine.ingestion.stream import row_generator
-
     counters: Dict[str, Dict[str, int]] = {}
-    rows_read = 0
-    for row in row_generator(path):
-        rows_read += 1
+    for row in rows:
         for k, v in row.items():
             typ = _detect_type(v)
             counters.setdefault(k, {}).setdefault(typ, 0)
             counters[k][typ] += 1
-        if rows_read >= max_rows:
-            break
     schema: Dict[str, str] = {}
     for col, counts in counters.items():
         # Choose the most frequent non-null type observed
         preferred = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[0][0]
         schema[col] = preferred
     return schema
+
+
+def infer_schema(path: str, max_rows: int = 200) -> Dict[str, str]:
+    """Infer a minimal schema mapping column -> detected type.
+
+    Reads up to `max_rows` rows deterministically to determine the most
+    specific common type observed per column.
+    """
+    from data_thought_engine.ingestion.stream import row_generator
+
+    return infer_schema_from_rows(itertools.islice(row_generator(path), max_rows))
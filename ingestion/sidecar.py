@@ -0,0 +1,213 @@
+"""
+Binary columnar sidecar caching the parsed batches of a CSV next to it.
+Later runs on the unchanged file map the sidecar and skip CSV parsing entirely.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Tuple
+import itertools
+import json
+import mmap
+import os
+import stat
+import struct
+import sys
+import tempfile
+
+from data_thought_engine.ingestion.columns import ColumnChunk
+
+SIDECAR_SUFFIX = ".dtecol"
+SIDECAR_VERSION = 1
+_MAGIC = b"DTECOL1\n"
+_TRAILER = struct.Struct("<QQ")
+# Per chunk: segment offset, numbers, codes, categories, category text bytes
+_INDEX_FIELDS = 5
+
+
+def sidecar_path(path: str) -> str:
+    return path + SIDECAR_SUFFIX
+
+
+def _layout() -> Dict[str, Any]:
+    # Buffers are written in native layout; another layout is a cache miss
+    return {"byteorder": sys.byteorder, "codes_itemsize": array("I").itemsize}
+
+
+def read_sidecar(path: str, fingerprint: str, batch_size: int) -> Tuple[Dict[str, str], Iterator[List[ColumnChunk]]] | None:
+    """Return the stored schema and batches for `path`, or None if unusable.
+
+    The sidecar is used only when its source fingerprint, batch size,
+    version and buffer layout all match; anything else, including a
+    missing or truncated file, is a miss. Batches are read from a memory
+    map one chunk at a time.
+    """
+    try:
+        with open(sidecar_path(path), "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        found = _read_footer(mm)
+    except (ValueError, KeyError, TypeError):
+        found = None
+    if found is None or found[0]["fingerprint"] != fingerprint or found[0]["batch_size"] != batch_size:
+        mm.close()
+        return None
+    header, index = found
+    return header["schema"], _mapped_batches(mm, header, index)
+
+
+def _read_footer(mm: mmap.mmap) -> Tuple[Dict[str, Any], array] | None:
+    size = len(mm)
+    tail = _TRAILER.size + len(_MAGIC)
+    if size < len(_MAGIC) + tail or mm[:len(_MAGIC)] != _MAGIC or mm[size - len(_MAGIC):] != _MAGIC:
+        return None
+    index_bytes, header_bytes = _TRAILER.unpack(mm[size - tail:size - len(_MAGIC)])
+    header_start = size - tail - header_bytes
+    index_start = header_start - index_bytes
+    if index_start < len(_MAGIC):
+        return None
+    header = json.loads(mm[header_start:header_start + header_bytes].decode("utf-8"))
+    if header.get("version") != SIDECAR_VERSION or header.get("layout") != _layout():
+        return None
+    index = array("Q")
+    index.frombytes(mm[index_start:header_start])
+    if len(index) != header["batches"] * len(header["columns"]) * _INDEX_FIELDS:
+        return None
+    return header, index
+
+
+def _mapped_batches(mm: mmap.mmap, header: Dict[str, Any], index: array) -> Generator[List[ColumnChunk], None, None]:
+    names = header["columns"]
+    kinds = header["kinds"]
+    width = len(names)
+    try:
+        for b in range(header["batches"]):
+            batch = []
+            for i in range(width):
+                at = (b * width + i) * _INDEX_FIELDS
+                batch.append(_read_chunk(mm, names[i], kinds[i], *index[at:at + _INDEX_FIELDS]))
+            yield batch
+    finally:
+        mm.close()
+
+
+def _read_chunk(mm: mmap.mmap, name: str, kind: str, offset: int, n_numbers: int, n_codes: int, n_categories: int, text_bytes: int) -> ColumnChunk:
+    numbers = array("d")
+    end = offset + n_numbers * numbers.itemsize
+    numbers.frombytes(mm[offset:end])
+    codes = array("I")
+    start, end = end, end + n_codes * codes.itemsize
+    codes.frombytes(mm[start:end])
+    ends = array("Q")
+    start, end = end, end + n_categories * ends.itemsize
+    ends.frombytes(mm[start:end])
+    # Category ends count code points, so the text is decoded once and sliced
+    text = mm[end:end + text_bytes].decode("utf-8")
+    categories = [text[s:e] for s, e in zip(itertools.chain((0,), ends), ends)]
+    return ColumnChunk(name=name, kind=kind, numbers=numbers, categories=categories, codes=codes)
+
+
+class _SidecarWriter:
+    """Append chunks to a temporary file and publish it as the sidecar on close.
+
+    Any I/O error abandons the sidecar; the run that feeds it is unaffected.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.source = path
+        self.target = sidecar_path(path)
+        self.index = array("Q")
+        self.batches = 0
+        self.failed = False
+        self.tmp: str | None = None
+        try:
+            fd, self.tmp = tempfile.mkstemp(prefix=f".{os.path.basename(self.target)}-", dir=os.path.dirname(self.target) or ".")
+            self.fh = os.fdopen(fd, "wb")
+            self.fh.write(_MAGIC)
+            self.offset = len(_MAGIC)
+        except OSError:
+            self.abandon()
+
+    def add(self, batch: List[ColumnChunk]) -> None:
+        if self.failed:
+            return
+        try:
+            for chunk in batch:
+                text = "".join(chunk.categories)
+                ends = array("Q", itertools.accumulate(len(c) for c in chunk.categories))
+                encoded = text.encode("utf-8")
+                self.index.extend((self.offset, len(chunk.numbers), len(chunk.codes), len(chunk.categories), len(encoded)))
+                for part in (chunk.numbers.tobytes(), chunk.codes.tobytes(), ends.tobytes(), encoded):
+                    self.fh.write(part)
+                    self.offset += len(part)
+            self.batches += 1
+        except OSError:
+            self.abandon()
+
+    def publish(self, header: Dict[str, Any]) -> None:
+        if self.failed:
+            return
+        try:
+            encoded = json.dumps({**header, "batches": self.batches}).encode("utf-8")
+            index = self.index.tobytes()
+            self.fh.write(index)
+            self.fh.write(encoded)
+            self.fh.write(_TRAILER.pack(len(index), len(encoded)))
+            self.fh.write(_MAGIC)
+            self.fh.close()
+            # Whoever may read the dataset may read its sidecar
+            os.chmod(self.tmp, stat.S_IMODE(os.stat(self.source).st_mode))
+            os.replace(self.tmp, self.target)
+            self.tmp = None
+        except OSError:
+            self.abandon()
+
+    def abandon(self) -> None:
+        self.failed = True
+        fh = getattr(self, "fh", None)
+        if fh is not None:
+            fh.close()
+        if self.tmp is not None:
+            try:
+                os.remove(self.tmp)
+            except OSError:
+                pass
+            self.tmp = None
+
+
+def write_through(path: str, fingerprint: str, batch_size: int, schema: Dict[str, str], batches: Iterable[List[ColumnChunk]]) -> Generator[List[ColumnChunk], None, None]:
+    """Yield `batches` unchanged while writing them to the sidecar of `path`.
+
+    The sidecar appears atomically once every batch has been consumed; a
+    stream that is closed early or fails leaves no sidecar behind. Every
+    batch must hold the same columns in the same order.
+    """
+    writer = _SidecarWriter(path)
+    names: List[str] | None = None
+    kinds: List[str] = []
+    try:
+        for batch in batches:
+            if names is None:
+                names = [chunk.name for chunk in batch]
+                kinds = [chunk.kind for chunk in batch]
+            elif [chunk.name for chunk in batch] != names:
+                writer.abandon()
+            writer.add(batch)
+            yield batch
+        writer.publish({
+            "version": SIDECAR_VERSION,
+            "layout": _layout(),
+            "fingerprint": fingerprint,
+            "batch_size": batch_size,
+            "schema": schema,
+            "columns": names or [],
+            "kinds": kinds,
+        })
+    finally:
+        if writer.tmp is not None:
+            writer.abandon()
+        close = getattr(batches, "close", None)
+        if close is not None:
+            close()
@@ -1,21 +1,109 @@
 """
 Generator abstraction for streaming CSV rows as dictionaries.
 Implements a simple, memory-efficient row generator using the csv module.
+Also provides a batch mode yielding typed column chunks instead of row dicts.
 """
 from __future__ import annotations
 
 import csv
-from typing import Generator, Dict
+import itertools
+from typing import BinaryIO, Generator, Dict, Iterable, Iterator, List, Tuple
+
+from data_thought_engine.ingestion.columns import ColumnChunk, build_chunk, column_kind
+from data_thought_engine.ingestion.compression import open_text
+
+DEFAULT_BATCH_SIZE = 4096
 
 
 def row_generator(path: str) -> Generator[Dict[str, str], None, None]:
     """Yield rows from a CSV file as dictionaries without loading whole file.
 
     This is intentionally simple and deterministic; it yields strings only.
+    Gzip, bz2 and xz files are decompressed on the fly.
     """
-    with open(path, "r", newline="", encoding="utf-8") as fh:
+    with open_text(path) as fh:
         reader = csv.DictReader(fh)
         if reader.fieldnames is None:
             raise ValueError("CSV file has no header row")
         for row in reader:
             yield {k: (v if v is not None else "") for k, v in row.items()}
+
+
+def _record_generator(path: str) -> Generator[List[str], None, None]:
+    with open_text(path) as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV file has no header row")
+        yield header
+        yield from normalize_records(reader, len(header))
+
+
+def normalize_records(reader: Iterable[List[str]], width: int) -> Generator[List[str], None, None]:
+    """Skip blank records and pad or trim the rest to `width`, as DictReader does."""
+    for rec in reader:
+        if not rec:
+            continue
+        if len(rec) != width:
+            rec = (rec + [""] * width)[:width]
+        yield rec
+
+
+def open_records(path: str) -> Tuple[List[str], Iterator[List[str]]]:
+    """Return the header and an iterator of raw records as lists of strings.
+
+    Records are normalized to the header width; no per-row dict is built.
+    """
+    records = _record_generator(path)
+    header = next(records)
+    return header, records
+
+
+class OffsetRecords:
+    """Normalized records read from byte `start`, tracking where they end.
+
+    Lines are read in binary and decoded one at a time, so after each record
+    `offset` is the byte position just past it. The csv module never reads
+    ahead of the record it returns, which keeps that position exact. Unlike
+    text mode, a bare carriage return does not end a line here.
+    `terminated` tells whether the bytes read so far end with a newline,
+    which fails only for a final record without one.
+    """
+
+    def __init__(self, fh: BinaryIO, start: int, width: int) -> None:
+        fh.seek(start)
+        self.offset = start
+        self.terminated = True
+        self._records = normalize_records(csv.reader(self._lines(fh)), width)
+
+    def _lines(self, fh: BinaryIO) -> Iterator[str]:
+        for line in fh:
+            self.offset += len(line)
+            self.terminated = line.endswith(b"\n")
+            yield line.decode("utf-8")
+
+    def __iter__(self) -> Iterator[List[str]]:
+        return self._records
+
+
+def column_blocks(records: Iterable[List[str]], batch_size: int = DEFAULT_BATCH_SIZE) -> Generator[List[Tuple[str, ...]], None, None]:
+    """Yield fixed-size blocks of records transposed into per-column tuples."""
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    it = iter(records)
+    while True:
+        block = list(itertools.islice(it, batch_size))
+        if not block:
+            return
+        yield list(zip(*block))
+
+
+def batch_generator(header: List[str], records: Iterable[List[str]], schema: Dict[str, str], batch_size: int = DEFAULT_BATCH_SIZE) -> Generator[List[ColumnChunk], None, None]:
+    """Yield fixed-size batches as one typed ColumnChunk per column.
+
+    Column kinds follow the inferred schema; every batch except possibly
+    the last holds exactly `batch_size` rows.
+    """
+    kinds = [column_kind(schema.get(name)) for name in header]
+    for columns in column_blocks(records, batch_size):
+        yield [build_chunk(name, kind, values) for name, kind, values in zip(header, kinds, columns)]
@@ -13,8 +13,7 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     Returns an exit code integer.
     """
-    cli_run(argv)
-    return 0
+    return cli_run(argv)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,170 @@
+"""
+Indexed catalog of persisted runs for fast history lookups.
+A stdlib sqlite3 table mirrors the small signature of each JSON run file.
+"""
+from __future__ import annotations
+
+from contextlib import closing, contextmanager
+from typing import Any, Dict, Iterator, Optional
+import json
+import os
+import sqlite3
+import threading
+
+from data_thought_engine.memory.sqlite_store import SqliteRunStore
+
+CATALOG_FILENAME = "catalog.sqlite3"
+# Bump when the table layout changes; older catalogs are rebuilt on open
+_CATALOG_VERSION = 2
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS runs (
+        run_file TEXT PRIMARY KEY,
+        store TEXT NOT NULL,
+        start_time TEXT,
+        dataset_path TEXT,
+        dataset_hash TEXT,
+        supported_ids TEXT NOT NULL,
+        rejected_ids TEXT NOT NULL,
+        dominant_hypothesis TEXT,
+        dominant_score REAL,
+        node_results TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS runs_with_dataset ON runs(run_file) WHERE dataset_path <> ''",
+)
+_COLUMNS = ("run_file", "store", "start_time", "dataset_path", "dataset_hash", "supported_ids", "rejected_ids", "dominant_hypothesis", "dominant_score", "node_results")
+
+
+def is_run_file(name: str) -> bool:
+    return name.startswith("run_") and name.endswith(".json")
+
+
+def _summarize(run_file: str, payload: Dict[str, Any], store: str) -> tuple:
+    nodes = payload.get("results", {}).get("nodes", [])
+    dominant = max(nodes, key=lambda n: n.get("score", 0), default=None)
+    return (
+        run_file,
+        store,
+        payload.get("start_time"),
+        payload.get("dataset_path"),
+        payload.get("dataset_hash"),
+        json.dumps(sorted(n["hypothesis_id"] for n in nodes if n.get("result") == "supported")),
+        json.dumps(sorted(n["hypothesis_id"] for n in nodes if n.get("result") == "unsupported")),
+        dominant["hypothesis_id"] if dominant else None,
+        dominant["score"] if dominant else None,
+        json.dumps({n["hypothesis_id"]: n["result"] for n in nodes}),
+    )
+
+
+class RunCatalog:
+    """Signatures of every persisted run, keyed and ordered by run name.
+
+    Runs are named after their start time (`run_<ts>.json` for the JSON
+    store, `run_<ts>` in the SQLite store), so the newest run is the last key
+    of the primary index and lookups never read the stored runs. The catalog
+    is derived data: `rebuild` recreates it from both stores.
+
+    With `keep_open`, one connection is opened on first use and shared by
+    every thread until `close`, so a long-lived process does not reconnect
+    and re-check the table layout for each lookup. It is reopened if the
+    catalog file is removed.
+    """
+
+    def __init__(self, storage_dir: str, keep_open: bool = False) -> None:
+        self.storage_dir = storage_dir
+        self.path = os.path.join(storage_dir, CATALOG_FILENAME)
+        self.keep_open = keep_open
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(self.storage_dir, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=not self.keep_open)
+        stale = conn.execute("PRAGMA user_version").fetchone()[0] != _CATALOG_VERSION
+        if stale:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS runs")
+                conn.execute(f"PRAGMA user_version = {_CATALOG_VERSION}")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        if stale:
+            self._fill(conn)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        if not self.keep_open:
+            with closing(self._connect()) as conn:
+                yield conn
+            return
+        with self._lock:
+            if self._conn is not None and not os.path.exists(self.path):
+                self.close()
+            if self._conn is None:
+                self._conn = self._connect()
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the shared connection of a `keep_open` catalog, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record(self, run_file: str, payload: Dict[str, Any], store: str = "json") -> None:
+        """Add or replace the catalog entry for one persisted run."""
+        with self._connection() as conn, conn:
+            conn.execute(f"INSERT OR REPLACE INTO runs VALUES ({', '.join('?' * len(_COLUMNS))})", _summarize(run_file, payload, store))
+
+    def rebuild(self) -> int:
+        """Recreate the catalog from the stored runs and return how many were indexed.
+
+        JSON files that cannot be parsed are skipped, as history loading always did.
+        """
+        with self._connection() as conn:
+            return self._fill(conn)
+
+    def _fill(self, conn: sqlite3.Connection) -> int:
+        rows = []
+        names = sorted(f for f in os.listdir(self.storage_dir) if is_run_file(f)) if os.path.isdir(self.storage_dir) else []
+        for name in names:
+            try:
+                with open(os.path.join(self.storage_dir, name), "r", encoding="utf-8") as fh:
+                    rows.append(_summarize(name, json.load(fh), "json"))
+            except Exception:
+                continue
+        store = SqliteRunStore(self.storage_dir)
+        rows.extend(_summarize(store.catalog_key(run_id), payload, store.name) for run_id, payload in store.payloads())
+        with conn:
+            conn.execute("DELETE FROM runs")
+            conn.executemany(f"INSERT INTO runs VALUES ({', '.join('?' * len(_COLUMNS))})", rows)
+        return len(rows)
+
+    def latest(self, with_dataset: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the newest run entry, optionally among runs with a dataset path.
+
+        If the JSON run file behind that entry was removed, the catalog is
+        rebuilt first so it never answers with a run history no longer has.
+        """
+        where = "WHERE dataset_path <> '' " if with_dataset else ""
+        query = f"SELECT {', '.join(_COLUMNS)} FROM runs {where}ORDER BY run_file DESC LIMIT 1"
+        for attempt in range(2):
+            with self._connection() as conn:
+                row = conn.execute(query).fetchone()
+            if row is None or row[1] != "json" or os.path.exists(os.path.join(self.storage_dir, row[0])) or attempt:
+                break
+            self.rebuild()
+        if row is None:
+            return None
+        entry = dict(zip(_COLUMNS, row))
+        for key in ("supported_ids", "rejected_ids", "node_results"):
+            entry[key] = json.loads(entry[key])
+        return entry
+
+
+def open_catalog(storage_dir: str, keep_open: bool = False) -> RunCatalog:
+    """Return the catalog for `storage_dir`, building it from run files if absent."""
+    catalog = RunCatalog(storage_dir, keep_open)
+    if not os.path.exists(catalog.path) and os.path.isdir(storage_dir):
+        catalog.rebuild()
+    return catalog
@@ -0,0 +1,87 @@
+"""
+Persisted observation checkpoints for incremental re-analysis of growing CSVs.
+A checkpoint pins the processed byte prefix and the accumulator state after it.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, BinaryIO, Dict, List
+import hashlib
+import json
+import os
+import tempfile
+
+from data_thought_engine.core.config import EngineConfig
+
+CHECKPOINT_DIRNAME = "checkpoints"
+_HASH_BLOCK = 1 << 20
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Observation state after the first `rows` data records of a dataset.
+
+    `offset` is the byte position just past those records and always falls
+    on a batch boundary right after a newline, so resuming there replays
+    the exact batch sequence of a full scan. `prefix_hash` covers bytes [0, offset), header included.
+    """
+    dataset_path: str
+    offset: int
+    rows: int
+    header_hash: str
+    prefix_hash: str
+    config_key: Dict[str, Any]
+    schema: Dict[str, str]
+    accumulators: List[Dict[str, Any]]
+
+
+def config_key(config: EngineConfig) -> Dict[str, Any]:
+    """Return the config fields that shape accumulator state.
+
+    Backends, readers and worker counts produce identical state and are
+    left out so they can change between runs without losing the checkpoint.
+    """
+    return {
+        "batch_size": config.batch_size,
+        "median_sketch_k": config.median_sketch_k,
+        "entropy_exact_limit": config.entropy_exact_limit,
+        "heavy_hitters": config.heavy_hitters,
+    }
+
+
+def hash_range(hasher: Any, fh: BinaryIO, start: int, end: int) -> None:
+    """Feed bytes [start, end) of an open binary file into `hasher`."""
+    fh.seek(start)
+    left = end - start
+    while left > 0:
+        block = fh.read(min(_HASH_BLOCK, left))
+        if not block:
+            break
+        hasher.update(block)
+        left -= len(block)
+
+
+def checkpoint_path(storage_dir: str, dataset_path: str) -> str:
+    key = hashlib.sha256(os.path.realpath(dataset_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(storage_dir, CHECKPOINT_DIRNAME, f"{key}.json")
+
+
+def load_checkpoint(storage_dir: str, dataset_path: str) -> Checkpoint | None:
+    """Return the saved checkpoint for a dataset, or None if absent or unreadable."""
+    try:
+        with open(checkpoint_path(storage_dir, dataset_path), "r", encoding="utf-8") as fh:
+            return Checkpoint(**json.load(fh))
+    except Exception:
+        return None
+
+
+def save_checkpoint(storage_dir: str, checkpoint: Checkpoint) -> str:
+    """Atomically write a checkpoint, replacing any earlier one for the dataset."""
+    path = checkpoint_path(storage_dir, checkpoint.dataset_path)
+    base = os.path.dirname(path)
+    os.makedirs(base, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".checkpoint-", dir=base)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(asdict(checkpoint), fh)
+    os.replace(tmp, path)
+    return path
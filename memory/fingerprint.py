@@ -0,0 +1,86 @@
+"""
+Streaming dataset fingerprints with a persistent cache keyed by file identity.
+Lets history checks identify datasets without rereading unchanged files.
+"""
+from __future__ import annotations
+
+from typing import Dict, Tuple
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+_HASH_BLOCK = 1 << 20
+CACHE_FILENAME = "fingerprints.json"
+
+
+def stream_hash(path: str, block_size: int = _HASH_BLOCK) -> str:
+    """Return the truncated SHA-256 of a file read in fixed-size blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while True:
+            block = fh.read(block_size)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _identity(path: str) -> Tuple[str, list]:
+    st = os.stat(path)
+    return os.path.realpath(path), [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+class FingerprintCache:
+    """JSON-backed map from (path, size, mtime_ns, inode) to a dataset hash.
+
+    One entry is kept per resolved path, so the cache never grows beyond the
+    number of distinct datasets. A file whose size, modification time or
+    inode changed is hashed again; writes replace the cache file atomically.
+    An instance is safe to share between threads and stays warm in memory.
+    """
+
+    def __init__(self, storage_dir: str) -> None:
+        self.path = os.path.join(storage_dir, CACHE_FILENAME)
+        self._entries: Dict[str, Dict[str, object]] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, object]]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as fh:
+                    self._entries = json.load(fh)
+            except Exception:
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        base = os.path.dirname(self.path)
+        os.makedirs(base, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".fingerprints-", dir=base)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(self._entries, fh, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def fingerprint(self, path: str) -> str:
+        """Return the dataset hash, computing and storing it on a cache miss."""
+        key, ident = _identity(path)
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is not None and entry.get("identity") == ident:
+            return str(entry["hash"])
+        digest = stream_hash(path)
+        with self._lock:
+            self._entries[key] = {"identity": ident, "hash": digest}
+            self._save()
+        return digest
+
+
+def dataset_fingerprint(path: str, storage_dir: str | None = None, cache: FingerprintCache | None = None) -> str:
+    """Hash a dataset, consulting `cache` or the fingerprint cache in `storage_dir` if given."""
+    if cache is not None:
+        return cache.fingerprint(path)
+    if storage_dir is None:
+        return stream_hash(path)
+    return FingerprintCache(storage_dir).fingerprint(path)
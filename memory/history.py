@@ -4,46 +4,40 @@ Implements v1.1: Cross-run reasoning consistency and contradiction detection.
 """
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Optional
 import os
-import json
-import hashlib
 
+from data_thought_engine.memory.catalog import RunCatalog, open_catalog
+from data_thought_engine.memory.fingerprint import FingerprintCache, dataset_fingerprint
 
-def _load_runs(storage_dir: str) -> List[Dict[str, Any]]:
+
+def _latest_run(storage_dir: str, with_dataset: bool = False, catalog: RunCatalog | None = None) -> Optional[Dict[str, Any]]:
+    if catalog is not None:
+        return catalog.latest(with_dataset)
     if not os.path.isdir(storage_dir):
-        return []
-    files = sorted([f for f in os.listdir(storage_dir) if f.endswith('.json')])
-    runs: List[Dict[str, Any]] = []
-    for fn in files:
-        path = os.path.join(storage_dir, fn)
-        with open(path, 'r', encoding='utf-8') as fh:
-            try:
-                runs.append(json.load(fh))
-            except Exception:
-                continue
-    return runs
-
-
-def _hash_dataset(path: str) -> str:
+        return None
+    return open_catalog(storage_dir).latest(with_dataset)
+
+
+def _hash_dataset(path: str, storage_dir: str | None = None, fingerprints: FingerprintCache | None = None) -> str:
     """Compute deterministic hash of dataset file.
 
     This is used to identify if reasoning applies to the same input.
+    The file is hashed in blocks; with a `storage_dir`, unchanged files
+    are answered from the fingerprint cache kept there (or `fingerprints`).
     """
     try:
-        with open(path, 'rb') as fh:
-            content = fh.read()
-            return hashlib.sha256(content).hexdigest()[:16]
+        return dataset_fingerprint(path, storage_dir, fingerprints)
     except Exception:
         return "unknown"
 
 
-def _compute_reasoning_signature(dataset_path: str, results: Dict[str, Any]) -> Dict[str, Any]:
+def _compute_reasoning_signature(dataset_path: str, results: Dict[str, Any], storage_dir: str | None = None, fingerprints: FingerprintCache | None = None) -> Dict[str, Any]:
     """Create a deterministic signature of reasoning outcomes.
 
     Signature includes: dataset hash, supported/rejected hypothesis IDs, dominant explanation.
     """
-    dataset_hash = _hash_dataset(dataset_path)
+    dataset_hash = _hash_dataset(dataset_path, storage_dir, fingerprints)
     nodes = results.get('nodes', [])
     supported_ids = sorted([n.hypothesis_id for n in nodes if n.result == 'supported'])
     rejected_ids = sorted([n.hypothesis_id for n in nodes if n.result == 'unsupported'])
@@ -64,42 +58,45 @@ def _compute_reasoning_signature(dataset_path: str, results: Dict[str, Any]) ->
     }
 
 
-def compare_with_history(current_signature: Dict[str, Any], storage_dir: str) -> Dict[str, Any]:
+def load_history(storage_dir: str, catalog: RunCatalog | None = None) -> Dict[str, Any]:
+    """Snapshot the prior runs that history comparisons look at.
+
+    Batch runs load this once and share it, so every dataset in the batch
+    is compared against the same history regardless of scheduling.
+    `catalog` is an open catalog of `storage_dir` to query instead of
+    opening one.
+    """
+    latest_prior = _latest_run(storage_dir, with_dataset=True, catalog=catalog)
+    if latest_prior is not None and not latest_prior.get('dataset_hash'):
+        # Runs persisted before hashes were recorded fall back to the (cached) file hash
+        latest_prior['dataset_hash'] = _hash_dataset(latest_prior['dataset_path'], storage_dir)
+    return {'latest_run': _latest_run(storage_dir, catalog=catalog), 'latest_prior': latest_prior}
+
+
+def compare_with_history(current_signature: Dict[str, Any], storage_dir: str, history: Dict[str, Any] | None = None, catalog: RunCatalog | None = None) -> Dict[str, Any]:
     """Compare current reasoning signature against prior runs.
 
     Returns a structured comparison result with consistency status and explanation.
+    `history` is a `load_history` snapshot; it is loaded here when omitted,
+    through `catalog` if given.
     """
-    runs = _load_runs(storage_dir)
-    if not runs:
+    if history is None:
+        history = load_history(storage_dir, catalog)
+    if history['latest_run'] is None:
         return {
             'has_history': False,
             'status': 'no_prior_runs',
             'message': 'No prior reasoning runs found.',
         }
-    # Load and compute signatures for prior runs
-    prior_sigs = []
-    for run in runs:
-        dataset_path = run.get('dataset_path')
-        if dataset_path:
-            # Recompute signature from stored results
-            sig_data = {
-                'dataset_hash': _hash_dataset(dataset_path),
-                'supported_ids': sorted([n['hypothesis_id'] for n in run.get('results', {}).get('nodes', []) if n.get('result') == 'supported']),
-                'rejected_ids': sorted([n['hypothesis_id'] for n in run.get('results', {}).get('nodes', []) if n.get('result') == 'unsupported']),
-            }
-            dominant = max((n for n in run.get('results', {}).get('nodes', [])), key=lambda x: x.get('score', 0), default=None)
-            if dominant:
-                sig_data['dominant_hypothesis'] = dominant['hypothesis_id']
-                sig_data['dominant_score'] = dominant['score']
-            prior_sigs.append(sig_data)
-    if not prior_sigs:
+    # Signatures of prior runs come from the run catalog, not the JSON files
+    latest_prior = history['latest_prior']
+    if latest_prior is None:
         return {
             'has_history': False,
             'status': 'no_valid_history',
             'message': 'No valid prior reasoning could be reconstructed.',
         }
     # Compare current with latest prior
-    latest_prior = prior_sigs[-1]
     dataset_match = current_signature['dataset_hash'] == latest_prior.get('dataset_hash')
     if not dataset_match:
         return {
@@ -149,12 +146,11 @@ def detect_contradictions(current_results: Dict[str, Any], storage_dir: str) ->
 
     Simple rule: if a hypothesis id was 'supported' in prior run and now 'unsupported', flag it.
     """
-    runs = _load_runs(storage_dir)
+    latest_prior = _latest_run(storage_dir)
     report: Dict[str, Any] = {"contradictions": []}
-    if not runs:
+    if latest_prior is None:
         return report
-    latest_prior = runs[-1]
-    prior_nodes = {n['hypothesis_id']: n['result'] for n in latest_prior.get('results', {}).get('nodes', [])}
+    prior_nodes = latest_prior['node_results']
     current_nodes = {n.hypothesis_id: n.result for n in current_results.get('nodes', [])}
     for hid, prior_result in prior_nodes.items():
         cur = current_nodes.get(hid)
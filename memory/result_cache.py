@@ -0,0 +1,147 @@
+"""
+Content-addressed cache of reasoning results for unchanged inputs.
+Entries are keyed by dataset fingerprint, engine version and config hash.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, List, Tuple
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from data_thought_engine import __version__
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.observation.signals import Signal, pack_signals, unpack_signals
+from data_thought_engine.reasoning.node import Node
+
+CACHE_DIRNAME = "cache"
+DEFAULT_CACHE_MAX_BYTES = 256 << 20
+DEFAULT_CACHE_MAX_AGE = 30 * 24 * 3600
+# Config fields that never change results, so they stay out of the key
+_RESULT_NEUTRAL = ("backend", "workers", "reader", "store", "result_cache", "columnar_cache")
+
+
+def cache_key(dataset_hash: str, config: EngineConfig) -> str:
+    """Return the cache key for a dataset fingerprint under an engine config."""
+    settings = {k: v for k, v in sorted(asdict(config).items()) if k not in _RESULT_NEUTRAL}
+    blob = json.dumps({"dataset": dataset_hash, "version": __version__, "config": settings}, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+
+class ResultCache:
+    """Stored evaluation results and signals, one JSON file per key.
+
+    A hit refreshes the entry's modification time, so eviction drops entries
+    unused for `max_age` seconds and then the least recently used ones until
+    the cache fits in `max_bytes`. With `memory_entries` > 0 the most
+    recently used entries are also held in memory, so a long-lived process
+    answers repeated requests without reading the entry file.
+    """
+
+    def __init__(self, storage_dir: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES, max_age: float = DEFAULT_CACHE_MAX_AGE, memory_entries: int = 0) -> None:
+        self.dir = os.path.join(storage_dir, CACHE_DIRNAME)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Tuple[Dict[str, Any], List[Signal]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, value: Tuple[Dict[str, Any], List[Signal]]) -> None:
+        if self.memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.dir, f"{key}.json")
+
+    def get(self, key: str) -> Tuple[Dict[str, Any], List[Signal]] | None:
+        """Return (results, signals) rebuilt from the entry, or None on a miss."""
+        path = self._path(key)
+        with self._lock:
+            warm = self._memory.get(key)
+            if warm is not None:
+                self._memory.move_to_end(key)
+        if warm is not None and os.path.exists(path):
+            os.utime(path)
+            results, signals = warm
+            return dict(results), list(signals)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+            os.utime(path)
+        except Exception:
+            return None
+        results = {
+            "nodes": [Node(**{**n, "test": sys.intern(n["test"]), "result": sys.intern(n["result"])}) for n in entry["nodes"]],
+            "summary": entry["summary"],
+        }
+        if "rejected_cycles" in entry:
+            results["rejected_cycles"] = entry["rejected_cycles"]
+        signals = unpack_signals(entry["signals"], entry.get("metrics", {}))
+        self._remember(key, (results, signals))
+        return dict(results), list(signals)
+
+    def put(self, key: str, results: Dict[str, Any], signals: List[Signal]) -> None:
+        """Store results and signals atomically, then evict old entries.
+
+        Column metrics shared by several signals are written once.
+        """
+        records, metrics = pack_signals(signals)
+        entry = {
+            "nodes": [asdict(n) for n in results.get("nodes", [])],
+            "summary": results.get("summary"),
+            "signals": records,
+            "metrics": metrics,
+        }
+        if "rejected_cycles" in results:
+            entry["rejected_cycles"] = results["rejected_cycles"]
+        os.makedirs(self.dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".entry-", dir=self.dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(entry, fh, default=str)
+        os.replace(tmp, self._path(key))
+        warm = {"nodes": list(results.get("nodes", [])), "summary": results.get("summary")}
+        if "rejected_cycles" in results:
+            warm["rejected_cycles"] = results["rejected_cycles"]
+        self._remember(key, (warm, list(signals)))
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries, then the oldest until under the size limit.
+
+        Returns how many entries were removed.
+        """
+        entries = []
+        for name in os.listdir(self.dir) if os.path.isdir(self.dir) else []:
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            if now - mtime <= self.max_age and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,201 @@
+"""
+SQLite run store keeping runs, nodes and signals in normalized tables.
+An alternative to one JSON file per run; payloads round-trip unchanged.
+"""
+from __future__ import annotations
+
+from contextlib import closing
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+import collections
+import itertools
+import json
+import os
+import sqlite3
+
+from data_thought_engine.observation.signals import Signal, pack_signals, unpack_signals
+
+DATABASE_FILENAME = "runs.sqlite3"
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        start_time TEXT,
+        dataset_path TEXT,
+        dataset_hash TEXT,
+        summary TEXT,
+        narrative TEXT,
+        timings TEXT,
+        rejected_cycles TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS nodes (
+        run_id TEXT NOT NULL REFERENCES runs(run_id),
+        position INTEGER NOT NULL,
+        id TEXT,
+        hypothesis_id TEXT,
+        test TEXT,
+        result TEXT,
+        score REAL,
+        details TEXT,
+        PRIMARY KEY (run_id, position)
+    )""",
+    """CREATE TABLE IF NOT EXISTS signals (
+        run_id TEXT NOT NULL REFERENCES runs(run_id),
+        position INTEGER NOT NULL,
+        id TEXT,
+        kind TEXT,
+        column_name TEXT,
+        score REAL,
+        details TEXT,
+        PRIMARY KEY (run_id, position)
+    )""",
+    """CREATE TABLE IF NOT EXISTS column_metrics (
+        run_id TEXT NOT NULL REFERENCES runs(run_id),
+        column_name TEXT NOT NULL,
+        metrics TEXT,
+        PRIMARY KEY (run_id, column_name)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS runs_dataset_hash ON runs(dataset_hash)",
+    "CREATE INDEX IF NOT EXISTS nodes_hypothesis_id ON nodes(hypothesis_id)",
+)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+class SqliteRunStore:
+    """Persist runs into `runs.sqlite3` inside the storage directory.
+
+    The database runs in WAL mode so readers never block the writer, and
+    each run is written in one transaction with batched node and signal
+    inserts. Nested values are stored as JSON text exactly as the JSON store
+    would serialize them, so `load` returns the same payload. Metrics that
+    several signals of a column share are stored once per run in
+    `column_metrics`, and those signals leave `details` NULL.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, storage_dir: str) -> None:
+        self.storage_dir = storage_dir
+        self.path = os.path.join(storage_dir, DATABASE_FILENAME)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def catalog_key(self, run_id: str) -> str:
+        return run_id
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(self.storage_dir, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        # Databases created before runs recorded timings or rejected
+        # cycles lack those columns
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+        for column in ("timings", "rejected_cycles"):
+            if column in columns:
+                continue
+            try:
+                conn.execute(f"ALTER TABLE runs ADD COLUMN {column} TEXT")
+            except sqlite3.OperationalError:
+                pass  # another process added it first
+        return conn
+
+    def persist(self, run_id: str, payload: Dict[str, Any], signals: Sequence[Signal] = ()) -> Tuple[str, str]:
+        """Store one run payload (and its signals) and return (database path, run id).
+
+        If another process already stored a run with the same id, a numeric
+        suffix keeps both records.
+        """
+        results = payload.get("results", {})
+        with closing(self._connect()) as conn, conn:
+            base_id = run_id
+            for attempt in itertools.count():
+                run_id = base_id if attempt == 0 else f"{base_id}-{attempt}"
+                try:
+                    conn.execute(
+                        "INSERT INTO runs (run_id, start_time, dataset_path, dataset_hash, summary, narrative, timings, rejected_cycles) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (run_id, payload.get("start_time"), payload.get("dataset_path"), payload.get("dataset_hash"), _dumps(results.get("summary")), payload.get("narrative"), _dumps(payload["timings"]) if "timings" in payload else None, _dumps(results["rejected_cycles"]) if "rejected_cycles" in results else None),
+                    )
+                except sqlite3.IntegrityError:
+                    continue
+                break
+            conn.executemany(
+                "INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, i, n["id"], n["hypothesis_id"], n["test"], n["result"], n["score"], _dumps(n["details"])) for i, n in enumerate(results.get("nodes", []))],
+            )
+            records, metrics = pack_signals(signals)
+            # Metrics used by a single signal are cheaper to keep inline
+            users = collections.Counter(r["column"] for r in records if "details" not in r)
+            for r in records:
+                if "details" not in r and users[r["column"]] == 1:
+                    r["details"] = {"metrics": metrics.pop(r["column"])}
+            conn.executemany(
+                "INSERT INTO column_metrics VALUES (?, ?, ?)",
+                [(run_id, column, _dumps(values)) for column, values in metrics.items()],
+            )
+            conn.executemany(
+                "INSERT INTO signals VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, i, r["id"], r["kind"], r["column"], r["score"], _dumps(r["details"]) if "details" in r else None) for i, r in enumerate(records)],
+            )
+        return self.path, self.catalog_key(run_id)
+
+    def run_ids(self) -> List[str]:
+        """Return every stored run id in chronological order."""
+        if not self.exists():
+            return []
+        with closing(self._connect()) as conn:
+            return [r[0] for r in conn.execute("SELECT run_id FROM runs ORDER BY run_id")]
+
+    def load(self, run_id: str) -> Dict[str, Any]:
+        """Rebuild the payload of one run as the JSON store would have written it."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT start_time, dataset_path, dataset_hash, summary, narrative, timings, rejected_cycles FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"Unknown run: {run_id}")
+            nodes = conn.execute("SELECT id, hypothesis_id, test, result, score, details FROM nodes WHERE run_id = ? ORDER BY position", (run_id,)).fetchall()
+        start_time, dataset_path, dataset_hash, summary, narrative, timings, rejected_cycles = row
+        payload = {
+            "start_time": start_time,
+            "dataset_path": dataset_path,
+            "dataset_hash": dataset_hash,
+            "results": {
+                "summary": json.loads(summary),
+                "nodes": [{
+                    "id": node_id,
+                    "hypothesis_id": hypothesis_id,
+                    "test": test,
+                    "result": result,
+                    "score": score,
+                    "details": json.loads(details),
+                } for node_id, hypothesis_id, test, result, score, details in nodes],
+            },
+            "narrative": narrative,
+        }
+        if rejected_cycles is not None:
+            payload["results"]["rejected_cycles"] = json.loads(rejected_cycles)
+        if timings is not None:
+            payload["timings"] = json.loads(timings)
+        return payload
+
+    def signals(self, run_id: str) -> List[Signal]:
+        """Return the signals stored with a run, in their original order."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT id, kind, column_name, score, details FROM signals WHERE run_id = ? ORDER BY position", (run_id,)).fetchall()
+            metrics = {column: json.loads(values) for column, values in conn.execute("SELECT column_name, metrics FROM column_metrics WHERE run_id = ?", (run_id,))}
+        records = []
+        for signal_id, kind, column, score, details in rows:
+            record = {"id": signal_id, "kind": kind, "column": column, "score": score}
+            if details is not None:
+                record["details"] = json.loads(details)
+            records.append(record)
+        return unpack_signals(records, metrics)
+
+    def payloads(self) -> Iterator[tuple]:
+        """Yield (run_id, payload) for every stored run in chronological order."""
+        for run_id in self.run_ids():
+            yield run_id, self.load(run_id)
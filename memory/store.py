@@ -1,33 +1,39 @@
 """
-Persist reasoning results and narrative as JSON files for replay and audit.
+Persist reasoning results and narrative for replay and audit.
+Runs go to one JSON file each by default, or to a SQLite database.
 """
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence, Tuple
+import itertools
 import json
 import os
 from datetime import datetime
 from data_thought_engine.core.context import Context
+from data_thought_engine.memory.catalog import open_catalog
+from data_thought_engine.memory.sqlite_store import SqliteRunStore
+from data_thought_engine.observation.signals import Signal
 
 
 def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def persist_run(results: Dict[str, Any], narrative: str, context: Context, storage_dir: str | None = None) -> str:
-    """Persist results and narrative to a JSON file and return its path.
+def run_id_for(context: Context) -> str:
+    """Return the deterministic run id derived from the context start time."""
+    return f"run_{context.start_time.isoformat().replace(':', '-')}"
 
-    Uses deterministic filename based on the context start time to avoid
-    random identifiers.
+
+def build_payload(results: Dict[str, Any], narrative: str, context: Context, dataset_hash: str | None = None, timings: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """Return the JSON-ready record of one run shared by every store.
+
+    Instrumented runs carry a `timings` section keyed by stage, and runs
+    that rejected circular hypotheses list them under `rejected_cycles`.
     """
-    base = storage_dir or os.path.join(os.getcwd(), "dte_runs")
-    _ensure_dir(base)
-    ts = context.start_time.isoformat().replace(":", "-")
-    fname = f"run_{ts}.json"
-    path = os.path.join(base, fname)
     payload = {
         "start_time": context.start_time.isoformat(),
         "dataset_path": context.dataset_path,
+        "dataset_hash": dataset_hash,
         "results": {
             "summary": results.get("summary"),
             "nodes": [{
@@ -41,6 +47,82 @@ def persist_run(results: Dict[str, Any], narrative: str, context: Context, stora
         },
         "narrative": narrative,
     }
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2, default=str)
-    return path
+    if results.get("rejected_cycles"):
+        payload["results"]["rejected_cycles"] = results["rejected_cycles"]
+    if timings is not None:
+        payload["timings"] = timings
+    # Normalize to plain JSON values so every store records the same thing
+    return json.loads(json.dumps(payload, default=str))
+
+
+class JsonRunStore:
+    """Write each run to its own pretty-printed `run_<timestamp>.json` file."""
+
+    name = "json"
+
+    def __init__(self, storage_dir: str) -> None:
+        self.storage_dir = storage_dir
+
+    def catalog_key(self, run_id: str) -> str:
+        return f"{run_id}.json"
+
+    def persist(self, run_id: str, payload: Dict[str, Any], signals: Sequence[Signal] = ()) -> Tuple[str, str]:
+        """Write the run and return (path, catalog key).
+
+        Files are created exclusively; if another process already wrote a run
+        with the same id, a numeric suffix keeps both records.
+        """
+        _ensure_dir(self.storage_dir)
+        for attempt in itertools.count():
+            key = self.catalog_key(run_id if attempt == 0 else f"{run_id}-{attempt}")
+            path = os.path.join(self.storage_dir, key)
+            try:
+                fh = open(path, "x", encoding="utf-8")
+            except FileExistsError:
+                continue
+            with fh:
+                # One write of the whole text: json.dump would issue one per token
+                fh.write(json.dumps(payload, indent=2, default=str))
+            return path, key
+
+
+def get_store(name: str, storage_dir: str):
+    """Return the run store called `name` rooted at `storage_dir`."""
+    if name == "json":
+        return JsonRunStore(storage_dir)
+    if name == "sqlite":
+        return SqliteRunStore(storage_dir)
+    raise ValueError(f"Unknown run store: {name}")
+
+
+def persist_run(results: Dict[str, Any], narrative: str, context: Context, storage_dir: str | None = None, dataset_hash: str | None = None, store: str = "json", signals: Sequence[Signal] = (), timings: Dict[str, Any] | None = None) -> str:
+    """Persist results and narrative and return where the run was written.
+
+    Uses deterministic run ids based on the context start time to avoid
+    random identifiers. `dataset_hash` is recorded so later history checks
+    never need to rehash this run's dataset. The run is also added to the
+    run catalog that history lookups read from, whichever store holds it.
+    Only the SQLite store keeps `signals`; JSON files are unchanged.
+    `timings` from an instrumented run are stored alongside the results.
+    """
+    base = storage_dir or os.path.join(os.getcwd(), "dte_runs")
+    _ensure_dir(base)
+    run_id = run_id_for(context)
+    payload = build_payload(results, narrative, context, dataset_hash, timings)
+    backend = get_store(store, base)
+    location, key = backend.persist(run_id, payload, signals)
+    open_catalog(base).record(key, payload, backend.name)
+    return location
+
+
+def export_sqlite_runs(storage_dir: str, out_dir: str) -> List[str]:
+    """Export every SQLite-stored run as the JSON file the JSON store would write.
+
+    Files written to `out_dir` are byte-identical to a JSON-store run of the
+    same payload. Returns the written paths. Exporting into `storage_dir`
+    itself would make history see each run twice, so it is refused.
+    """
+    if os.path.realpath(out_dir) == os.path.realpath(storage_dir):
+        raise ValueError("Export directory must differ from the run storage directory")
+    target = JsonRunStore(out_dir)
+    return [target.persist(run_id, payload)[0] for run_id, payload in SqliteRunStore(storage_dir).payloads()]
@@ -0,0 +1,193 @@
+"""
+Streaming, mergeable per-column accumulators used by the detectors.
+State grows with the number of columns, not rows, so the whole file is observed.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List
+
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.ingestion.columns import ColumnChunk
+from data_thought_engine.observation.registry import compile_plan
+from data_thought_engine.utils import stats
+from data_thought_engine.utils.backend import get_backend
+from data_thought_engine.utils.sketches import EntropySketch, QuantileSketch
+
+
+def _sign(diff: float) -> int:
+    return 0 if diff == 0 else (1 if diff > 0 else -1)
+
+
+def _is_change(x: int | None, y: int | None) -> int:
+    return 1 if x and y and x != y else 0
+
+
+class ColumnAccumulator:
+    """Running state for one column: moments, value counts and trend breaks.
+
+    Chunks are folded in by building a partial accumulator and merging it,
+    so serial and sharded runs apply the same arithmetic in the same order.
+    Chunk kernels come from the configured compute backend. Moments are
+    exact two-pass sums within a chunk combined with Chan's parallel form
+    of Welford's update across chunks;
+    the median comes from a deterministic quantile sketch. Value counts are
+    exact until a column passes `config.entropy_exact_limit` distinct values,
+    after which they move into an EntropySketch.
+    """
+
+    def __init__(self, name: str, kind: str = "categorical", config: EngineConfig | None = None) -> None:
+        self.name = name
+        self.kind = kind
+        self.config = config or EngineConfig()
+        self.rows = 0
+        self.counts: Dict[str, int] | None = {}
+        self.entropy_sketch: EntropySketch | None = None
+        # numeric moments
+        self.n = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.quantiles = QuantileSketch(self.config.median_sketch_k, get_backend(self.config.backend).sort)
+        # monotonic state: boundary values and signs of the first/last differences
+        self.first = 0.0
+        self.last = 0.0
+        self.first_sign: int | None = None
+        self.last_sign: int | None = None
+        self.changes = 0
+
+    @classmethod
+    def from_chunk(cls, chunk: ColumnChunk, config: EngineConfig | None = None) -> "ColumnAccumulator":
+        acc = cls(chunk.name, chunk.kind, config)
+        acc.rows = chunk.size
+        backend = get_backend(acc.config.backend)
+        acc.counts = dict(zip(chunk.categories, backend.value_counts(chunk.codes, len(chunk.categories))))
+        if len(acc.counts) > acc.config.entropy_exact_limit:
+            acc._estimate_entropy()
+        nums = chunk.numbers
+        if not nums:
+            return acc
+        acc.n = len(nums)
+        acc.total, acc.mean, acc.m2 = backend.moments(nums)
+        acc.quantiles.extend(nums)
+        acc.first = nums[0]
+        acc.last = nums[-1]
+        acc.first_sign, acc.last_sign, acc.changes = backend.sign_changes(nums)
+        return acc
+
+    def update(self, chunk: ColumnChunk) -> None:
+        self.merge(ColumnAccumulator.from_chunk(chunk, self.config))
+
+    def merge(self, other: "ColumnAccumulator") -> None:
+        """Fold `other`, which covers the rows right after this one, into self."""
+        self.rows += other.rows
+        self._merge_counts(other)
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.total, self.mean, self.m2 = other.n, other.total, other.mean, other.m2
+            self.quantiles.merge(other.quantiles)
+            self.first, self.last = other.first, other.last
+            self.first_sign, self.last_sign, self.changes = other.first_sign, other.last_sign, other.changes
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.total += other.total
+        self.quantiles.merge(other.quantiles)
+        boundary = _sign(other.first - self.last)
+        self.changes += other.changes + _is_change(self.last_sign, boundary) + _is_change(boundary, other.first_sign)
+        if self.first_sign is None:
+            self.first_sign = boundary
+        self.last_sign = other.last_sign if other.last_sign is not None else boundary
+        self.last = other.last
+        self.n = n
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the full state as JSON-ready values, for checkpoints.
+
+        Count dicts keep their insertion order, which entropy sums depend on.
+        """
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "rows": self.rows,
+            "counts": None if self.counts is None else dict(self.counts),
+            "entropy_sketch": None if self.entropy_sketch is None else self.entropy_sketch.to_dict(),
+            "n": self.n,
+            "total": self.total,
+            "mean": self.mean,
+            "m2": self.m2,
+            "quantiles": self.quantiles.to_dict(),
+            "first": self.first,
+            "last": self.last,
+            "first_sign": self.first_sign,
+            "last_sign": self.last_sign,
+            "changes": self.changes,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any], config: EngineConfig | None = None) -> "ColumnAccumulator":
+        acc = cls(state["name"], state["kind"], config)
+        acc.rows = state["rows"]
+        acc.counts = None if state["counts"] is None else dict(state["counts"])
+        if state["entropy_sketch"] is not None:
+            acc.entropy_sketch = EntropySketch.from_dict(state["entropy_sketch"])
+        acc.n, acc.total, acc.mean, acc.m2 = state["n"], state["total"], state["mean"], state["m2"]
+        acc.quantiles = QuantileSketch.from_dict(state["quantiles"], get_backend(acc.config.backend).sort)
+        acc.first, acc.last = state["first"], state["last"]
+        acc.first_sign, acc.last_sign, acc.changes = state["first_sign"], state["last_sign"], state["changes"]
+        return acc
+
+    def _merge_counts(self, other: "ColumnAccumulator") -> None:
+        if self.entropy_sketch is None and other.entropy_sketch is None:
+            counts = self.counts
+            for value, c in other.counts.items():
+                counts[value] = counts.get(value, 0) + c
+            if len(counts) > self.config.entropy_exact_limit:
+                self._estimate_entropy()
+            return
+        if self.entropy_sketch is None:
+            self._estimate_entropy()
+        if other.entropy_sketch is None:
+            for value, c in other.counts.items():
+                self.entropy_sketch.add(value, c)
+        else:
+            self.entropy_sketch.merge(other.entropy_sketch)
+
+    def _estimate_entropy(self) -> None:
+        # Switch to bounded memory once the column looks ID-like
+        sketch = EntropySketch(self.config.heavy_hitters)
+        for value, c in self.counts.items():
+            sketch.add(value, c)
+        self.entropy_sketch = sketch
+        self.counts = None
+
+    def entropy(self) -> float:
+        if self.entropy_sketch is not None:
+            return self.entropy_sketch.entropy(self.rows)
+        return stats.entropy_from_counts(self.counts.values(), self.rows)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return the same metrics dict that `column_metrics` builds from a list.
+
+        `entropy_mode` records whether the entropy is exact or estimated.
+        """
+        return compile_plan([], ["summary"]).metric_values(self)["summary"]
+
+
+def accumulate_batches(batches: Iterable[List[ColumnChunk]], config: EngineConfig | None = None, accumulators: Dict[str, ColumnAccumulator] | None = None) -> Dict[str, ColumnAccumulator]:
+    """Fold every batch into one accumulator per column, in column order.
+
+    Passing the `accumulators` of earlier batches continues that state, as if
+    all batches had been folded in one call.
+    """
+    accumulators = {} if accumulators is None else accumulators
+    for batch in batches:
+        for chunk in batch:
+            acc = accumulators.get(chunk.name)
+            if acc is None:
+                accumulators[chunk.name] = ColumnAccumulator.from_chunk(chunk, config)
+            else:
+                acc.update(chunk)
+    return accumulators
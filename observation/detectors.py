@@ -1,12 +1,17 @@
 """
 Logic-only detectors for variance spikes, monotonic breaks, and distribution shifts.
-These functions operate deterministically on column value sequences.
+The list-based functions are an independent reference for the accumulator path,
+where registered detectors run through a fused per-column metric plan.
 """
 from __future__ import annotations
 
-from typing import Iterable, Dict, List
+from typing import Any, Iterable, Iterator, Dict, List, Sequence
+import itertools
 from data_thought_engine.observation.signals import make_signal, Signal
 from data_thought_engine.observation.metrics import column_metrics
+from data_thought_engine.observation.registry import compile_plan, register_detector
+from data_thought_engine.observation.accumulators import ColumnAccumulator, accumulate_batches
+from data_thought_engine.ingestion.columns import ColumnChunk, build_chunk
 from data_thought_engine.core.context import Context
 
 
@@ -14,37 +19,21 @@ def _as_list(values: Iterable[str]) -> List[str]:
     return [v for v in values]
 
 
-def detect_variance_spike(column: str, values: Iterable[str]) -> Signal | None:
-    """Detect a variance spike when variance substantially exceeds squared mean.
-
-    Rationale: large variance relative to mean magnitude suggests instability.
-    """
-    vals = _as_list(values)
-    metrics = column_metrics(vals)
-    var = metrics.get("variance")
-    mean = metrics.get("mean")
+@register_detector("variance_spike", needs=("summary",))
+def _variance_signal(column: str, metrics: Dict[str, Any]) -> Signal | None:
+    summary = metrics["summary"]
+    var = summary.get("variance")
+    mean = summary.get("mean")
     if var is None or mean is None:
         return None
     # Deterministic threshold: variance > 4 * mean^2
     if var > 4.0 * (mean ** 2):
         score = var / (mean ** 2 + 1e-12)
-        return make_signal("variance_spike", column, float(score), {"metrics": metrics})
+        return make_signal("variance_spike", column, float(score), {"metrics": summary})
     return None
 
 
-def detect_monotonic_break(column: str, values: Iterable[str]) -> Signal | None:
-    """Detect monotonic trend breaks: look for a sustained direction change.
-
-    Rationale: monotonic flows that change direction indicate structural shift.
-    """
-    nums: List[float] = []
-    for v in values:
-        try:
-            nums.append(float(v))
-        except Exception:
-            continue
-    if len(nums) < 3:
-        return None
+def _sign_changes(nums: Sequence[float]) -> int:
     # compute differences signs
     signs: List[int] = []
     for a, b in zip(nums, nums[1:]):
@@ -55,50 +44,106 @@ def detect_monotonic_break(column: str, values: Iterable[str]) -> Signal | None:
     for x, y in zip(signs, signs[1:]):
         if x != 0 and y != 0 and x != y:
             changes += 1
+    return changes
+
+
+@register_detector("monotonic_break", needs=("numeric_count", "sign_changes"))
+def _monotonic_signal(column: str, metrics: Dict[str, Any]) -> Signal | None:
+    if metrics["numeric_count"] < 3:
+        return None
+    changes = metrics["sign_changes"]
     if changes >= 1:
         score = float(changes)
         return make_signal("monotonic_break", column, score, {"changes": changes})
     return None
 
 
-def detect_distribution_shift(column: str, values: Iterable[str]) -> Signal | None:
-    """Detect distribution shift via entropy extremes.
-
-    Rationale: extremely low or high entropy may indicate a shift worth exploring.
-    """
-    vals = _as_list(values)
-    metrics = column_metrics(vals)
-    ent = metrics.get("entropy")
+@register_detector("distribution_shift", needs=("summary",))
+def _distribution_signal(column: str, metrics: Dict[str, Any]) -> Signal | None:
+    summary = metrics["summary"]
+    ent = summary.get("entropy")
     if ent is None:
         return None
     # Deterministic thresholds: low entropy < 0.5 bits, high entropy > 4 bits
     if ent < 0.5:
-        return make_signal("distribution_low_entropy", column, float(0.5 - ent), {"metrics": metrics})
+        return make_signal("distribution_low_entropy", column, float(0.5 - ent), {"metrics": summary})
     if ent > 4.0:
-        return make_signal("distribution_high_entropy", column, float(ent - 4.0), {"metrics": metrics})
+        return make_signal("distribution_high_entropy", column, float(ent - 4.0), {"metrics": summary})
     return None
 
 
-def detect_signals(rows: Iterable[Dict[str, str]], context: Context) -> List[Signal]:
-    """Top-level detector that consumes streamed rows and returns Signals.
+def detect_variance_spike(column: str, values: Iterable[str]) -> Signal | None:
+    """Detect a variance spike when variance substantially exceeds squared mean.
 
-    For simplicity and determinism we collect modest per-column lists; this
-    keeps logic clear while remaining memory-conscious for typical datasets.
+    Rationale: large variance relative to mean magnitude suggests instability.
     """
-    # Collect values per column up to a reasonable limit
-    collectors: Dict[str, List[str]] = {}
-    max_collect = 1000
-    count = 0
-    for row in rows:
-        for k, v in row.items():
-            collectors.setdefault(k, []).append(v)
-        count += 1
-        if count >= max_collect:
-            break
+    vals = _as_list(values)
+    return _variance_signal(column, {"summary": column_metrics(vals)})
+
+
+def detect_monotonic_break(column: str, values: Iterable[str]) -> Signal | None:
+    """Detect monotonic trend breaks: look for a sustained direction change.
+
+    Rationale: monotonic flows that change direction indicate structural shift.
+    """
+    nums: List[float] = []
+    for v in values:
+        try:
+            nums.append(float(v))
+        except Exception:
+            continue
+    if len(nums) < 3:
+        return None
+    return _monotonic_signal(column, {"numeric_count": len(nums), "sign_changes": _sign_changes(nums)})
+
+
+def detect_distribution_shift(column: str, values: Iterable[str]) -> Signal | None:
+    """Detect distribution shift via entropy extremes.
+
+    Rationale: extremely low or high entropy may indicate a shift worth exploring.
+    """
+    vals = _as_list(values)
+    return _distribution_signal(column, {"summary": column_metrics(vals)})
+
+
+def signals_from_accumulators(accumulators: Dict[str, ColumnAccumulator], detectors: Sequence[str] | None = None) -> List[Signal]:
+    """Run the registered detectors (or the named ones) over finished accumulators.
+
+    The detectors are compiled into one plan, so each metric is computed
+    once per column however many detectors read it. Signals are ordered by
+    column, then by detector.
+    """
+    plan = compile_plan(detectors)
     signals: List[Signal] = []
-    for col, vals in collectors.items():
-        for detector in (detect_variance_spike, detect_monotonic_break, detect_distribution_shift):
-            sig = detector(col, vals)
-            if sig is not None:
-                signals.append(sig)
+    for col, acc in accumulators.items():
+        signals.extend(plan.run(col, acc))
     return signals
+
+
+def _row_batches(rows: Iterable[Dict[str, str]], batch_size: int) -> Iterator[List[ColumnChunk]]:
+    it = iter(rows)
+    while True:
+        block = list(itertools.islice(it, batch_size))
+        if not block:
+            return
+        yield [build_chunk(k, "categorical", (row.get(k, "") for row in block)) for k in block[0]]
+
+
+def detect_signals(rows: Iterable[Dict[str, str]], context: Context) -> List[Signal]:
+    """Top-level detector that consumes streamed rows and returns Signals.
+
+    Rows are folded into constant-memory column accumulators, so every row
+    of the dataset contributes. The per-detector list functions above remain
+    the reference implementation for small inputs.
+    """
+    config = context.config
+    return signals_from_accumulators(accumulate_batches(_row_batches(rows, config.batch_size), config))
+
+
+def detect_signals_columnar(batches: Iterable[List[ColumnChunk]], context: Context) -> List[Signal]:
+    """Batch-mode counterpart of `detect_signals` consuming typed column chunks.
+
+    Numbers arrive already parsed and categorical values as codes, so no
+    value is converted twice; signals match the row-based path.
+    """
+    return signals_from_accumulators(accumulate_batches(batches, context.config))
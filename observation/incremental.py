@@ -0,0 +1,107 @@
+"""
+Incremental observation of append-only CSVs from a persisted checkpoint.
+Only bytes past the checkpoint are parsed; results match a full rescan.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+import csv
+import hashlib
+import io
+import os
+
+from data_thought_engine.core.context import Context
+from data_thought_engine.ingestion.columns import build_chunk, column_kind
+from data_thought_engine.ingestion.loader import SCHEMA_SAMPLE_ROWS, schema_for_records, validate_schema
+from data_thought_engine.ingestion.ranges import header_end
+from data_thought_engine.ingestion.stream import OffsetRecords, column_blocks
+from data_thought_engine.memory.checkpoint import Checkpoint, config_key, hash_range, load_checkpoint, save_checkpoint
+from data_thought_engine.observation.accumulators import ColumnAccumulator, accumulate_batches
+from data_thought_engine.observation.detectors import signals_from_accumulators
+from data_thought_engine.observation.signals import Signal
+from data_thought_engine.utils.checks import assert_path_exists
+
+
+def _can_resume(checkpoint: Checkpoint | None, header_hash: str, size: int, context: Context) -> bool:
+    return (
+        checkpoint is not None
+        and checkpoint.header_hash == header_hash
+        and checkpoint.config_key == config_key(context.config)
+        and checkpoint.offset <= size
+    )
+
+
+def detect_signals_incremental(context: Context, storage_dir: str) -> Tuple[Dict[str, str], List[Signal]]:
+    """Observe the dataset, resuming from its checkpoint when the prefix is intact.
+
+    The checkpoint is reused only if the header, the engine config and the
+    hash of every byte it covers are unchanged; otherwise the file is scanned
+    from the start. Either way a new checkpoint is saved at the last full
+    batch, and the trailing partial batch is parsed again next time so that
+    batches always line up with those of a full scan. Returns the schema and
+    the signals.
+    """
+    path = context.dataset_path
+    config = context.config
+    assert_path_exists(path)
+    size = os.path.getsize(path)
+    data_start = header_end(path)
+    with open(path, "rb") as fh:
+        header_bytes = fh.read(data_start)
+        header = next(csv.reader(io.StringIO(header_bytes.decode("utf-8"), newline="")), None)
+        if header is None:
+            raise ValueError("CSV file has no header row")
+        header_hash = hashlib.sha256(header_bytes).hexdigest()
+        checkpoint = load_checkpoint(storage_dir, path)
+        hasher = hashlib.sha256()
+        hashed = 0
+        resumed = False
+        if _can_resume(checkpoint, header_hash, size, context):
+            hash_range(hasher, fh, 0, checkpoint.offset)
+            hashed = checkpoint.offset
+            resumed = hasher.hexdigest() == checkpoint.prefix_hash
+        if resumed:
+            schema = checkpoint.schema
+            validate_schema(schema, context)
+            accumulators = {state["name"]: ColumnAccumulator.from_dict(state, config) for state in checkpoint.accumulators}
+            records = OffsetRecords(fh, checkpoint.offset, len(header))
+            stream = iter(records)
+            rows = checkpoint.rows
+        else:
+            accumulators = {}
+            records = OffsetRecords(fh, data_start, len(header))
+            schema, stream = schema_for_records(header, records, context)
+            rows = 0
+        kinds = [column_kind(schema.get(name)) for name in header]
+        boundary = checkpoint.offset if resumed else data_start
+        saved: Tuple[int, int, List[Dict[str, Any]]] | None = None
+        for columns in column_blocks(stream, config.batch_size):
+            count = len(columns[0]) if columns else 0
+            if count < config.batch_size or not records.terminated:
+                # Only the final batch can be short or end without a newline,
+                # and bytes appended after an unterminated record extend it;
+                # keep the state before it so the next run parses it again
+                saved = (rows, boundary, [acc.to_dict() for acc in accumulators.values()])
+            batch = [build_chunk(name, kind, values) for name, kind, values in zip(header, kinds, columns)]
+            accumulate_batches([batch], config, accumulators)
+            rows += count
+            boundary = records.offset
+        if saved is None:
+            saved = (rows, boundary, [acc.to_dict() for acc in accumulators.values()])
+        saved_rows, offset, states = saved
+        # Without the full schema sample behind it, a checkpoint could pin a stale schema
+        if saved_rows >= SCHEMA_SAMPLE_ROWS:
+            if offset < hashed:
+                hasher, hashed = hashlib.sha256(), 0
+            hash_range(hasher, fh, hashed, offset)
+            save_checkpoint(storage_dir, Checkpoint(
+                dataset_path=os.path.realpath(path),
+                offset=offset,
+                rows=saved_rows,
+                header_hash=header_hash,
+                prefix_hash=hasher.hexdigest(),
+                config_key=config_key(config),
+                schema=schema,
+                accumulators=states,
+            ))
+    return schema, signals_from_accumulators(accumulators)
@@ -6,13 +6,16 @@ from __future__ import annotations
 
 from typing import Iterable, Dict, Any
 from data_thought_engine.utils import stats
+from data_thought_engine.utils.sketches import DEFAULT_QUANTILE_K, QuantileSketch
 
 
-def column_metrics(values: Iterable[str]) -> Dict[str, Any]:
+def column_metrics(values: Iterable[str], quantile_k: int | None = DEFAULT_QUANTILE_K) -> Dict[str, Any]:
     """Compute numeric and distribution metrics for a column.
 
     Values are strings; attempt to convert to float for numeric measures.
-    Non-numeric entries are included in entropy only.
+    Non-numeric entries are included in entropy only. The median comes from
+    a deterministic quantile sketch of size `quantile_k`; pass None for the
+    exact, sort-based median.
     """
     vals_list = [v for v in values]
     # compute entropy on raw string values
@@ -24,13 +27,19 @@ def column_metrics(values: Iterable[str]) -> Dict[str, Any]:
             numeric.append(float(v))
         except Exception:
             continue
-    metrics: Dict[str, Any] = {"entropy": ent, "count": len(vals_list)}
+    metrics: Dict[str, Any] = {"entropy": ent, "entropy_mode": "exact", "count": len(vals_list)}
     if numeric:
         metrics.update({
             "mean": stats.mean(numeric),
-            "median": stats.median(numeric),
+            "median": stats.median(numeric) if quantile_k is None else _sketch_median(numeric, quantile_k),
             "variance": stats.variance(numeric),
         })
     else:
         metrics.update({"mean": None, "median": None, "variance": None})
     return metrics
+
+
+def _sketch_median(values: Iterable[float], k: int) -> float:
+    sketch = QuantileSketch(k)
+    sketch.extend(values)
+    return sketch.median()
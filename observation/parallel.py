@@ -0,0 +1,143 @@
+"""
+Parallel observation over a process pool, sharded by column or by byte range.
+Workers type and accumulate their share; the parent merges in a fixed order.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, Iterable, List, Sequence, Tuple
+import itertools
+
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.core.context import Context
+from data_thought_engine.ingestion.columns import build_chunk, column_kind
+from data_thought_engine.ingestion.ranges import RecordRange, range_records, split_ranges
+from data_thought_engine.ingestion.stream import batch_generator
+from data_thought_engine.observation.accumulators import ColumnAccumulator, accumulate_batches
+from data_thought_engine.observation.detectors import signals_from_accumulators
+from data_thought_engine.observation.signals import Signal
+
+
+def _shard_columns(width: int, workers: int) -> List[range]:
+    """Split column positions into at most `workers` contiguous ranges."""
+    shards = max(1, min(workers, width))
+    step, extra = divmod(width, shards)
+    ranges: List[range] = []
+    start = 0
+    for i in range(shards):
+        end = start + step + (1 if i < extra else 0)
+        ranges.append(range(start, end))
+        start = end
+    return ranges
+
+
+def _accumulate_shard(specs: Sequence[Tuple[str, str]], columns: Sequence[Tuple[str, ...]], config: EngineConfig) -> List[ColumnAccumulator]:
+    # Runs in a worker: build typed chunks and the partial state for one block
+    return [ColumnAccumulator.from_chunk(build_chunk(name, kind, values), config) for (name, kind), values in zip(specs, columns)]
+
+
+def accumulate_parallel(header: List[str], schema: Dict[str, str], blocks: Iterable[List[Tuple[str, ...]]], config: EngineConfig) -> Dict[str, ColumnAccumulator]:
+    """Accumulate raw column blocks with columns sharded across processes.
+
+    Partial accumulators are merged block by block and shard by shard, the
+    same sequence `accumulate_batches` follows, so the resulting state is
+    identical to a serial run. At most two blocks per worker are in flight.
+    """
+    specs = [(name, column_kind(schema.get(name))) for name in header]
+    shards = _shard_columns(len(header), config.workers)
+    accumulators: Dict[str, ColumnAccumulator] = {}
+    pending: Deque[List[Future]] = deque()
+
+    def merge_oldest() -> None:
+        for future in pending.popleft():
+            for partial in future.result():
+                acc = accumulators.get(partial.name)
+                if acc is None:
+                    accumulators[partial.name] = partial
+                else:
+                    acc.merge(partial)
+
+    with ProcessPoolExecutor(max_workers=config.workers) as pool:
+        for columns in blocks:
+            pending.append([
+                pool.submit(_accumulate_shard, [specs[i] for i in shard], [columns[i] for i in shard], config)
+                for shard in shards
+            ])
+            if len(pending) > 2 * config.workers:
+                merge_oldest()
+        while pending:
+            merge_oldest()
+    return accumulators
+
+
+def detect_signals_parallel(header: List[str], blocks: Iterable[List[Tuple[str, ...]]], context: Context) -> List[Signal]:
+    """Parallel counterpart of `detect_signals_columnar` for `config.workers` > 1.
+
+    Signals come out ordered by column, then detector, and are byte-identical
+    to the serial run.
+    """
+    return signals_from_accumulators(accumulate_parallel(header, context.schema, blocks, context.config))
+
+
+def _accumulate_range(path: str, span: RecordRange, header: List[str], schema: Dict[str, str], config: EngineConfig) -> Tuple[List[List[str]], List[List[ColumnAccumulator]], List[List[str]]]:
+    # Runs in a worker: parse one record-aligned byte range and fold only the
+    # batches a serial run would build; records around them go back raw
+    records = range_records(path, span.start, span.end, len(header))
+    head = list(itertools.islice(records, -span.first_row % config.batch_size))
+    partials: List[List[ColumnAccumulator]] = []
+    while True:
+        block = list(itertools.islice(records, config.batch_size))
+        if len(block) < config.batch_size:
+            return head, partials, block
+        for batch in batch_generator(header, block, schema, config.batch_size):
+            partials.append([ColumnAccumulator.from_chunk(chunk, config) for chunk in batch])
+
+
+def accumulate_ranges(path: str, header: List[str], schema: Dict[str, str], start: int, config: EngineConfig) -> Dict[str, ColumnAccumulator]:
+    """Parse the data from byte `start` in worker processes and merge their partial states.
+
+    Workers first scan `range_bytes` slices for record boundaries, then parse
+    one range each. Every range knows how many records precede it, so its
+    worker folds exactly the batches of `batch_size` rows that a serial run
+    builds, and the parent folds them, plus the batches spanning range
+    edges, in file order. The result is identical to `accumulate_batches`
+    for any range size or pool size. Files whose stray quotes mislead the
+    boundary scan still parse correctly, but their batches may not line up.
+    """
+    accumulators: Dict[str, ColumnAccumulator] = {name: None for name in header}
+    pending: Deque[Future] = deque()
+    rows: List[List[str]] = []
+
+    def fold(partials: List[ColumnAccumulator]) -> None:
+        for partial in partials:
+            acc = accumulators.get(partial.name)
+            if acc is None:
+                accumulators[partial.name] = partial
+            else:
+                acc.merge(partial)
+
+    def merge_oldest() -> None:
+        head, partials, tail = pending.popleft().result()
+        rows.extend(head)
+        if len(rows) >= config.batch_size or partials or tail:
+            accumulate_batches(batch_generator(header, rows, schema, config.batch_size), config, accumulators)
+            rows.clear()
+        for batch in partials:
+            fold(batch)
+        rows.extend(tail)
+
+    with ProcessPoolExecutor(max_workers=config.ingest_workers) as pool:
+        for span in split_ranges(path, start, config.range_bytes, pool.map):
+            pending.append(pool.submit(_accumulate_range, path, span, header, schema, config))
+            if len(pending) > 2 * config.ingest_workers:
+                merge_oldest()
+        while pending:
+            merge_oldest()
+    accumulate_batches(batch_generator(header, rows, schema, config.batch_size), config, accumulators)
+    return {name: acc for name, acc in accumulators.items() if acc is not None}
+
+
+def detect_signals_ranges(path: str, header: List[str], start: int, context: Context) -> List[Signal]:
+    """Byte-range parallel counterpart of `detect_signals_columnar`; signals are identical."""
+    return signals_from_accumulators(accumulate_ranges(path, header, context.schema, start, context.config))
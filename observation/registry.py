@@ -0,0 +1,167 @@
+"""
+Registry of column metrics and detectors, compiled into one fused plan per run.
+Each detector declares the metrics it reads; every metric is computed once per column.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
+
+from data_thought_engine.observation.signals import Signal
+
+if TYPE_CHECKING:
+    from data_thought_engine.observation.accumulators import ColumnAccumulator
+
+
+@dataclass(frozen=True)
+class Metric:
+    """A per-column quantity derived from a finished accumulator.
+
+    `compute` receives the accumulator and the metrics computed so far,
+    which include everything named in `needs`.
+    """
+    name: str
+    needs: Tuple[str, ...]
+    compute: Callable[["ColumnAccumulator", Dict[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class Detector:
+    """A rule turning the metrics it `needs` into at most one signal per column."""
+    name: str
+    needs: Tuple[str, ...]
+    detect: Callable[[str, Dict[str, Any]], Signal | None]
+
+
+METRICS: Dict[str, Metric] = {}
+# Insertion order is detector order, and so signal order within a column
+DETECTORS: Dict[str, Detector] = {}
+
+
+def register_metric(name: str, needs: Sequence[str] = ()) -> Callable:
+    """Decorator registering `fn(acc, metrics)` as the metric `name`."""
+    def decorate(fn: Callable[["ColumnAccumulator", Dict[str, Any]], Any]) -> Callable:
+        if name in METRICS:
+            raise ValueError(f"Metric already registered: {name}")
+        METRICS[name] = Metric(name, tuple(needs), fn)
+        return fn
+    return decorate
+
+
+def register_detector(name: str, needs: Sequence[str]) -> Callable:
+    """Decorator registering `fn(column, metrics)` as the detector `name`.
+
+    Detectors run after the built-in ones, in registration order.
+    """
+    def decorate(fn: Callable[[str, Dict[str, Any]], Signal | None]) -> Callable:
+        if name in DETECTORS:
+            raise ValueError(f"Detector already registered: {name}")
+        DETECTORS[name] = Detector(name, tuple(needs), fn)
+        return fn
+    return decorate
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """Metrics in dependency order, each listed once, plus the detectors reading them."""
+    metrics: Tuple[Metric, ...]
+    detectors: Tuple[Detector, ...]
+
+    def metric_values(self, acc: "ColumnAccumulator") -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for metric in self.metrics:
+            values[metric.name] = metric.compute(acc, values)
+        return values
+
+    def run(self, column: str, acc: "ColumnAccumulator") -> List[Signal]:
+        """Compute the plan's metrics for one column and return its signals in detector order."""
+        values = self.metric_values(acc)
+        signals = []
+        for detector in self.detectors:
+            signal = detector.detect(column, values)
+            if signal is not None:
+                signals.append(signal)
+        return signals
+
+
+def compile_plan(detectors: Sequence[str] | None = None, metrics: Sequence[str] = ()) -> ColumnPlan:
+    """Fuse the named detectors (default: all registered) into one plan.
+
+    Extra `metrics` are computed even if no detector reads them. Raises
+    ValueError for unknown names and for dependency cycles between metrics.
+    """
+    names = list(DETECTORS) if detectors is None else list(detectors)
+    unknown = [name for name in names if name not in DETECTORS]
+    if unknown:
+        raise ValueError(f"Unknown detectors: {', '.join(unknown)}")
+    chosen = tuple(DETECTORS[name] for name in names)
+    ordered: List[Metric] = []
+    done: Dict[str, bool] = {}
+
+    def visit(name: str) -> None:
+        state = done.get(name)
+        if state:
+            return
+        if state is False:
+            raise ValueError(f"Metric dependency cycle through: {name}")
+        metric = METRICS.get(name)
+        if metric is None:
+            raise ValueError(f"Unknown metric: {name}")
+        done[name] = False
+        for need in metric.needs:
+            visit(need)
+        done[name] = True
+        ordered.append(metric)
+
+    for name in metrics:
+        visit(name)
+    for detector in chosen:
+        for name in detector.needs:
+            visit(name)
+    return ColumnPlan(tuple(ordered), chosen)
+
+
+@register_metric("count")
+def _count(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> int:
+    return acc.rows
+
+
+@register_metric("entropy")
+def _entropy(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> float:
+    return acc.entropy()
+
+
+@register_metric("entropy_mode")
+def _entropy_mode(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> str:
+    return "exact" if acc.entropy_sketch is None else "estimated"
+
+
+@register_metric("numeric_count")
+def _numeric_count(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> int:
+    return acc.n
+
+
+@register_metric("mean")
+def _mean(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> float | None:
+    return acc.total / acc.n if acc.n else None
+
+
+@register_metric("median")
+def _median(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> float | None:
+    return acc.quantiles.median() if acc.n else None
+
+
+@register_metric("variance")
+def _variance(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> float | None:
+    return acc.m2 / acc.n if acc.n else None
+
+
+@register_metric("sign_changes")
+def _sign_changes(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> int:
+    return acc.changes
+
+
+@register_metric("summary", needs=("entropy", "entropy_mode", "count", "mean", "median", "variance"))
+def _summary(acc: "ColumnAccumulator", metrics: Dict[str, Any]) -> Dict[str, Any]:
+    # The dict signals carry in their details; key order is part of signal ids
+    return {name: metrics[name] for name in ("entropy", "entropy_mode", "count", "mean", "median", "variance")}
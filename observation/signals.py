@@ -1,18 +1,21 @@
 """
 Signal data structures that represent observations worth reasoning about.
+Signals are slotted and share their column's metrics dict, so wide datasets stay compact.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence, Tuple
+import sys
 import uuid
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signal:
     """A concise representation of an observed anomaly or pattern.
 
     `score` is a simple numeric strength; `details` holds contextual values.
+    Signals for the same column reference one shared `metrics` dict.
     """
     id: str
     kind: str
@@ -30,4 +33,34 @@ def make_signal(kind: str, column: str, score: float, details: Dict[str, Any] |
     # Deterministic id based on content
     base = f"{kind}:{column}:{score}"
     uid = uuid.uuid5(uuid.NAMESPACE_DNS, base).hex
-    return Signal(id=uid, kind=kind, column=column, score=score, details=details or {})
+    return Signal(id=uid, kind=sys.intern(kind), column=sys.intern(column), score=score, details=details or {})
+
+
+def pack_signals(signals: Sequence[Signal]) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Return JSON-ready signal records and the column metrics they reference.
+
+    Each column's `metrics` dict is stored once, keyed by column name. A
+    signal whose details are just those metrics gets a record without
+    `details`; any other signal keeps its details inline.
+    """
+    metrics: Dict[str, Dict[str, Any]] = {}
+    records = []
+    for s in signals:
+        record: Dict[str, Any] = {"id": s.id, "kind": s.kind, "column": s.column, "score": s.score}
+        shared = s.details.get("metrics") if len(s.details) == 1 else None
+        if isinstance(shared, dict) and metrics.setdefault(s.column, shared) == shared:
+            records.append(record)
+            continue
+        record["details"] = s.details
+        records.append(record)
+    return records, metrics
+
+
+def unpack_signals(records: Sequence[Dict[str, Any]], metrics: Dict[str, Dict[str, Any]]) -> List[Signal]:
+    """Rebuild signals from `pack_signals` output, sharing each column's metrics."""
+    signals = []
+    for record in records:
+        column = sys.intern(record["column"])
+        details = record["details"] if "details" in record else {"metrics": metrics[column]}
+        signals.append(Signal(id=record["id"], kind=sys.intern(record["kind"]), column=column, score=record["score"], details=details))
+    return signals
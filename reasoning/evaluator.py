@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from typing import List, Dict, Any
 from data_thought_engine.hypothesis.hypothesis import Hypothesis
-from data_thought_engine.hypothesis.validator import validate_hypotheses
+from data_thought_engine.hypothesis.validator import screen_hypotheses
 from data_thought_engine.reasoning.node import make_node, Node
 from data_thought_engine.reasoning.graph import ReasoningDAG
 
@@ -14,9 +14,11 @@ def evaluate_hypotheses(hypotheses: List[Hypothesis], context) -> Dict[str, Any]
     """Validate and evaluate hypotheses, returning structured results.
 
     Evaluation is rule-based: expectations containing a numeric `score`
-    are interpreted directly; higher score favors support.
+    are interpreted directly; higher score favors support. Hypotheses
+    rejected as circular are listed, one id list per cycle, under
+    `rejected_cycles` when there are any.
     """
-    valid = validate_hypotheses(hypotheses)
+    valid, cycles = screen_hypotheses(hypotheses)
     dag = ReasoningDAG()
     results: Dict[str, Any] = {"nodes": [], "summary": {}}
     for h in valid:
@@ -40,4 +42,6 @@ def evaluate_hypotheses(hypotheses: List[Hypothesis], context) -> Dict[str, Any]
         summary.setdefault(n.result, 0)
         summary[n.result] += 1
     results["summary"] = summary
+    if cycles:
+        results["rejected_cycles"] = cycles
     return results
@@ -7,13 +7,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Any
 import hashlib
+import sys
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
     """Immutable result of applying one test to a hypothesis.
 
-    Id is deterministic based on hypothesis id and test name.
+    Id is deterministic based on hypothesis id and test name. Test and
+    result names are interned, since every node repeats a handful of them.
     """
     id: str
     hypothesis_id: str
@@ -26,4 +28,4 @@ class Node:
 def make_node(hypothesis_id: str, test: str, result: str, score: float, details: Dict[str, Any] | None = None) -> Node:
     key = f"{hypothesis_id}:{test}:{result}:{score}"
     nid = hashlib.sha1(key.encode('utf-8')).hexdigest()
-    return Node(id=nid, hypothesis_id=hypothesis_id, test=test, result=result, score=float(score), details=details or {})
+    return Node(id=nid, hypothesis_id=hypothesis_id, test=sys.intern(test), result=sys.intern(result), score=float(score), details=details or {})
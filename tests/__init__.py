@@ -0,0 +1 @@
+"""Test suite; run with `python -m unittest discover data_thought_engine.tests`."""
@@ -0,0 +1,94 @@
+"""
+Equivalence of the compute backends: NumPy must reproduce the Python kernels exactly.
+Skipped where NumPy is not installed.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import replace
+from typing import List, Tuple
+import math
+import os
+import random
+import tempfile
+import unittest
+
+from data_thought_engine.benchmarks.generator import SHAPES, dataset_path, generate_csv
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.core.context import Context
+from data_thought_engine.ingestion.loader import load_batches
+from data_thought_engine.observation.detectors import detect_signals_columnar
+from data_thought_engine.utils.backend import PythonBackend, get_backend, numpy_available
+
+_CORPUS_ROWS = 3000
+_CORPUS_SHAPES = ("tall", "high_cardinality", "numeric_heavy", "string_heavy")
+# Values the kernels must agree on beyond ordinary floats
+_EDGE_CSV = (
+    "spiky,flat,signed_zero,special,single,mixed,empty\n"
+    "1,5,-0.0,nan,7,1,\n"
+    "1e308,5,-0.0,inf,,x,\n"
+    "-1e308,5,0.0,-inf,,2,\n"
+    "3,5,-0.0,1,,,\n"
+    "2.5,5,-0.0,nan,,3.5,\n"
+    "1e-300,5,-0.0,2,,y,\n"
+    "3,5,-0.0,2,,4,\n"
+)
+_CONFIGS = (
+    EngineConfig(),
+    EngineConfig(exact_median=True),
+    EngineConfig(batch_size=7, quantile_k=16),
+    EngineConfig(entropy_exact_limit=4, heavy_hitters=3),
+)
+
+
+def _signals(path: str, config: EngineConfig) -> List[Tuple[str, str, str, str, str]]:
+    context = Context(dataset_path=path, num_rows_sampled=0, schema={}, config=config)
+    _, batches = load_batches(path, context, config.batch_size)
+    return [(s.id, s.kind, s.column, repr(s.score), repr(s.details)) for s in detect_signals_columnar(batches, context)]
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class BackendEquivalenceTest(unittest.TestCase):
+    """The NumPy backend yields the same kernels and signals as the Python one."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._dir = tempfile.TemporaryDirectory()
+        cls.corpus = [generate_csv(dataset_path(cls._dir.name, SHAPES[name], _CORPUS_ROWS), SHAPES[name], _CORPUS_ROWS) for name in _CORPUS_SHAPES]
+        edge = os.path.join(cls._dir.name, "edge.csv")
+        with open(edge, "w", encoding="utf-8", newline="") as fh:
+            fh.write(_EDGE_CSV)
+        cls.corpus.append(edge)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._dir.cleanup()
+
+    def test_kernels_match(self) -> None:
+        python, numpy = PythonBackend(), get_backend("numpy")
+        rng = random.Random(7)
+        samples = [
+            array("d", [rng.gauss(0.0, 1e6) for _ in range(5000)]),
+            array("d", [rng.choice((0.0, -0.0, 1.0, 1.0, 2.5)) for _ in range(500)]),
+            array("d", [-0.0, -0.0]),
+            array("d", [1.0, math.nan, 2.0, math.inf, -math.inf, 3.0]),
+            array("d", [42.0]),
+        ]
+        for nums in samples:
+            with self.subTest(size=len(nums)):
+                self.assertEqual(repr(numpy.moments(nums)), repr(python.moments(nums)))
+                self.assertEqual(numpy.sign_changes(nums), python.sign_changes(nums))
+                self.assertEqual(numpy.sort(nums).tobytes(), python.sort(nums).tobytes())
+        codes = array("I", [rng.randrange(50) for _ in range(4000)])
+        self.assertEqual(numpy.value_counts(codes, 60), python.value_counts(codes, 60))
+
+    def test_corpus_signals_match(self) -> None:
+        for path in self.corpus:
+            for config in _CONFIGS:
+                with self.subTest(dataset=os.path.basename(path), config=config):
+                    expected = _signals(path, replace(config, backend="python"))
+                    self.assertEqual(_signals(path, replace(config, backend="numpy")), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
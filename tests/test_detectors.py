@@ -0,0 +1,136 @@
+"""
+Equivalence of the list-based reference detectors and the streaming accumulator path.
+Counts, sign changes and entropies match exactly; float moments and chunked medians within stated bounds.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+import bisect
+import csv
+import math
+import os
+import tempfile
+import unittest
+
+from data_thought_engine.benchmarks.generator import SHAPES, dataset_path, generate_csv
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.core.context import Context
+from data_thought_engine.ingestion.loader import load_batches
+from data_thought_engine.observation.detectors import detect_distribution_shift, detect_monotonic_break, detect_signals_columnar, detect_variance_spike
+from data_thought_engine.observation.signals import Signal
+
+_CORPUS_ROWS = 3000
+_CORPUS_SHAPES = ("tall", "high_cardinality", "numeric_heavy", "string_heavy")
+_EDGE_CSV = (
+    "trend,flat,mixed,sparse\n"
+    "1,5,1,\n"
+    "2,5,x,\n"
+    "3,5,2,7\n"
+    "2,5,,\n"
+    "1,5,3.5,\n"
+    "4,5,y,-1e6\n"
+    "5,5,4,\n"
+)
+# Streaming moments are merged per chunk, so their sums run in a different
+# order than the list code's; variance (and the variance_spike score, which
+# also feeds the signal id) may differ in the last bits
+REL_TOLERANCE = 1e-12
+_FLOAT_METRICS = ("mean", "variance")
+
+
+def _numbers(values: List[str]) -> List[float]:
+    nums = []
+    for v in values:
+        try:
+            nums.append(float(v))
+        except ValueError:
+            continue
+    return nums
+
+
+def _reference(path: str) -> Tuple[Dict[Tuple[str, str], Signal], Dict[str, List[float]]]:
+    with open(path, newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+    signals = {}
+    numbers = {}
+    for column in rows[0]:
+        values = [row[column] or "" for row in rows]
+        numbers[column] = sorted(_numbers(values))
+        for detect in (detect_variance_spike, detect_monotonic_break, detect_distribution_shift):
+            signal = detect(column, values)
+            if signal is not None:
+                signals[(signal.kind, signal.column)] = signal
+    return signals, numbers
+
+
+def _streamed(path: str, config: EngineConfig) -> Dict[Tuple[str, str], Signal]:
+    context = Context(dataset_path=path, num_rows_sampled=0, schema={}, config=config)
+    _, batches = load_batches(path, context, config.batch_size)
+    return {(s.kind, s.column): s for s in detect_signals_columnar(batches, context)}
+
+
+class DetectorEquivalenceTest(unittest.TestCase):
+    """Every streamed signal matches the list-based detectors on a corpus."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._dir = tempfile.TemporaryDirectory()
+        cls.corpus: List[str] = [generate_csv(dataset_path(cls._dir.name, SHAPES[name], _CORPUS_ROWS), SHAPES[name], _CORPUS_ROWS) for name in _CORPUS_SHAPES]
+        edge = os.path.join(cls._dir.name, "edge.csv")
+        with open(edge, "w", encoding="utf-8", newline="") as fh:
+            fh.write(_EDGE_CSV)
+        cls.corpus.append(edge)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._dir.cleanup()
+
+    def assertClose(self, actual: float | None, expected: float | None) -> None:
+        if expected is None or actual is None:
+            self.assertEqual(actual, expected)
+        else:
+            self.assertTrue(math.isclose(actual, expected, rel_tol=REL_TOLERANCE), f"{actual!r} != {expected!r}")
+
+    def assertMedianWithinBound(self, median: float, nums: List[float], k: int) -> None:
+        # Both sides use the quantile sketch; fed in chunks it compacts at
+        # other points, so only its rank error bound is guaranteed
+        n = len(nums)
+        bound = n * (math.log2(max(n / k, 1)) + 1) / (k - 1)
+        low, high = bisect.bisect_left(nums, median), bisect.bisect_right(nums, median)
+        distance = max(low - n / 2, n / 2 - high, 0)
+        self.assertLessEqual(distance, bound, f"median {median!r} is {distance} ranks off")
+
+    def test_signals_match_reference(self) -> None:
+        # With one chunk per column the streamed sketch sees exactly what the
+        # list reference sees, so even its median matches
+        for batch_size in (4096, 100):
+            config = EngineConfig(batch_size=batch_size)
+            for path in self.corpus:
+                with self.subTest(dataset=os.path.basename(path), batch_size=batch_size):
+                    expected, numbers = _reference(path)
+                    actual = _streamed(path, config)
+                    single_chunk = batch_size >= _CORPUS_ROWS
+                    self.assertEqual(list(actual), list(expected))
+                    for key, want in expected.items():
+                        got = actual[key]
+                        if want.kind == "variance_spike":
+                            self.assertClose(got.score, want.score)
+                        else:
+                            self.assertEqual(got.id, want.id)
+                            self.assertEqual(got.score, want.score)
+                        if "metrics" not in want.details:
+                            self.assertEqual(got.details, want.details)
+                            continue
+                        got_metrics, want_metrics = got.details["metrics"], want.details["metrics"]
+                        self.assertEqual(sorted(got_metrics), sorted(want_metrics))
+                        for name, value in want_metrics.items():
+                            if name in _FLOAT_METRICS:
+                                self.assertClose(got_metrics[name], value)
+                            elif name == "median" and value is not None and not single_chunk:
+                                self.assertMedianWithinBound(got_metrics[name], numbers[want.column], config.quantile_k)
+                            else:
+                                self.assertEqual(got_metrics[name], value, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
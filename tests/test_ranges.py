@@ -0,0 +1,88 @@
+"""
+Byte-range ingestion: record boundaries, row offsets and signals equal to a serial run.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import List, Tuple
+import os
+import tempfile
+import unittest
+
+from data_thought_engine.benchmarks.generator import SHAPES, dataset_path, generate_csv
+from data_thought_engine.core.config import EngineConfig
+from data_thought_engine.core.context import Context
+from data_thought_engine.ingestion.loader import load_batches, load_ranges
+from data_thought_engine.ingestion.ranges import header_end, range_records, split_ranges
+from data_thought_engine.ingestion.stream import open_records
+from data_thought_engine.observation.detectors import detect_signals_columnar
+from data_thought_engine.observation.parallel import detect_signals_ranges
+
+_CORPUS_ROWS = 3000
+_CORPUS_SHAPES = ("tall", "numeric_heavy", "string_heavy")
+# Quoted newlines, doubled quotes, blank records, CRLF and an unterminated last record
+_EDGE_CSV = (
+    'trend,label\n'
+    '1,"a\nb"\n'
+    '\n'
+    '2,"say ""hi"""\r\n'
+    '\r\n'
+    '3,"\n\n"\n'
+    + "".join(f'{i % 7},"x{i}\ny"\n' if i % 3 else f"{i % 5},plain\n" for i in range(400))
+    + '4,"last\nrecord"'
+)
+_RANGE_BYTES = (1, 97, 4096, 1 << 20)
+# Every range is a worker task, so the signal comparison skips the tiniest sizes
+_WORKER_RANGE_BYTES = (4096, 1 << 20)
+
+
+def _signals(signals) -> List[Tuple[str, str, str]]:
+    return [(s.id, repr(s.score), repr(s.details)) for s in signals]
+
+
+class RangeIngestionTest(unittest.TestCase):
+    """Range workers cover every record once and reproduce serial signals."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._dir = tempfile.TemporaryDirectory()
+        cls.corpus = [generate_csv(dataset_path(cls._dir.name, SHAPES[name], _CORPUS_ROWS), SHAPES[name], _CORPUS_ROWS) for name in _CORPUS_SHAPES]
+        edge = os.path.join(cls._dir.name, "edge.csv")
+        with open(edge, "w", encoding="utf-8", newline="") as fh:
+            fh.write(_EDGE_CSV)
+        cls.corpus.append(edge)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._dir.cleanup()
+
+    def test_ranges_count_records(self) -> None:
+        for path in self.corpus:
+            header, records = open_records(path)
+            total = sum(1 for _ in records)
+            start = header_end(path)
+            for range_bytes in _RANGE_BYTES:
+                with self.subTest(dataset=os.path.basename(path), range_bytes=range_bytes):
+                    row, offset = 0, start
+                    for span in split_ranges(path, start, range_bytes):
+                        self.assertEqual((span.start, span.first_row), (offset, row))
+                        self.assertEqual(sum(1 for _ in range_records(path, span.start, span.end, len(header))), span.rows)
+                        offset, row = span.end, row + span.rows
+                    self.assertEqual((offset, row), (os.path.getsize(path), total))
+
+    def test_ingest_workers_match_serial(self) -> None:
+        for path in self.corpus:
+            for batch_size in (100, 4096):
+                context = Context(dataset_path=path, num_rows_sampled=0, schema={}, config=EngineConfig(batch_size=batch_size))
+                _, batches = load_batches(path, context, batch_size)
+                expected = _signals(detect_signals_columnar(batches, context))
+                for range_bytes in _WORKER_RANGE_BYTES:
+                    with self.subTest(dataset=os.path.basename(path), batch_size=batch_size, range_bytes=range_bytes):
+                        config = EngineConfig(batch_size=batch_size, ingest_workers=2, range_bytes=range_bytes)
+                        ranged = Context(dataset_path=path, num_rows_sampled=0, schema={}, config=config)
+                        schema, header, start = load_ranges(path, ranged)
+                        self.assertEqual(_signals(detect_signals_ranges(path, header, start, replace(ranged, schema=schema))), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
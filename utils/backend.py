@@ -0,0 +1,146 @@
+"""
+Pluggable compute backends for the per-chunk kernels behind the accumulators.
+NumPy is used when installed; the standard-library backend is always available.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Tuple
+
+from data_thought_engine.utils.sketches import sort_floats
+
+BACKEND_NAMES = ("auto", "python", "numpy")
+
+
+class PythonBackend:
+    """Reference kernels written as plain loops over `array('d')` buffers.
+
+    Every kernel fixes its order of floating-point operations so that other
+    backends can reproduce the results bit for bit.
+    """
+    name = "python"
+
+    def __reduce__(self):
+        # Resolve by name on unpickling so worker processes share their own instance
+        return (get_backend, (self.name,))
+
+    def moments(self, nums: array) -> Tuple[float, float, float]:
+        """Return (sum, mean, sum of squared deviations) with sequential sums."""
+        total = 0.0
+        for x in nums:
+            total += x
+        mean_v = total / len(nums)
+        m2 = 0.0
+        for x in nums:
+            d = x - mean_v
+            m2 += d * d
+        return total, mean_v, m2
+
+    def value_counts(self, codes: array, size: int) -> List[int]:
+        """Return how often each dictionary code in [0, size) occurs."""
+        counts = [0] * size
+        for code in codes:
+            counts[code] += 1
+        return counts
+
+    def sign_changes(self, nums: array) -> Tuple[int | None, int | None, int]:
+        """Return (first sign, last sign, direction changes) of successive diffs.
+
+        A zero difference breaks a run, and NaN differences count as falling,
+        matching the list-based monotonic detector.
+        """
+        first: int | None = None
+        prev: int | None = None
+        changes = 0
+        for a, b in zip(nums, nums[1:]):
+            diff = b - a
+            s = 0 if diff == 0 else (1 if diff > 0 else -1)
+            if prev and s and prev != s:
+                changes += 1
+            if first is None:
+                first = s
+            prev = s
+        return first, prev, changes
+
+    def sort(self, values: array) -> array:
+        return sort_floats(values)
+
+
+class NumpyBackend(PythonBackend):
+    """Vectorized kernels producing exactly the PythonBackend results.
+
+    Sums use `np.add.accumulate`, which adds strictly left to right unlike
+    the pairwise `np.sum`, and sorting is stable so equal keys keep order.
+    """
+    name = "numpy"
+
+    def __init__(self) -> None:
+        import numpy
+        self._np = numpy
+
+    def moments(self, nums: array) -> Tuple[float, float, float]:
+        np = self._np
+        a = np.frombuffer(nums, dtype=np.float64)
+        # Overflow to inf and NaN are results here, as in the Python loop
+        with np.errstate(over="ignore", invalid="ignore"):
+            # Adding 0.0 turns a sum of only -0.0 into 0.0, as the Python loop does
+            total = float(np.add.accumulate(a)[-1]) + 0.0
+            mean_v = total / len(nums)
+            d = a - mean_v
+            m2 = float(np.add.accumulate(d * d)[-1]) + 0.0
+        return total, mean_v, m2
+
+    def value_counts(self, codes: array, size: int) -> List[int]:
+        np = self._np
+        a = np.frombuffer(codes, dtype=np.dtype(f"u{codes.itemsize}"))
+        return np.bincount(a, minlength=size).tolist()
+
+    def sign_changes(self, nums: array) -> Tuple[int | None, int | None, int]:
+        np = self._np
+        if len(nums) < 2:
+            return None, None, 0
+        with np.errstate(over="ignore", invalid="ignore"):
+            diff = np.diff(np.frombuffer(nums, dtype=np.float64))
+        signs = np.where(diff > 0, 1, np.where(diff == 0, 0, -1))
+        a, b = signs[:-1], signs[1:]
+        changes = int(np.count_nonzero((a != 0) & (b != 0) & (a != b)))
+        return int(signs[0]), int(signs[-1]), changes
+
+    def sort(self, values: array) -> array:
+        np = self._np
+        ordered = np.sort(np.frombuffer(values, dtype=np.float64), kind="stable")
+        return array("d", ordered.tobytes())
+
+
+_BACKENDS: Dict[str, PythonBackend] = {}
+
+
+def numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_backend(name: str = "auto") -> PythonBackend:
+    """Return a shared backend instance by name.
+
+    `auto` picks NumPy when it is importable and falls back to the
+    standard-library kernels otherwise; asking for `numpy` explicitly
+    without NumPy installed raises ImportError.
+    """
+    backend = _BACKENDS.get(name)
+    if backend is not None:
+        return backend
+    if name not in BACKEND_NAMES:
+        raise ValueError(f"Unknown compute backend: {name}")
+    resolved = name
+    if name == "auto":
+        resolved = "numpy" if numpy_available() else "python"
+    backend = _BACKENDS.get(resolved)
+    if backend is None:
+        backend = NumpyBackend() if resolved == "numpy" else PythonBackend()
+        _BACKENDS[resolved] = backend
+    _BACKENDS[name] = backend
+    return backend
@@ -7,6 +7,8 @@ from __future__ import annotations
 import os
 from typing import Any
 
+CSV_SUFFIXES = (".csv", ".csv.gz", ".csv.bz2", ".csv.xz")
+
 
 def assert_path_exists(path: str) -> None:
     """Raise an error if a filesystem path does not exist.
@@ -20,10 +22,11 @@ def assert_path_exists(path: str) -> None:
 def assert_is_csv(path: str) -> None:
     """Ensure file path looks like a CSV file by extension.
 
-    This is a lightweight check; reading/parsing is performed elsewhere.
+    Gzip, bz2 and xz compressed CSVs are accepted as well. This is a
+    lightweight check; reading/parsing is performed elsewhere.
     """
-    if not path.lower().endswith('.csv'):
-        raise ValueError(f"Expected a .csv file: {path}")
+    if not path.lower().endswith(CSV_SUFFIXES):
+        raise ValueError(f"Expected a .csv, .csv.gz, .csv.bz2 or .csv.xz file: {path}")
 
 
 def assert_non_empty(value: Any, name: str) -> None:
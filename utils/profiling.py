@@ -0,0 +1,191 @@
+"""
+Per-stage instrumentation: wall and CPU time, volumes, peak memory and profiles.
+A disabled recorder does nothing, so uninstrumented runs pay no overhead.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TypeVar, Union
+import cProfile
+import itertools
+import os
+import time
+import tracemalloc
+
+from data_thought_engine.core.lifecycle import Stage
+from data_thought_engine.utils.logger import StructuredLogger
+
+T = TypeVar("T")
+
+# Timed section outside the lifecycle: loading and comparing run history
+HISTORY = "history"
+Section = Union[Stage, str]
+_REPORT_ORDER = tuple(itertools.chain.from_iterable((s.value, HISTORY) if s is Stage.REASON else (s.value,) for s in Stage))
+
+
+def _name(section: Section) -> str:
+    return section.value if isinstance(section, Stage) else section
+
+
+class _StageTotals:
+    __slots__ = ("wall", "cpu", "rows", "bytes", "peak_memory")
+
+    def __init__(self) -> None:
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.peak_memory: int | None = None
+
+
+class StageRecorder:
+    """Accumulate wall time, CPU time, rows, bytes and peak memory per stage.
+
+    Stages nest: entering one pauses the enclosing stage, so time spent
+    parsing inside observation is charged to ingestion only. A stage may be
+    entered many times; its totals add up. Besides the lifecycle stages,
+    named sections such as `HISTORY` are timed alike. `trace_memory` records the peak
+    of tracemalloc-traced memory while each stage is active, and `profile`
+    keeps one cProfile profile per stage. Both slow the run down; the
+    benchmarks leave them off to compare wall times.
+    """
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False, profile: bool = False) -> None:
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.profile = enabled and profile
+        self._totals: Dict[str, _StageTotals] = {}
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        # Active sections by name, innermost last: [name, wall start, cpu start]
+        self._stack: List[List[Any]] = []
+        self._started_tracing = False
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def _resume(self, frame: List[Any]) -> None:
+        frame[1] = time.perf_counter()
+        frame[2] = time.process_time()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        if self.profile:
+            self._profiles.setdefault(frame[0], cProfile.Profile()).enable()
+
+    def _pause(self, frame: List[Any]) -> None:
+        if self.profile:
+            self._profiles[frame[0]].disable()
+        totals = self._totals.setdefault(frame[0], _StageTotals())
+        totals.wall += time.perf_counter() - frame[1]
+        totals.cpu += time.process_time() - frame[2]
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            totals.peak_memory = max(totals.peak_memory or 0, peak)
+
+    @contextmanager
+    def _active(self, stage: Section) -> Iterator[None]:
+        if self._stack:
+            self._pause(self._stack[-1])
+        frame = [_name(stage), 0.0, 0.0]
+        self._stack.append(frame)
+        self._resume(frame)
+        try:
+            yield
+        finally:
+            self._pause(self._stack.pop())
+            if self._stack:
+                self._resume(self._stack[-1])
+
+    def stage(self, stage: Section):
+        """Context manager charging the enclosed work to `stage`."""
+        if not self.enabled:
+            return nullcontext()
+        return self._active(stage)
+
+    def add(self, stage: Section, rows: int = 0, nbytes: int = 0) -> None:
+        """Credit rows and bytes processed to `stage`."""
+        if not self.enabled:
+            return
+        totals = self._totals.setdefault(_name(stage), _StageTotals())
+        totals.rows += rows
+        totals.bytes += nbytes
+
+    def rows(self, stage: Section) -> int:
+        """Return the rows credited to `stage` so far."""
+        totals = self._totals.get(_name(stage))
+        return totals.rows if totals is not None else 0
+
+    def iterate(self, stage: Section, items: Iterable[T], rows: Callable[[T], int] | None = None) -> Iterable[T]:
+        """Charge the time spent producing each item to `stage`.
+
+        With `rows`, each item also credits `rows(item)` rows to the stage.
+        A disabled recorder returns `items` unchanged.
+        """
+        if not self.enabled:
+            return items
+        return self._iterate(stage, iter(items), rows)
+
+    def _iterate(self, stage: Section, items: Iterator[T], rows: Callable[[T], int] | None) -> Iterator[T]:
+        while True:
+            with self._active(stage):
+                item = next(items, _END)
+            if item is _END:
+                return
+            if rows is not None:
+                self.add(stage, rows=rows(item))
+            yield item
+
+    def timings(self) -> Dict[str, Dict[str, Any]]:
+        """Return the totals of every recorded stage, in lifecycle order.
+
+        `history` follows `reason`, the stage it used to be charged to.
+        """
+        report: Dict[str, Dict[str, Any]] = {}
+        for name in _REPORT_ORDER:
+            totals = self._totals.get(name)
+            if totals is None:
+                continue
+            report[name] = {
+                "wall_seconds": round(totals.wall, 6),
+                "cpu_seconds": round(totals.cpu, 6),
+                "rows": totals.rows,
+                "bytes": totals.bytes,
+                "rows_per_second": round(totals.rows / totals.wall, 1) if totals.wall > 0 else None,
+                "peak_memory_bytes": totals.peak_memory,
+            }
+        return report
+
+    def dump_profiles(self, directory: str, prefix: str) -> List[str]:
+        """Write each stage's cProfile stats to `<directory>/<prefix>.<stage>.prof`.
+
+        The files load with `pstats.Stats`. Returns the written paths.
+        """
+        if not self._profiles:
+            return []
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for name in _REPORT_ORDER:
+            profiler = self._profiles.get(name)
+            if profiler is None:
+                continue
+            path = os.path.join(directory, f"{prefix}.{name}.prof")
+            profiler.dump_stats(path)
+            paths.append(path)
+        return paths
+
+    def close(self) -> None:
+        """Stop memory tracing if this recorder started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+_END: Any = object()
+
+
+def emit_timings(logger: StructuredLogger, timings: Dict[str, Dict[str, Any]], extra: Dict[str, Any] | None = None) -> None:
+    """Log one structured record per stage of a `timings` report."""
+    for stage, timing in timings.items():
+        logger.info("DTE stage timing", {**(extra or {}), "stage": stage, **timing})
+
+# Shared no-op recorder used when a run is not instrumented
+DISABLED = StageRecorder(enabled=False)
@@ -0,0 +1,285 @@
+"""
+Deterministic, mergeable sketches for bounded-memory streaming statistics.
+No randomness is used, so identical input streams yield identical state,
+and every sketch round-trips exactly through `to_dict`/`from_dict`.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Dict, Iterable, List
+import hashlib
+import math
+
+DEFAULT_QUANTILE_K = 512
+
+
+def _nan_last(x: float) -> tuple:
+    return (x != x, x)
+
+
+def sort_floats(values: array) -> array:
+    """Sort floats ascending with any NaN placed last, as NumPy does."""
+    if math.isnan(sum(values)):
+        return array("d", sorted(values, key=_nan_last))
+    return array("d", sorted(values))
+
+
+class QuantileSketch:
+    """Deterministic compactor-based quantile sketch (KLL/MRL style).
+
+    Items live in levels; an item on level h stands for 2**h inputs. When a
+    level reaches `k` items it is sorted and every other item is promoted,
+    alternating the starting offset per level instead of flipping a coin.
+
+    Error bound: each compaction at level h moves the rank of any value by
+    at most 2**h, so the absolute rank error of any query is at most
+    `rank_error()` (the sum of those weights). That is no more than
+    n * (log2(n / k) + 1) / (k - 1) ranks, about 3.5% of n for 50M values
+    at the default k. With `k=None` nothing is compacted and answers are exact.
+    """
+
+    def __init__(self, k: int | None = DEFAULT_QUANTILE_K, sort: Callable[[array], array] | None = None) -> None:
+        if k is not None and k < 2:
+            raise ValueError("QuantileSketch requires k >= 2")
+        self.k = k
+        self._sort = sort or sort_floats
+        self.n = 0
+        self.levels: List[array] = [array("d")]
+        self._offsets: List[int] = [0]
+        self._error = 0
+
+    def update(self, value: float) -> None:
+        self.levels[0].append(value)
+        self.n += 1
+        if self.k is not None and len(self.levels[0]) >= self.k:
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        level0 = self.levels[0]
+        before = len(level0)
+        level0.extend(values)
+        self.n += len(level0) - before
+        if self.k is not None and len(level0) >= self.k:
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch with the same `k` into this one."""
+        if other.k != self.k:
+            raise ValueError("Cannot merge quantile sketches with different k")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(array("d"))
+            self._offsets.append(0)
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self.n += other.n
+        self._error += other._error
+        if self.k is not None:
+            self._compress()
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) >= self.k:
+                ordered = self._sort(items)
+                # Keep the largest item back on odd sizes so promoted pairs are even
+                keep = array("d", ordered[-1:]) if len(ordered) % 2 else array("d")
+                pairs = ordered[:len(ordered) - len(keep)]
+                offset = self._offsets[h]
+                self._offsets[h] = 1 - offset
+                if h + 1 == len(self.levels):
+                    self.levels.append(array("d"))
+                    self._offsets.append(0)
+                self.levels[h + 1].extend(pairs[offset::2])
+                self.levels[h] = keep
+                self._error += 1 << h
+            h += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the sketch state as JSON-ready values; the sort is not saved."""
+        return {"k": self.k, "n": self.n, "levels": [list(items) for items in self.levels], "offsets": list(self._offsets), "error": self._error}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any], sort: Callable[[array], array] | None = None) -> "QuantileSketch":
+        sketch = cls(state["k"], sort)
+        sketch.n = state["n"]
+        sketch.levels = [array("d", items) for items in state["levels"]]
+        sketch._offsets = list(state["offsets"])
+        sketch._error = state["error"]
+        return sketch
+
+    def rank_error(self) -> int:
+        """Upper bound on the absolute rank error of any query so far."""
+        return self._error
+
+    def _ranked(self) -> Callable[[int], float]:
+        if len(self.levels) == 1:
+            ordered = sorted(self.levels[0])
+            return ordered.__getitem__
+        weighted = sorted((v, 1 << h) for h, items in enumerate(self.levels) for v in items)
+
+        def at(rank: int) -> float:
+            seen = 0
+            for value, weight in weighted:
+                seen += weight
+                if seen > rank:
+                    return value
+            return weighted[-1][0]
+        return at
+
+    def quantile(self, q: float) -> float:
+        """Return the value at fractional rank `q` in [0, 1]."""
+        if self.n == 0:
+            raise ValueError("quantile() requires at least one value")
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("quantile() requires 0 <= q <= 1")
+        return self._ranked()(min(int(q * self.n), self.n - 1))
+
+    def median(self) -> float:
+        """Return the median; matches `stats.median` exactly when uncompacted."""
+        if self.n == 0:
+            raise ValueError("median() requires at least one value")
+        at = self._ranked()
+        lo = at((self.n - 1) // 2)
+        if self.n % 2 == 1:
+            return lo
+        return (lo + at(self.n // 2)) / 2.0
+
+
+DEFAULT_HEAVY_HITTERS = 1024
+DEFAULT_HLL_PRECISION = 12
+
+
+class HeavyHitters:
+    """Mergeable Misra-Gries summary of the most frequent values.
+
+    Holds at most 2k counters; when full, every counter is lowered by the
+    (k+1)-th largest count and non-positive ones are dropped. Each stored
+    count underestimates its true count by at most `error` <= n / (k + 1).
+    """
+
+    def __init__(self, k: int = DEFAULT_HEAVY_HITTERS) -> None:
+        if k < 1:
+            raise ValueError("HeavyHitters requires k >= 1")
+        self.k = k
+        self.counts: Dict[str, int] = {}
+        self.error = 0
+
+    def add(self, value: str, count: int = 1) -> None:
+        counts = self.counts
+        counts[value] = counts.get(value, 0) + count
+        if len(counts) > 2 * self.k:
+            self._prune()
+
+    def merge(self, other: "HeavyHitters") -> None:
+        for value, c in other.counts.items():
+            self.add(value, c)
+        self.error += other.error
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "counts": dict(self.counts), "error": self.error}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "HeavyHitters":
+        hh = cls(state["k"])
+        hh.counts = dict(state["counts"])
+        hh.error = state["error"]
+        return hh
+
+    def _prune(self) -> None:
+        cut = sorted(self.counts.values(), reverse=True)[self.k]
+        self.error += cut
+        self.counts = {v: c - cut for v, c in self.counts.items() if c > cut}
+
+
+class HyperLogLog:
+    """Deterministic HyperLogLog cardinality sketch.
+
+    Values are hashed with BLAKE2b rather than `hash()`, whose string salt
+    changes between processes. Standard error is about 1.04 / sqrt(2**p).
+    """
+
+    def __init__(self, p: int = DEFAULT_HLL_PRECISION) -> None:
+        if not 4 <= p <= 16:
+            raise ValueError("HyperLogLog precision must be between 4 and 16")
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    def add(self, value: str) -> None:
+        h = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+        bits = 64 - self.p
+        idx = h >> bits
+        rank = bits - (h & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"p": self.p, "registers": self.registers.hex()}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "HyperLogLog":
+        hll = cls(state["p"])
+        hll.registers = bytearray.fromhex(state["registers"])
+        return hll
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return m * math.log(m / zeros)
+        return raw
+
+
+class EntropySketch:
+    """Bounded-memory Shannon entropy estimate for high-cardinality values.
+
+    Heavy hitters contribute their own probabilities; the remaining mass is
+    spread evenly over the estimated number of other distinct values.
+    """
+
+    def __init__(self, k: int = DEFAULT_HEAVY_HITTERS, p: int = DEFAULT_HLL_PRECISION) -> None:
+        self.heavy = HeavyHitters(k)
+        self.distinct = HyperLogLog(p)
+
+    def add(self, value: str, count: int = 1) -> None:
+        self.heavy.add(value, count)
+        self.distinct.add(value)
+
+    def merge(self, other: "EntropySketch") -> None:
+        self.heavy.merge(other.heavy)
+        self.distinct.merge(other.distinct)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"heavy": self.heavy.to_dict(), "distinct": self.distinct.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "EntropySketch":
+        sketch = cls.__new__(cls)
+        sketch.heavy = HeavyHitters.from_dict(state["heavy"])
+        sketch.distinct = HyperLogLog.from_dict(state["distinct"])
+        return sketch
+
+    def entropy(self, total: int) -> float:
+        """Estimate entropy in bits for a stream of `total` values."""
+        if total <= 0:
+            raise ValueError("entropy() requires a positive total")
+        ent = 0.0
+        tracked = 0
+        for c in self.heavy.counts.values():
+            p = c / total
+            ent -= p * math.log(p, 2)
+            tracked += c
+        rest = total - tracked
+        if rest > 0:
+            others = max(self.distinct.estimate() - len(self.heavy.counts), 1.0)
+            p_rest = rest / total
+            ent -= p_rest * math.log(p_rest / others, 2)
+        return ent
@@ -71,8 +71,19 @@ def entropy(values: Iterable[str]) -> float:
         total += 1
     if total == 0:
         raise ValueError("entropy() requires at least one value")
+    return entropy_from_counts(counts.values(), total)
+
+
+def entropy_from_counts(counts: Iterable[int], total: int) -> float:
+    """Compute Shannon entropy in bits from precomputed value counts.
+
+    Counts are consumed in the order given, so callers that preserve
+    first-seen order reproduce `entropy()` exactly.
+    """
+    if total <= 0:
+        raise ValueError("entropy_from_counts() requires a positive total")
     ent = 0.0
-    for c in counts.values():
+    for c in counts:
         p = c / total
         ent -= p * math.log(p, 2)
     return ent